@@ -1,18 +1,61 @@
 """Main CLI entry point for Docker Monitor."""
 
 import sys
-import argparse
-from typing import Optional
+import functools
+from types import SimpleNamespace
+from typing import Optional, TYPE_CHECKING
 
-from ..core.docker_monitor import DockerMonitor
-from ..utils.config import Config
 from ..utils.logging_config import get_logger
 
+if TYPE_CHECKING:
+    import argparse
+    from ..core.docker_monitor import DockerMonitor
+
 logger = get_logger(__name__)
 
+# Execution modes; exactly one must be given
+MODE_OPTIONS = (
+    'once', 'scheduled', 'continuous', 'realtime',
+    'test', 'status', 'test_notification', 'test_restart'
+)
+
+# Options that take no value, mapped to their destination
+_FLAG_OPTIONS = {
+    '--once': 'once',
+    '--scheduled': 'scheduled',
+    '--test': 'test',
+    '--status': 'status',
+    '--test-notification': 'test_notification',
+    '--test-restart': 'test_restart',
+    '--no-notifications': 'no_notifications',
+    '--include-stopped': 'include_stopped',
+    '--exclude-stopped': 'exclude_stopped',
+    '-v': 'verbose',
+    '--verbose': 'verbose',
+}
+
+# Options that require a value, mapped to (destination, converter)
+_VALUE_OPTIONS = {
+    '--continuous': ('continuous', int),
+    '--config': ('config', str),
+    '--log-level': ('log_level', str),
+    '--filter': ('filter', str),
+}
+
+LOG_LEVEL_CHOICES = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+REALTIME_DEFAULT_INTERVAL = 10
 
-def create_argument_parser() -> argparse.ArgumentParser:
-    """Create and configure argument parser."""
+
+@functools.lru_cache(maxsize=1)
+def create_argument_parser() -> 'argparse.ArgumentParser':
+    """
+    Create and configure argument parser.
+    
+    The parser is built once per process and reused; ``parse_args`` does not
+    mutate it, so callers must not add arguments to the returned instance.
+    """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Docker Container Monitoring with Slack Integration",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -51,7 +94,7 @@ def create_argument_parser() -> argparse.ArgumentParser:
         type=int,
         metavar='SECONDS',
         nargs='?',
-        const=10,
+        const=REALTIME_DEFAULT_INTERVAL,
         help='Run real-time monitoring with specified interval in seconds (default: 10)'
     )
     mode_group.add_argument(
@@ -84,7 +127,7 @@ def create_argument_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         '--log-level',
-        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+        choices=LOG_LEVEL_CHOICES,
         help='Set logging level (overrides config)'
     )
     parser.add_argument(
@@ -120,70 +163,195 @@ def create_argument_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def handle_test_mode(monitor: DockerMonitor) -> int:
-    """Handle test mode execution."""
-    print("🧪 Testing Docker Monitor connections...\n")
+def _default_args() -> SimpleNamespace:
+    """Return the argument namespace with every option at its default."""
+    return SimpleNamespace(
+        once=False,
+        scheduled=False,
+        continuous=None,
+        realtime=None,
+        test=False,
+        status=False,
+        test_notification=False,
+        test_restart=False,
+        config=None,
+        log_level=None,
+        no_notifications=False,
+        include_stopped=True,
+        exclude_stopped=False,
+        filter=None,
+        verbose=False
+    )
+
+
+def _parse_fast(argv: list) -> Optional[SimpleNamespace]:
+    """
+    Parse well-formed command lines without building the argparse parser.
+    
+    Args:
+        argv: Command line arguments
+        
+    Returns:
+        Parsed arguments, or None if the command line needs the full parser
+        (help, abbreviations, malformed values, missing or conflicting modes)
+    """
+    args = _default_args()
+    modes = set()
+    i = 0
+    
+    while i < len(argv):
+        token = argv[i]
+        i += 1
+        option, has_inline, inline_value = token.partition('=')
+        
+        if token in _FLAG_OPTIONS:
+            dest = _FLAG_OPTIONS[token]
+            setattr(args, dest, True)
+            if dest in MODE_OPTIONS:
+                modes.add(dest)
+        
+        elif option == '--realtime':
+            value = inline_value if has_inline else None
+            if not has_inline and i < len(argv) and not argv[i].startswith('-'):
+                value = argv[i]
+                i += 1
+            if value is None:
+                args.realtime = REALTIME_DEFAULT_INTERVAL
+            elif value.isascii() and value.isdigit():
+                args.realtime = int(value)
+            else:
+                return None
+            modes.add('realtime')
+        
+        elif option in _VALUE_OPTIONS:
+            dest, convert = _VALUE_OPTIONS[option]
+            if has_inline:
+                value = inline_value
+            elif i < len(argv) and not argv[i].startswith('-'):
+                value = argv[i]
+                i += 1
+            else:
+                return None
+            
+            # isdigit() alone also accepts e.g. superscripts, which int() rejects
+            if convert is int and not (value.isascii() and value.isdigit()):
+                return None
+            if dest == 'log_level' and value not in LOG_LEVEL_CHOICES:
+                return None
+            
+            setattr(args, dest, convert(value))
+            if dest in MODE_OPTIONS:
+                modes.add(dest)
+        
+        else:
+            return None
+    
+    if len(modes) != 1:
+        return None
+    
+    return args
+
+
+def parse_args(argv: Optional[list] = None):
+    """
+    Parse command line arguments.
     
+    Common invocations are handled by a small table-driven scanner so that
+    startup does not pay for importing argparse and building the parser.
+    Anything the scanner does not recognise falls through to argparse,
+    which keeps help output and usage errors unchanged.
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+        
+    Returns:
+        Namespace with the parsed arguments
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    args = _parse_fast(argv)
+    if args is None:
+        args = create_argument_parser().parse_args(argv)
+    
+    return args
+
+
+def _write_lines(lines: list) -> None:
+    """Write report lines to stdout with a single write and flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def handle_test_mode(monitor: 'DockerMonitor') -> int:
+    """Handle test mode execution."""
+    # Shown before the probes, which can take until the webhook timeout
+    _write_lines(["🧪 Testing Docker Monitor connections...\n"])
     results = monitor.test_connections()
     
-    print("Connection Test Results:")
-    print("=" * 50)
+    lines = [
+        "Connection Test Results:",
+        "=" * 50
+    ]
     
     for service, success in results.items():
         status = "✅ SUCCESS" if success else "❌ FAILED"
-        print(f"{service.title():<15} {status}")
+        lines.append(f"{service.title():<15} {status}")
     
     all_success = all(results.values())
     
     if all_success:
-        print("\n🎉 All connections successful!")
-        return 0
+        lines.append("\n🎉 All connections successful!")
     else:
-        print("\n⚠️  Some connections failed. Check configuration and logs.")
-        return 1
+        lines.append("\n⚠️  Some connections failed. Check configuration and logs.")
+    
+    _write_lines(lines)
+    return 0 if all_success else 1
 
 
-def handle_status_mode(monitor: DockerMonitor) -> int:
+def handle_status_mode(monitor: 'DockerMonitor') -> int:
     """Handle status summary mode."""
-    print("📊 Docker Monitor Status Summary\n")
-    
     status = monitor.get_status_summary()
     
+    lines = ["📊 Docker Monitor Status Summary\n"]
+    
     if 'error' in status:
-        print(f"❌ Error getting status: {status['error']}")
+        lines.append(f"❌ Error getting status: {status['error']}")
+        _write_lines(lines)
         return 1
     
-    print("System Information:")
-    print("=" * 50)
+    lines.append("System Information:")
+    lines.append("=" * 50)
     
     # System info
     system_info = status.get('system_info', {})
-    print(f"Docker Version:     {system_info.get('server_version', 'unknown')}")
-    print(f"Operating System:   {system_info.get('operating_system', 'unknown')}")
-    print(f"Architecture:       {system_info.get('architecture', 'unknown')}")
-    print(f"CPUs:              {system_info.get('cpus', 'unknown')}")
+    lines.append(f"Docker Version:     {system_info.get('server_version', 'unknown')}")
+    lines.append(f"Operating System:   {system_info.get('operating_system', 'unknown')}")
+    lines.append(f"Architecture:       {system_info.get('architecture', 'unknown')}")
+    lines.append(f"CPUs:              {system_info.get('cpus', 'unknown')}")
     
     # Container summary
-    print(f"\nContainer Summary:")
-    print("=" * 50)
-    print(f"Total Containers:   {status.get('total_containers', 0)}")
+    lines.append("\nContainer Summary:")
+    lines.append("=" * 50)
+    lines.append(f"Total Containers:   {status.get('total_containers', 0)}")
     
     status_counts = status.get('status_counts', {})
     for container_status, count in status_counts.items():
-        print(f"{container_status.title():<15} {count}")
+        lines.append(f"{container_status.title():<15} {count}")
     
     # Connection status
-    print(f"\nConnections:")
-    print("=" * 50)
+    lines.append("\nConnections:")
+    lines.append("=" * 50)
     connections = status.get('connections', {})
     for service, success in connections.items():
         status_text = "✅ Connected" if success else "❌ Disconnected"
-        print(f"{service.title():<15} {status_text}")
+        lines.append(f"{service.title():<15} {status_text}")
     
+    _write_lines(lines)
     return 0
 
 
-def handle_test_notification_mode(monitor: DockerMonitor) -> int:
+def handle_test_notification_mode(monitor: 'DockerMonitor') -> int:
     """Handle test notification mode."""
     print("📤 Sending test notification to Slack...")
     
@@ -207,33 +375,39 @@ def main(argv: Optional[list] = None) -> int:
     Returns:
         Exit code (0 for success, non-zero for error)
     """
-    parser = create_argument_parser()
-    args = parser.parse_args(argv)
+    args = parse_args(argv)
+    
+    if args.filter:
+        # Fail fast on a bad pattern instead of at the first poll
+        import re
+        try:
+            re.compile(args.filter)
+        except re.error as e:
+            print(f"❌ Bad --filter regex: {e}")
+            return 2
     
     try:
-        # Create configuration
-        config = Config(env_file=args.config)
+        # Deferred so that help and usage errors never load the Docker SDK
+        from ..core.docker_monitor import DockerMonitor
+        from ..utils.config import Config
         
-        # Override configuration with command line arguments
+        # Collect command line overrides so configuration is loaded once
+        overrides = {}
         if args.log_level:
-            import os
-            os.environ['LOG_LEVEL'] = args.log_level
-            config = Config(env_file=args.config)  # Recreate to pick up changes
-        
+            overrides['LOG_LEVEL'] = args.log_level
         if args.no_notifications:
-            import os
-            os.environ['NOTIFICATION_ENABLED'] = 'false'
-            config = Config(env_file=args.config)
-        
+            overrides['NOTIFICATION_ENABLED'] = 'false'
         if args.exclude_stopped:
-            import os
-            os.environ['INCLUDE_STOPPED_CONTAINERS'] = 'false'
-            config = Config(env_file=args.config)
-        
+            overrides['INCLUDE_STOPPED_CONTAINERS'] = 'false'
         if args.filter:
+            overrides['CONTAINER_NAME_FILTER'] = args.filter
+        
+        if overrides:
             import os
-            os.environ['CONTAINER_NAME_FILTER'] = args.filter
-            config = Config(env_file=args.config)
+            os.environ.update(overrides)
+        
+        # Create configuration
+        config = Config(env_file=args.config)
         
         # Initialize monitor
         monitor = DockerMonitor(config)
@@ -282,7 +456,7 @@ def main(argv: Optional[list] = None) -> int:
             return 0 if success else 1
         
         else:
-            parser.print_help()
+            create_argument_parser().print_help()
             return 1
     
     except KeyboardInterrupt:
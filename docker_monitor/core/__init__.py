@@ -1,17 +1,24 @@
 """Core monitoring components."""
 
-from .realtime_monitor import RealTimeMonitor
-from .state_tracker import StateTracker
-from .change_detector import ChangeDetector
-from .notification_manager import NotificationManager
-from .notification_formatter import NotificationFormatter
-from .cooldown_manager import CooldownManager
-from .monitoring_thread import MonitoringThread
-from .docker_client import DockerClient
-from .docker_monitor import DockerMonitor
-
-# Backward compatibility alias
-Monitor = DockerMonitor
+import importlib
+
+# Public names mapped to the submodule that defines them. Submodules are
+# imported on first attribute access (PEP 562) so that using one component
+# does not pull in the Docker SDK and Slack client for all the others.
+_LAZY_IMPORTS = {
+    'RealTimeMonitor': '.realtime_monitor',
+    'StateTracker': '.state_tracker',
+    'ChangeDetector': '.change_detector',
+    'NotificationManager': '.notification_manager',
+    'NotificationFormatter': '.notification_formatter',
+    'CooldownManager': '.cooldown_manager',
+    'MonitoringThread': '.monitoring_thread',
+    'EventWatcher': '.event_watcher',
+    'DockerClient': '.docker_client',
+    'DockerMonitor': '.docker_monitor',
+    # Backward compatibility alias
+    'Monitor': '.docker_monitor',
+}
 
 __all__ = [
     'RealTimeMonitor',
@@ -21,7 +28,24 @@ __all__ = [
     'NotificationFormatter',
     'CooldownManager',
     'MonitoringThread',
+    'EventWatcher',
     'DockerClient',
     'DockerMonitor',
     'Monitor'  # Backward compatibility
 ]
+
+
+def __getattr__(name):
+    """Import public components on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported components in dir()."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,13 +1,66 @@
 """Container change detection and classification."""
 
-from typing import Dict, List, Any
+import logging
+from typing import AbstractSet, Dict, List, Any, Mapping, Optional
 from datetime import datetime
 
 from .state_tracker import StateTracker
+from .changes import Change
 from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Statuses that count as stopped when a running container enters them
+STOPPED_STATUSES = frozenset({'stopped', 'exited', 'dead'})
+
+# Statuses from which entering 'running' counts as a start
+STARTABLE_STATUSES = frozenset({'stopped', 'exited', 'created', 'paused'})
+
+# Statuses after which a changed start time counts as a manual restart
+RESTARTABLE_STATUSES = frozenset({'stopped', 'exited', 'created', 'restarting'})
+
+# Shared empty default for container info lookups; never mutate
+EMPTY_DICT: Dict[str, Any] = {}
+
+# (previous_status, current_status) -> change type; other transitions are 'state_change'
+_TRANSITION_TYPES = {
+    **{('running', status): 'container_stopped' for status in STOPPED_STATUSES},
+    **{(status, 'running'): 'container_started' for status in STARTABLE_STATUSES},
+}
+
+
+def _make_change(change_type: str, container_name: str, container_info: Optional[Dict[str, Any]],
+                 timestamp: datetime, **fields: Any) -> Change:
+    """
+    Build a change dictionary with the fields shared by every change type.
+    
+    The name used in logs and alerts is resolved once here and stored as
+    ``display_name``.
+    
+    Args:
+        change_type: Change type (e.g. 'container_stopped')
+        container_name: Container name
+        container_info: Container information, or None if unavailable
+        timestamp: Time the change was detected
+        **fields: Type-specific fields
+        
+    Returns:
+        Change dictionary
+    """
+    container_id = container_info.get('id', '') if container_info else ''
+    change: Change = {
+        'type': change_type,
+        'container_id': container_id,
+        'container_name': container_name,
+        'display_name': (container_name or (container_info or EMPTY_DICT).get('name')
+                         or container_id[:12] or 'unknown'),
+    }
+    if container_info is not None:
+        change['container_info'] = container_info
+    change.update(fields)
+    change['timestamp'] = timestamp
+    return change
+
 
 class ChangeDetector:
     """Analyzes state differences and classifies changes."""
@@ -21,7 +74,7 @@ class ChangeDetector:
         """
         self.state_tracker = state_tracker
     
-    def detect_changes(self, current_states: Dict[str, str], previous_states: Dict[str, str]) -> List[Dict[str, Any]]:
+    def detect_changes(self, current_states: Dict[str, str], previous_states: Mapping[str, str]) -> List[Change]:
         """
         Detect significant state changes.
         
@@ -34,229 +87,214 @@ class ChangeDetector:
         """
         changes = []
         
+        # All changes found in one pass share a single timestamp
+        now = datetime.now()
+        
+        # Fast path for a quiet host: with identical states the only possible
+        # change is an automatic restart (restart count moved while the status
+        # stayed the same). Manual restarts need a status transition.
+        info_map = self.state_tracker.container_info_map
+        if current_states == previous_states:
+            for container_name in self.state_tracker.get_restarted_containers(current_states):
+                current_status = current_states[container_name]
+                restart_change = self._detect_restart(
+                    container_name, info_map.get(container_name, EMPTY_DICT), current_status, current_status, now
+                )
+                if restart_change:
+                    changes.append(restart_change)
+            return changes
+        
+        # Split container names into added, removed and still-present sets
+        current_names = current_states.keys()
+        previous_names = previous_states.keys()
+        added_names = current_names - previous_names
+        removed_names = previous_names - current_names
+        common_names = current_names & previous_names
+        
+        # As in the fast path, a container whose status is unchanged can only
+        # have restarted automatically, so only containers with a new status
+        # or a grown restart count need a closer look
+        candidate_names = {
+            container_name for container_name in common_names
+            if current_states[container_name] != previous_states[container_name]
+        }
+        candidate_names.update(self.state_tracker.get_restarted_containers(common_names))
+        
+        # Bind per-iteration lookups to locals for the hot loop
+        get_info = info_map.get
+        detect_restart = self._detect_restart
+        append = changes.append
+        
         # Check for state changes in existing containers
-        for container_name, current_status in current_states.items():
-            previous_status = previous_states.get(container_name)
-            container_info = self.state_tracker.get_container_info(container_name)
+        for container_name in candidate_names:
+            current_status = current_states[container_name]
+            previous_status = previous_states[container_name]
+            container_info = get_info(container_name, EMPTY_DICT)
             
-            # Check for restart count changes first (automatic restarts)
-            restart_changes = self._detect_restart_count_changes(container_name, container_info, current_status)
-            changes.extend(restart_changes)
-            
-            # Check for manual restarts (started time changes)
-            if previous_status:  # Only check if previous_status is not None
-                manual_restart_changes = self._detect_manual_restarts(container_name, container_info, current_status, previous_status)
-                changes.extend(manual_restart_changes)
+            # Check for automatic or manual restarts first
+            restart_change = detect_restart(container_name, container_info, current_status, previous_status, now)
+            if restart_change:
+                append(restart_change)
             
             # Only process state changes if no restart was detected
-            if not restart_changes and not manual_restart_changes and previous_status and previous_status != current_status:
-                logger.debug(f"Container {container_name}: {previous_status} → {current_status}")
+            elif previous_status != current_status:
+                logger.debug("Container %s: %s → %s", container_name, previous_status, current_status)
                 
-                # Check for container stop events
-                if previous_status == 'running' and current_status in ['stopped', 'exited', 'dead']:
+                # Classify the transition with a single table lookup
+                change_type = _TRANSITION_TYPES.get((previous_status, current_status), 'state_change')
+                if change_type == 'container_stopped':
                     logger.info(f"🛑 STOP EVENT DETECTED: {container_name} ({previous_status} → {current_status})")
-                    change = {
-                        'type': 'container_stopped',
-                        'container_id': container_info.get('id', ''),
-                        'container_name': container_name,
-                        'container_info': container_info,
-                        'previous_status': previous_status,
-                        'current_status': current_status,
-                        'timestamp': datetime.now()
-                    }
-                    changes.append(change)
-                # Check for container start events specifically
-                elif previous_status in ['stopped', 'exited', 'created', 'paused'] and current_status == 'running':
+                elif change_type == 'container_started':
                     logger.info(f"✅ START EVENT DETECTED: {container_name} ({previous_status} → {current_status})")
-                    change = {
-                        'type': 'container_started',
-                        'container_id': container_info.get('id', ''),
-                        'container_name': container_name,
-                        'container_info': container_info,
-                        'previous_status': previous_status,
-                        'current_status': current_status,
-                        'timestamp': datetime.now()
-                    }
-                    changes.append(change)
                 else:
-                    # Regular state change for other transitions
-                    logger.debug(f"Generic state change: {container_name} ({previous_status} → {current_status})")
-                    change = {
-                        'type': 'state_change',
-                        'container_id': container_info.get('id', ''),
-                        'container_name': container_name,
-                        'container_info': container_info,
-                        'previous_status': previous_status,
-                        'current_status': current_status,
-                        'timestamp': datetime.now()
-                    }
-                    changes.append(change)
+                    logger.debug("Generic state change: %s (%s → %s)", container_name, previous_status, current_status)
+                
+                append(_make_change(
+                    change_type, container_name, container_info, now,
+                    previous_status=previous_status,
+                    current_status=current_status
+                ))
         
         # Check for new containers
-        new_container_changes = self._detect_new_containers(current_states, previous_states)
+        new_container_changes = self._detect_new_containers(added_names, current_states, now)
         changes.extend(new_container_changes)
         
         # Check for removed containers
-        removed_container_changes = self._detect_removed_containers(current_states, previous_states)
+        removed_container_changes = self._detect_removed_containers(removed_names, previous_states, now)
         changes.extend(removed_container_changes)
         
         return changes
     
-    def _detect_restart_count_changes(self, container_name: str, container_info: Dict[str, Any], current_status: str) -> List[Dict[str, Any]]:
+    def _detect_restart(self, container_name: str, container_info: Dict[str, Any], current_status: str,
+                        previous_status: str, now: datetime) -> Optional[Change]:
         """
-        Detect automatic restarts based on restart count changes.
+        Detect a container restart and update restart tracking.
+        
+        Automatic restarts are recognised by a growing restart count, manual
+        restarts by a changed start time after a stopped-like status. An
+        automatic restart also changes the start time, so at most one restart
+        change is reported per container and both trackers are updated together.
         
         Args:
             container_name: Container name
             container_info: Container information
             current_status: Current container status
+            previous_status: Previous container status
+            now: Timestamp for detected changes
             
         Returns:
-            List of restart changes detected
+            Restart change, or None if the container did not restart
         """
-        changes = []
+        change = None
         
         current_restart_count = container_info.get('restart_count', 0)
-        previous_restart_count = self.state_tracker.get_previous_restart_count(container_name)
+        previous_restart_count = self.state_tracker.restart_counts.get(container_name, 0)
+        current_started_time = container_info.get('started', '')
+        previous_started_time = self.state_tracker.started_times.get(container_name, '')
         
-        # Debug logging for restart count tracking
-        logger.debug(f"Restart count check for {container_name}: current={current_restart_count}, previous={previous_restart_count}")
+        # Debug logging for restart tracking (runs for every container on every poll)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Restart check for %s: restart_count current=%s previous=%s, status current=%s previous=%s",
+                         container_name, current_restart_count, previous_restart_count,
+                         current_status, previous_status)
+            logger.debug("  Started times - current=%s, previous=%s",
+                         current_started_time, previous_started_time)
         
         if current_restart_count > previous_restart_count:
             logger.info(f"🔄 AUTO-RESTART DETECTED: {container_name} (restart count: {previous_restart_count} → {current_restart_count})")
-            change = {
-                'type': 'container_restarted',
-                'container_id': container_info.get('id', ''),
-                'container_name': container_name,
-                'container_info': container_info,
-                'previous_restart_count': previous_restart_count,
-                'current_restart_count': current_restart_count,
-                'current_status': current_status,
-                'restart_type': 'automatic',
-                'timestamp': datetime.now()
-            }
-            changes.append(change)
+            change = _make_change(
+                'container_restarted', container_name, container_info, now,
+                previous_restart_count=previous_restart_count,
+                current_restart_count=current_restart_count,
+                current_status=current_status,
+                restart_type='automatic'
+            )
             
             # Update restart count tracking
             self.state_tracker.update_restart_count(container_name, current_restart_count)
         
-        return changes
-    
-    def _detect_manual_restarts(self, container_name: str, container_info: Dict[str, Any], 
-                               current_status: str, previous_status: str) -> List[Dict[str, Any]]:
-        """
-        Detect manual restarts based on started time changes.
-        
-        Args:
-            container_name: Container name
-            container_info: Container information
-            current_status: Current container status
-            previous_status: Previous container status
-            
-        Returns:
-            List of manual restart changes detected
-        """
-        changes = []
-        
-        current_started_time = container_info.get('started', '')
-        previous_started_time = self.state_tracker.get_previous_started_time(container_name)
-        
-        # Debug logging for manual restart tracking
-        logger.debug(f"Manual restart check for {container_name}: current_status={current_status}, previous_status={previous_status}")
-        logger.debug(f"  Started times - current={current_started_time}, previous={previous_started_time}")
-        
-        # Detect restart if:
+        # Detect a manual restart if:
         # 1. Container is currently running
         # 2. We have a previous started time recorded
         # 3. The started time has changed (indicating a restart)
         # 4. The previous status was stopped/exited (indicating it went through a restart cycle)
-        if (current_status == 'running' and 
-            previous_started_time and 
-            current_started_time != previous_started_time and
-            previous_status in ['stopped', 'exited', 'created', 'restarting']):
+        elif (current_status == 'running' and
+              previous_started_time and
+              current_started_time != previous_started_time and
+              previous_status in RESTARTABLE_STATUSES):
             
             logger.info(f"🔄 RESTART DETECTED: {container_name} (started time changed from restart)")
-            change = {
-                'type': 'container_restarted',
-                'container_id': container_info.get('id', ''),
-                'container_name': container_name,
-                'container_info': container_info,
-                'previous_started_time': previous_started_time,
-                'current_started_time': current_started_time,
-                'current_status': current_status,
-                'restart_type': 'manual',
-                'timestamp': datetime.now()
-            }
-            changes.append(change)
+            change = _make_change(
+                'container_restarted', container_name, container_info, now,
+                previous_started_time=previous_started_time,
+                current_started_time=current_started_time,
+                current_status=current_status,
+                restart_type='manual'
+            )
         
         # Update started time tracking
         if current_started_time:
             self.state_tracker.update_started_time(container_name, current_started_time)
         
-        return changes
+        return change
     
-    def _detect_new_containers(self, current_states: Dict[str, str], previous_states: Dict[str, str]) -> List[Dict[str, Any]]:
+    def _detect_new_containers(self, added_names: AbstractSet[str], current_states: Dict[str, str],
+                               now: datetime) -> List[Change]:
         """
         Detect new containers.
         
         Args:
+            added_names: Names present now but not in the previous states
             current_states: Current container states
-            previous_states: Previous container states
+            now: Timestamp for detected changes
             
         Returns:
             List of new container changes
         """
         changes = []
         
-        for container_name in current_states:
-            if container_name not in previous_states:
-                container_info = self.state_tracker.get_container_info(container_name)
-                change = {
-                    'type': 'container_added',
-                    'container_id': container_info.get('id', ''),
-                    'container_name': container_name,
-                    'container_info': container_info,
-                    'current_status': current_states[container_name],
-                    'timestamp': datetime.now()
-                }
-                changes.append(change)
-                
-                # Initialize restart count tracking for new containers
-                restart_count = container_info.get('restart_count', 0)
-                self.state_tracker.update_restart_count(container_name, restart_count)
-                
-                # Initialize started time tracking for new containers
-                started_time = container_info.get('started', '')
-                if started_time:
-                    self.state_tracker.update_started_time(container_name, started_time)
+        info_map = self.state_tracker.container_info_map
+        for container_name in added_names:
+            container_info = info_map.get(container_name, EMPTY_DICT)
+            changes.append(_make_change(
+                'container_added', container_name, container_info, now,
+                current_status=current_states[container_name]
+            ))
+            
+            # Initialize restart count tracking for new containers
+            restart_count = container_info.get('restart_count', 0)
+            self.state_tracker.update_restart_count(container_name, restart_count)
+            
+            # Initialize started time tracking for new containers
+            started_time = container_info.get('started', '')
+            if started_time:
+                self.state_tracker.update_started_time(container_name, started_time)
         
         return changes
     
-    def _detect_removed_containers(self, current_states: Dict[str, str], previous_states: Dict[str, str]) -> List[Dict[str, Any]]:
+    def _detect_removed_containers(self, removed_names: AbstractSet[str], previous_states: Mapping[str, str],
+                                   now: datetime) -> List[Change]:
         """
         Detect removed containers.
         
         Args:
-            current_states: Current container states
+            removed_names: Names present previously but not any more
             previous_states: Previous container states
+            now: Timestamp for detected changes
             
         Returns:
             List of removed container changes
         """
         changes = []
         
-        for container_name in previous_states:
-            if container_name not in current_states:
-                change = {
-                    'type': 'container_removed',
-                    'container_id': '',  # ID not available for removed containers
-                    'container_name': container_name,
-                    'previous_status': previous_states[container_name],
-                    'timestamp': datetime.now()
-                }
-                changes.append(change)
-                
-                # Clean up tracking for removed containers
-                self.state_tracker.remove_container_tracking(container_name)
+        for container_name in removed_names:
+            # ID and info are not available for removed containers
+            changes.append(_make_change(
+                'container_removed', container_name, None, now,
+                previous_status=previous_states[container_name]
+            ))
+            
+            # Clean up tracking for removed containers
+            self.state_tracker.remove_container_tracking(container_name)
         
         return changes 
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""Typed layout of the change records passed between monitoring components."""
+
+from datetime import datetime
+from typing import Any, Dict, TypedDict
+
+
+class _ChangeBase(TypedDict):
+    """Keys present in every change."""
+    
+    # e.g. 'container_stopped', 'container_restarted', 'state_change'
+    type: str
+    container_id: str
+    container_name: str
+    # Name for logs and alerts, resolved once by ChangeDetector
+    display_name: str
+    # Shared by all changes of one detection pass
+    timestamp: datetime
+
+
+class Change(_ChangeBase, total=False):
+    """
+    A detected container change.
+    
+    Changes stay plain dicts at runtime: the formatter fills its templates
+    with ``format_map(change)`` and coalescing copies them with an extra
+    ``count``. This type only documents and checks their keys.
+    """
+    
+    # Absent for removed containers
+    container_info: Dict[str, Any]
+    previous_status: str
+    current_status: str
+    # Restart changes: 'automatic' or 'manual'
+    restart_type: str
+    previous_restart_count: int
+    current_restart_count: int
+    previous_started_time: str
+    current_started_time: str
+    # Number of coalesced changes this one stands for
+    count: int
+    # Seconds a burst summary covers
+    burst_window: float
@@ -1,58 +1,104 @@
 """Notification cooldown management."""
 
+import logging
+import os
 import threading
-from typing import Dict
-from datetime import datetime
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
 
 from ..utils.logging_config import get_logger
+from ..utils.serialization import json_dumps, json_loads
 
 logger = get_logger(__name__)
 
+# Number of lock/dict shards; must be a power of two for the bit mask
+_SHARD_COUNT = 16
+_SHARD_MASK = _SHARD_COUNT - 1
+
+# Seconds changes are collected before the state file is rewritten
+SAVE_DELAY = 2.0
+
 
 class CooldownManager:
     """Handles notification timing logic to prevent spam."""
     
-    def __init__(self, cooldown_seconds: int = 120):
+    def __init__(self, cooldown_seconds: int = 120, prune_every: int = 256,
+                 state_path: Optional[Union[str, Path]] = None):
         """
         Initialize cooldown manager.
         
         Args:
             cooldown_seconds: Cooldown period in seconds (default: 120)
+            prune_every: Drop expired entries after this many updates (default: 256)
+            state_path: Optional JSON file that keeps active cooldowns across
+                restarts; loaded here and rewritten shortly after changes
         """
         self.cooldown_seconds = cooldown_seconds
-        self._lock = threading.Lock()
-        self._last_notifications: Dict[str, datetime] = {}
+        self.prune_every = prune_every
+        # Entries are sharded by container ID so that unrelated containers
+        # never contend for the same lock. Values are the monotonic clock
+        # readings at which each cooldown ends, so checks are one compare
+        # and immune to wall-clock adjustments.
+        self._locks = [threading.Lock() for _ in range(_SHARD_COUNT)]
+        self._shards: List[Dict[str, float]] = [{} for _ in range(_SHARD_COUNT)]
+        self._write_count = 0
+        
+        self.state_path = Path(state_path) if state_path is not None else None
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        if self.state_path is not None:
+            self.load()
+    
+    @staticmethod
+    def _shard(container_id: str) -> int:
+        """Return the shard index for a container ID."""
+        return hash(container_id) & _SHARD_MASK
     
     def is_in_cooldown(self, container_id: str) -> bool:
         """
         Check if container is in notification cooldown period (thread-safe).
         
+        Reads without taking the lock: a single dict lookup is atomic under
+        the GIL, and writers only ever replace whole float values.
+        
         Args:
             container_id: Container ID to check
             
         Returns:
             True if container is in cooldown, False otherwise
         """
-        with self._lock:
-            last_notification = self._last_notifications.get(container_id)
-            if last_notification:
-                time_since_last = datetime.now() - last_notification
-                cooldown_remaining = self.cooldown_seconds - time_since_last.total_seconds()
-                if cooldown_remaining > 0:
-                    logger.debug(f"Container {container_id[:12]} in cooldown: {cooldown_remaining:.1f}s remaining")
-                    return True
+        deadline = self._shards[self._shard(container_id)].get(container_id)
+        if deadline is None:
             return False
+        
+        now = time.monotonic()
+        if now < deadline:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Container %s in cooldown: %.1fs remaining", container_id[:12], deadline - now)
+            return True
+        return False
     
     def update_cooldown(self, container_id: str) -> None:
         """
-        Update cooldown timestamp for a container (thread-safe).
+        Start the cooldown period for a container (thread-safe).
         
         Args:
             container_id: Container ID to update
         """
-        with self._lock:
-            self._last_notifications[container_id] = datetime.now()
-            logger.debug(f"Updated cooldown for {container_id[:12]} until {(datetime.now().timestamp() + self.cooldown_seconds)}")
+        index = self._shard(container_id)
+        with self._locks[index]:
+            self._shards[index][container_id] = time.monotonic() + self.cooldown_seconds
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Updated cooldown for %s (%ss)", container_id[:12], self.cooldown_seconds)
+            # Approximate across shards; it only paces pruning
+            self._write_count += 1
+            write_count = self._write_count
+        
+        # Expired entries are otherwise only dropped on explicit clear
+        if write_count % self.prune_every == 0:
+            self.prune()
+        self._schedule_save()
     
     def get_cooldown_remaining(self, container_id: str) -> float:
         """
@@ -64,12 +110,11 @@ class CooldownManager:
         Returns:
             Remaining cooldown time in seconds, 0 if not in cooldown
         """
-        with self._lock:
-            last_notification = self._last_notifications.get(container_id)
-            if last_notification:
-                time_since_last = datetime.now() - last_notification
-                cooldown_remaining = self.cooldown_seconds - time_since_last.total_seconds()
-                return max(0, cooldown_remaining)
+        index = self._shard(container_id)
+        with self._locks[index]:
+            deadline = self._shards[index].get(container_id)
+            if deadline is not None:
+                return max(0, deadline - time.monotonic())
             return 0
     
     def clear_cooldown(self, container_id: str) -> None:
@@ -79,9 +124,14 @@ class CooldownManager:
         Args:
             container_id: Container ID to clear
         """
-        with self._lock:
-            self._last_notifications.pop(container_id, None)
-            logger.debug(f"Cleared cooldown for {container_id[:12]}")
+        index = self._shard(container_id)
+        with self._locks[index]:
+            removed = self._shards[index].pop(container_id, None) is not None
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Cleared cooldown for %s", container_id[:12])
+        
+        if removed:
+            self._schedule_save()
     
     def get_all_cooldowns(self) -> Dict[str, float]:
         """
@@ -90,14 +140,114 @@ class CooldownManager:
         Returns:
             Dictionary mapping container IDs to remaining cooldown times
         """
-        with self._lock:
-            cooldowns = {}
-            current_time = datetime.now()
-            
-            for container_id, last_notification in self._last_notifications.items():
-                time_since_last = current_time - last_notification
-                cooldown_remaining = self.cooldown_seconds - time_since_last.total_seconds()
-                if cooldown_remaining > 0:
-                    cooldowns[container_id] = cooldown_remaining
-            
-            return cooldowns 
\ No newline at end of file
+        cooldowns = {}
+        current_time = time.monotonic()
+        
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                for container_id, deadline in shard.items():
+                    cooldown_remaining = deadline - current_time
+                    if cooldown_remaining > 0:
+                        cooldowns[container_id] = cooldown_remaining
+        
+        return cooldowns
+    
+    def prune(self) -> int:
+        """
+        Remove expired cooldown entries (thread-safe).
+        
+        Returns:
+            Number of entries removed
+        """
+        now = time.monotonic()
+        removed = 0
+        
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                expired = [
+                    container_id for container_id, deadline in shard.items()
+                    if deadline <= now
+                ]
+                for container_id in expired:
+                    del shard[container_id]
+                removed += len(expired)
+        
+        if removed:
+            logger.debug("Pruned %d expired cooldown entries", removed)
+        return removed
+    
+    def load(self) -> int:
+        """
+        Restore cooldowns saved by a previous run.
+        
+        Deadlines are stored as wall-clock times, since monotonic clock
+        readings do not carry over between processes; expired entries are
+        skipped. A missing or unreadable file leaves the cooldowns empty.
+        
+        Returns:
+            Number of cooldowns restored
+        """
+        if self.state_path is None:
+            return 0
+        
+        try:
+            saved = json_loads(self.state_path.read_bytes())
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read cooldown state from {self.state_path}: {e}")
+            return 0
+        
+        wall_now = time.time()
+        monotonic_now = time.monotonic()
+        restored = 0
+        for container_id, wall_deadline in saved.items():
+            remaining = wall_deadline - wall_now
+            if remaining > 0:
+                index = self._shard(container_id)
+                with self._locks[index]:
+                    self._shards[index][container_id] = monotonic_now + remaining
+                restored += 1
+        
+        logger.info(f"Restored {restored} notification cooldowns from {self.state_path}")
+        return restored
+    
+    def save(self) -> None:
+        """
+        Write active cooldowns to the state file now.
+        
+        The file is replaced atomically, so a crash mid-write leaves the
+        previous state intact.
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        
+        if self.state_path is None:
+            return
+        
+        wall_now = time.time()
+        state = {
+            container_id: wall_now + remaining
+            for container_id, remaining in self.get_all_cooldowns().items()
+        }
+        
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.state_path.with_name(self.state_path.name + '.tmp')
+            temp_path.write_bytes(json_dumps(state))
+            os.replace(temp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"Could not save cooldown state to {self.state_path}: {e}")
+    
+    def _schedule_save(self) -> None:
+        """Save after SAVE_DELAY seconds, folding in changes made meanwhile."""
+        if self.state_path is None:
+            return
+        
+        with self._save_lock:
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_DELAY, self.save)
+                self._save_timer.daemon = True
+                self._save_timer.start()
@@ -1,36 +1,184 @@
 """Docker client for container monitoring."""
 
+import functools
 import re
 import threading
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any, Callable, Collection, Dict, FrozenSet, Iterable, Iterator, List, Optional, Pattern, Tuple,
+    TypeVar, Union
+)
 import docker
-from docker.errors import DockerException
+from docker.errors import DockerException, NotFound
+from requests.exceptions import ConnectionError as RequestsConnectionError, RequestException
 
+from ..utils.cache import CachedValue
 from ..utils.logging_config import get_logger
-from ..utils.formatters import ContainerStatsFormatter, PortFormatter
-from ..exceptions import ConnectionError
+from ..utils.formatters import ByteFormatter, ContainerStatsFormatter, PortFormatter
+# DockerClientError is re-exported for code importing it from this module
+from ..exceptions import ConnectionError, DockerClientError
 
 logger = get_logger(__name__)
 
+T = TypeVar('T')
+
+# Accepted container name filters: a regex (string or compiled), a
+# collection of exact names, or a predicate called with each container name
+NameFilter = Union[str, Pattern[str], Collection[str], Callable[[str], Any]]
+
+# Connections kept for requests other than stats (list, inspect, info, ping)
+_BASE_POOL_SIZE = 10
+
+# Seconds system information (container and image counts) is reused
+SYSTEM_INFO_TTL = 30.0
+
+# Container info keys that are not in the /containers/json payload and
+# need a per-container inspect request
+INSPECT_FIELDS = frozenset({'created', 'started', 'env', 'restart_count'})
+
+# Health suffix of the list payload's Status text, e.g. "Up 5 minutes (healthy)"
+_HEALTH_STATUS_RE = re.compile(r'\((healthy|unhealthy|health: starting)\)')
+
+# Environment variable names whose values are hidden
+_SENSITIVE_ENV_RE = re.compile(r'password|secret|key|token|api', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_sensitive_env(key: str) -> bool:
+    """
+    Check whether an environment variable name looks sensitive.
+    
+    The same names recur across containers and polls, so the
+    case-insensitive regex scan is memoized per name.
+    """
+    return _SENSITIVE_ENV_RE.search(key) is not None
+
+# Characters that give a name filter regex semantics beyond a substring match
+_REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+
+def _plain_substring(name_filter: Pattern[str]) -> Optional[str]:
+    """
+    Return the filter as a literal substring if it has no regex syntax.
+    
+    Such filters can be evaluated by dockerd through the ``name`` list filter.
+    """
+    pattern = name_filter.pattern
+    if not pattern or name_filter.flags != re.UNICODE:
+        return None
+    if _REGEX_METACHARACTERS.isdisjoint(pattern):
+        return pattern
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_name_filter(
+    name_filter: Union[str, Pattern[str], FrozenSet[str], Callable[[str], Any]]
+) -> Tuple[Callable[[str], Any], Optional[Union[str, List[str]]]]:
+    """
+    Turn a name filter into a matcher and its dockerd ``name`` filter.
+    
+    Filters recur on every poll, so the result is memoized.
+    
+    Args:
+        name_filter: Regex (string or compiled), frozenset of exact names,
+            or predicate
+        
+    Returns:
+        Tuple of (matcher called with a container name, server-side name
+        filter or None when the filter can only be applied locally)
+        
+    Raises:
+        TypeError: If the filter is of an unsupported type
+    """
+    if isinstance(name_filter, str):
+        name_filter = re.compile(name_filter)
+    if isinstance(name_filter, re.Pattern):
+        return name_filter.search, _plain_substring(name_filter)
+    if isinstance(name_filter, frozenset):
+        # dockerd matches name filters as regexes against "/<name>"
+        return name_filter.__contains__, ['^/' + re.escape(name) + '$' for name in sorted(name_filter)]
+    if callable(name_filter):
+        return name_filter, None
+    raise TypeError(f"Unsupported container name filter: {name_filter!r}")
+
+
+def needs_inspect(fields: Optional[Iterable[str]]) -> bool:
+    """
+    Check whether the requested container info keys need an inspect request.
+    
+    Args:
+        fields: Requested info keys, or None for all of them
+        
+    Returns:
+        True if at least one key is only available from an inspect
+    """
+    return fields is None or not INSPECT_FIELDS.isdisjoint(fields)
+
+
+def _container_name(container: Dict[str, Any]) -> str:
+    """
+    Get the primary name of a container from its list entry.
+    
+    ``Names`` also contains legacy link aliases such as ``/app/db``; the
+    primary name is the one without a nested path.
+    """
+    names = container.get('Names') or ()
+    for name in names:
+        name = name[1:] if name.startswith('/') else name
+        if '/' not in name:
+            return name
+    return names[0].lstrip('/') if names else container['Id'][:12]
 
-class DockerClientError(Exception):
-    """Base exception for Docker client errors."""
-    pass
 
 class DockerClient:
     """Client for interacting with Docker daemon with resource management."""
     
-    def __init__(self, socket_url: str = "unix://var/run/docker.sock"):
+    __slots__ = (
+        'socket_url', 'client', 'max_stats_workers', 'stream_stats', 'max_pool_size',
+        '_lock', '_connected', '_stats_executor', '_stats_cache', '_stats_threads',
+        '_port_cache', '_version_cache', '_info_cache'
+    )
+    
+    def __init__(
+        self,
+        socket_url: str = "unix://var/run/docker.sock",
+        max_stats_workers: int = 32,
+        stream_stats: bool = False,
+        max_pool_size: Optional[int] = None
+    ):
         """
         Initialize Docker client.
         
         Args:
             socket_url: Docker socket URL
+            max_stats_workers: Maximum number of concurrent stats and inspect
+                requests (default: 32)
+            stream_stats: Keep one streaming stats sampler per running container
+                and serve stats from its latest sample (default: False)
+            max_pool_size: Keep-alive connections kept per Docker host (default:
+                max_stats_workers plus room for the other requests)
         """
         self.socket_url = socket_url
         self.client = None
+        self.max_stats_workers = max_stats_workers
+        self.stream_stats = stream_stats
+        # Connections beyond the pool size are closed after each request, so
+        # size it for the concurrent stats requests to keep them alive
+        self.max_pool_size = max_pool_size or max_stats_workers + _BASE_POOL_SIZE
         self._lock = threading.Lock()
         self._connected = False
+        # Created on first use and reused across polls; see _executor
+        self._stats_executor: Optional[ThreadPoolExecutor] = None
+        # Latest raw stats sample per container ID, written by sampler threads
+        self._stats_cache: Dict[str, Dict[str, Any]] = {}
+        self._stats_threads: Dict[str, threading.Thread] = {}
+        # Container ID -> (raw port list, formatted ports) from the last poll
+        self._port_cache: Dict[str, Tuple[List[Dict[str, Any]], str]] = {}
+        # Daemon version only changes with a restart, which drops the
+        # connection; info carries counts that are fine to reuse briefly
+        self._version_cache = CachedValue(lambda: self.client.version())
+        self._info_cache = CachedValue(lambda: self.client.info(), ttl=SYSTEM_INFO_TTL)
         self._connect()
     
     def __enter__(self):
@@ -41,27 +189,54 @@ class DockerClient:
         """Context manager exit with cleanup."""
         self.close()
     
+    def _create_client(self) -> docker.DockerClient:
+        """
+        Create a Docker SDK client and check that the daemon answers.
+        
+        Returns:
+            Connected Docker SDK client
+            
+        Raises:
+            ConnectionError: If the daemon cannot be reached
+        """
+        try:
+            if self.socket_url == "unix://var/run/docker.sock":
+                client = docker.from_env(max_pool_size=self.max_pool_size)
+            else:
+                client = docker.DockerClient(
+                    base_url=self.socket_url,
+                    max_pool_size=self.max_pool_size
+                )
+            
+            # Test the connection
+            client.ping()
+            return client
+        except DockerException as e:
+            self._connected = False
+            logger.error(f"Failed to connect to Docker daemon: {e}")
+            raise ConnectionError(f"Failed to connect to Docker daemon: {e}") from e
+    
     def _connect(self) -> None:
         """Connect to Docker daemon with proper error handling."""
+        client = self._create_client()
         with self._lock:
-            try:
-                if self.socket_url == "unix://var/run/docker.sock":
-                    self.client = docker.from_env()
-                else:
-                    self.client = docker.DockerClient(base_url=self.socket_url)
-                
-                # Test the connection
-                self.client.ping()
-                self._connected = True
-                logger.info("Successfully connected to Docker daemon")
-            except DockerException as e:
-                self._connected = False
-                logger.error(f"Failed to connect to Docker daemon: {e}")
-                raise ConnectionError(f"Failed to connect to Docker daemon: {e}") from e
+            self.client = client
+            self._connected = True
+        logger.info("Successfully connected to Docker daemon")
     
     def close(self) -> None:
         """Close Docker client connection and cleanup resources."""
         with self._lock:
+            if self._stats_executor is not None:
+                self._stats_executor.shutdown(wait=False)
+                self._stats_executor = None
+            
+            # Samplers exit once their streams end with the connection
+            self._stats_threads.clear()
+            self._stats_cache.clear()
+            self._version_cache.invalidate()
+            self._info_cache.invalidate()
+            
             if self.client:
                 try:
                     self.client.close()
@@ -75,144 +250,417 @@ class DockerClient:
     def get_containers(
         self,
         include_stopped: bool = True,
-        name_filter: Optional[str] = None
+        name_filter: Optional[NameFilter] = None,
+        with_stats: bool = True,
+        with_env: bool = True,
+        statuses: Optional[Iterable[str]] = None,
+        fields: Optional[Iterable[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Get information about Docker containers.
         
+        All containers are listed with a single ``/containers/json`` request
+        (exact names and name regexes without regex syntax are evaluated by
+        dockerd);
+        only the fields missing from that payload (creation and start time,
+        restart count, environment) come from a per-container inspect, which
+        is skipped entirely when ``fields`` does not ask for any of them.
+        
         Args:
             include_stopped: Whether to include stopped containers
-            name_filter: Regex pattern to filter container names
+            name_filter: Container name filter: a regex (string or compiled),
+                a collection of exact names, or a predicate taking the name
+            with_stats: Fetch performance stats of running containers; when False
+                'stats' is None, which avoids the ~1s stats sampling per container
+            with_env: Include (filtered) environment variables; when False 'env'
+                is an empty dict
+            statuses: Only return containers in these states (e.g. 'running',
+                'exited'); evaluated by dockerd and takes precedence over
+                include_stopped
+            fields: Info keys the caller needs (default: all). Keys in
+                INSPECT_FIELDS are omitted unless requested
             
         Returns:
             List of container information dictionaries
             
         Raises:
-            ConnectionError: If not connected to Docker daemon
+            ConnectionError: If the Docker daemon cannot be reached
         """
-        if not self.is_connected():
-            raise ConnectionError("Not connected to Docker daemon")
-            
         try:
-            if self.client is None:
-                raise ConnectionError("Docker client is not initialized")
-                
-            containers = self.client.containers.list(all=include_stopped)
-            container_info = []
+            return self._call_with_reconnect(
+                self._list_containers, include_stopped, name_filter, with_stats, with_env, statuses, fields
+            )
+        except (DockerException, RequestException) as e:
+            logger.error(f"Error getting container information: {e}")
+            raise ConnectionError(f"Error getting container information: {e}") from e
+    
+    def _list_containers(
+        self,
+        include_stopped: bool,
+        name_filter: Optional[NameFilter],
+        with_stats: bool,
+        with_env: bool,
+        statuses: Optional[Iterable[str]],
+        fields: Optional[Iterable[str]]
+    ) -> List[Dict[str, Any]]:
+        """Collect container information; see get_containers."""
+        matcher = None
+        server_names = None
+        if name_filter:
+            if isinstance(name_filter, (set, list, tuple)):
+                name_filter = frozenset(name_filter)
+            matcher, server_names = _compile_name_filter(name_filter)
+        
+        # Let dockerd drop non-matching containers where it can: statuses
+        # always, name filters when they are exact names or plain substrings
+        filters = {}
+        if statuses is not None:
+            filters['status'] = list(statuses)
+        if server_names is not None:
+            filters['name'] = server_names
+        
+        summaries = self.client.api.containers(all=include_stopped, filters=filters or None)
+        # Apply name filter if provided; dockerd also matches link
+        # aliases, so pushed-down filters are re-checked on the name
+        if matcher is not None:
+            summaries = [s for s in summaries if matcher(_container_name(s))]
+        
+        # Get container stats for running containers
+        stats_map = {}
+        if with_stats:
+            stats_map = self._fetch_stats([s for s in summaries if s.get('State') == 'running'])
+        container_info = []
+        port_cache = self._port_cache
+        next_port_cache = {}
+        # Inspects are independent requests, so they are issued concurrently
+        inspected = self._inspect_containers([s['Id'] for s in summaries]) if needs_inspect(fields) else None
+        
+        for summary in summaries:
+            container_id = summary['Id']
+            info = {
+                'name': _container_name(summary),
+                'id': container_id[:12],
+                'full_id': container_id,
+                'status': summary.get('State', 'unknown'),
+                'image': self._get_image_name(summary),
+                'ports': self._format_ports(container_id, summary, port_cache, next_port_cache),
+                'labels': summary.get('Labels') or {},
+                'stats': stats_map.get(container_id),
+                'health_status': self._get_health_status(summary)
+            }
             
-            for container in containers:
-                # Apply name filter if provided
-                if name_filter and not re.search(name_filter, container.name):
+            if inspected is not None:
+                attrs = inspected[container_id]
+                if attrs is None:
+                    # Removed between listing and inspecting
                     continue
                 
-                # Get container stats if running
-                stats = None
-                if container.status == 'running':
-                    stats = self._get_container_stats(container)
+                # Bind the inspect data once; .get(...) or {} avoids
+                # allocating a fallback dict when the key is present
+                state = attrs.get('State') or {}
+                config = attrs.get('Config') or {}
                 
-                info = {
-                    'name': container.name,
-                    'id': container.short_id,
-                    'full_id': container.id,
-                    'status': container.status,
-                    'image': self._get_image_name(container),
-                    'created': container.attrs.get('Created', ''),
-                    'started': container.attrs.get('State', {}).get('StartedAt', ''),
-                    'ports': PortFormatter.format_ports(container.ports),
-                    'labels': container.labels,
-                    'env': self._get_environment_vars(container),
-                    'stats': stats,
-                    'restart_count': container.attrs.get('RestartCount', 0),
-                    'health_status': self._get_health_status(container)
-                }
-                container_info.append(info)
+                info['created'] = attrs.get('Created', '')
+                info['started'] = state.get('StartedAt', '')
+                info['env'] = self._get_environment_vars(config) if with_env else {}
+                info['restart_count'] = attrs.get('RestartCount', 0)
             
-            logger.info(f"Retrieved information for {len(container_info)} containers")
-            return container_info
+            container_info.append(info)
+        
+        # Only keep entries of containers seen in this poll
+        self._port_cache = next_port_cache
+        
+        logger.debug("Retrieved information for %d containers", len(container_info))
+        return container_info
+    
+    @staticmethod
+    def _format_ports(
+        container_id: str,
+        summary: Dict[str, Any],
+        port_cache: Dict[str, Tuple[List[Dict[str, Any]], str]],
+        next_port_cache: Dict[str, Tuple[List[Dict[str, Any]], str]]
+    ) -> str:
+        """
+        Format a container's ports, reusing the previous poll's string.
+        
+        Port mappings rarely change while a container exists; comparing the
+        raw lists is cheaper than formatting them again.
+        
+        Args:
+            container_id: Full container ID
+            summary: Container list entry
+            port_cache: Formatted ports from the previous poll
+            next_port_cache: Formatted ports collected for this poll
             
-        except DockerException as e:
-            logger.error(f"Error getting container information: {e}")
-            raise ConnectionError(f"Error getting container information: {e}") from e
+        Returns:
+            Formatted port string
+        """
+        ports = summary.get('Ports') or []
+        cached = port_cache.get(container_id)
+        if cached is not None and cached[0] == ports:
+            port_string = cached[1]
+        else:
+            port_string = PortFormatter.format_port_list(ports)
+        next_port_cache[container_id] = (ports, port_string)
+        return port_string
     
-    def _get_container_stats(self, container) -> Optional[Dict[str, Any]]:
+    def _inspect_container(self, container_id: str) -> Optional[Dict[str, Any]]:
         """
-        Get performance stats for a running container.
+        Inspect a single container.
         
         Args:
-            container: Docker container object
+            container_id: Full container ID
             
         Returns:
-            Dictionary with CPU and memory stats, or None if unavailable
+            Raw inspect data, or None if the container no longer exists
         """
         try:
-            stats_stream = container.stats(stream=False)
+            return self.client.api.inspect_container(container_id)
+        except NotFound:
+            return None
+    
+    def _inspect_containers(self, container_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Inspect several containers concurrently.
+        
+        Args:
+            container_ids: Full container IDs
+            
+        Returns:
+            Dictionary mapping container IDs to raw inspect data, or None for
+            containers that no longer exist
+        """
+        if len(container_ids) <= 1:
+            return {container_id: self._inspect_container(container_id) for container_id in container_ids}
+        
+        results = self._executor().map(self._inspect_container, container_ids)
+        return dict(zip(container_ids, results))
+    
+    def _executor(self) -> ThreadPoolExecutor:
+        """
+        Get the request thread pool, creating it on first use.
+        
+        The pool is shared by stats and inspect requests and kept for the
+        lifetime of the client; max_pool_size leaves a keep-alive connection
+        for every worker.
+        """
+        with self._lock:
+            if self._stats_executor is None:
+                self._stats_executor = ThreadPoolExecutor(
+                    max_workers=self.max_stats_workers,
+                    thread_name_prefix="docker-requests"
+                )
+            return self._stats_executor
+    
+    def _fetch_stats(self, containers: List[Dict[str, Any]]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get performance stats for several running containers.
+        
+        Each one-shot stats request blocks for about a second while the
+        daemon samples CPU usage, so the requests are either fanned out over
+        a thread pool kept for the lifetime of the client or, with
+        ``stream_stats``, served from long-lived streaming samplers.
+        
+        Args:
+            containers: Container list entries of running containers
             
-            cpu_percent = ContainerStatsFormatter.calculate_cpu_percentage(stats_stream)
-            memory_usage = ContainerStatsFormatter.calculate_memory_usage(stats_stream)
+        Returns:
+            Dictionary mapping container IDs to their stats (or None)
+        """
+        if self.stream_stats:
+            return self._fetch_streamed_stats(containers)
+        return self._fetch_blocking_stats(containers)
+    
+    def _fetch_blocking_stats(self, containers: List[Dict[str, Any]]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get one-shot stats for several running containers concurrently.
+        
+        Args:
+            containers: Container list entries of running containers
             
-            return {
-                'cpu_percent': cpu_percent,
-                'memory_usage': memory_usage,
-                'network': self._get_network_stats(stats_stream),
-                'block_io': self._get_block_io_stats(stats_stream)
-            }
+        Returns:
+            Dictionary mapping container IDs to their stats (or None)
+        """
+        if not containers:
+            return {}
+        if len(containers) == 1:
+            container = containers[0]
+            return {container['Id']: self._get_container_stats(container)}
+        
+        results = self._executor().map(self._get_container_stats, containers)
+        return {container['Id']: stats for container, stats in zip(containers, results)}
+    
+    def _fetch_streamed_stats(self, containers: List[Dict[str, Any]]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get performance stats from the background samplers.
+        
+        Starts a sampler for every container seen for the first time and
+        stops tracking containers that are no longer running. Containers
+        without a sample yet are fetched once in the blocking way.
+        
+        Args:
+            containers: Container list entries of running containers
+            
+        Returns:
+            Dictionary mapping container IDs to their stats (or None)
+        """
+        running_ids = {container['Id'] for container in containers}
+        
+        with self._lock:
+            for container_id in self._stats_threads.keys() - running_ids:
+                del self._stats_threads[container_id]
+                self._stats_cache.pop(container_id, None)
+            
+            for container in containers:
+                container_id = container['Id']
+                if container_id not in self._stats_threads:
+                    thread = threading.Thread(
+                        target=self._sample_stats,
+                        args=(container,),
+                        name=f"docker-stats-{container_id[:12]}",
+                        daemon=True
+                    )
+                    self._stats_threads[container_id] = thread
+                    thread.start()
+        
+        stats_map = {}
+        pending = []
+        for container in containers:
+            sample = self._stats_cache.get(container['Id'])
+            if sample is None:
+                pending.append(container)
+            else:
+                stats_map[container['Id']] = self._format_stats(sample)
+        
+        if pending:
+            stats_map.update(self._fetch_blocking_stats(pending))
+        
+        return stats_map
+    
+    def _sample_stats(self, container: Dict[str, Any]) -> None:
+        """
+        Keep the latest streamed stats sample of a container in the cache.
+        
+        Runs in a daemon thread until the stream ends (container stopped or
+        connection closed) or the container is no longer tracked.
+        
+        Args:
+            container: Container list entry
+        """
+        container_id = container['Id']
+        thread = threading.current_thread()
+        
+        try:
+            for sample in self.client.api.stats(container_id, stream=True, decode=True):
+                if self._stats_threads.get(container_id) is not thread:
+                    break
+                self._stats_cache[container_id] = sample
         except Exception as e:
-            logger.warning(f"Could not get stats for container {container.name}: {e}")
-            return None
+            logger.debug(f"Stats stream for container {_container_name(container)} ended: {e}")
+        finally:
+            with self._lock:
+                if self._stats_threads.get(container_id) is thread:
+                    del self._stats_threads[container_id]
+                    self._stats_cache.pop(container_id, None)
     
-    def _get_image_name(self, container) -> str:
-        """Get formatted image name for container."""
+    def _get_container_stats(self, container: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get performance stats for a running container.
+        
+        Args:
+            container: Container list entry
+            
+        Returns:
+            Dictionary with CPU and memory stats, or None if unavailable
+        """
         try:
-            if container.image.tags:
-                return container.image.tags[0]
-            else:
-                # Use image ID if no tags
-                return container.image.short_id
-        except Exception:
+            return self._format_stats(self._read_stats(container['Id']))
+        except Exception as e:
+            logger.warning(f"Could not get stats for container {_container_name(container)}: {e}")
+            return None
+    
+    def _read_stats(self, container_id: str) -> Dict[str, Any]:
+        """
+        Read a one-shot stats sample of a container.
+        
+        The daemon waits for a second sample so ``precpu_stats`` is filled
+        and CPU usage can be computed.
+        
+        Args:
+            container_id: Full container ID
+            
+        Returns:
+            Raw stats dictionary from the Docker API
+        """
+        return self.client.api.stats(container_id, stream=False)
+    
+    def _format_stats(self, stats_stream: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the stats summary from a raw stats sample.
+        
+        Args:
+            stats_stream: Raw stats dictionary from the Docker API
+            
+        Returns:
+            Dictionary with CPU, memory, network and block I/O stats
+        """
+        cpu_percent = ContainerStatsFormatter.calculate_cpu_percentage(stats_stream)
+        memory_usage = ContainerStatsFormatter.calculate_memory_usage(stats_stream)
+        
+        return {
+            'cpu_percent': cpu_percent,
+            'memory_usage': memory_usage,
+            'network': self._get_network_stats(stats_stream),
+            'block_io': self._get_block_io_stats(stats_stream)
+        }
+    
+    def _get_image_name(self, container: Dict[str, Any]) -> str:
+        """
+        Get formatted image name for container from its list entry.
+        
+        The list payload already carries the image reference, so no image
+        inspect request is needed. Untagged images are reported by ID,
+        shortened like the SDK's ``Image.short_id``.
+        """
+        image = container.get('Image') or container.get('ImageID')
+        if not image:
             return 'unknown'
+        if image.startswith('sha256:'):
+            return image[:17]
+        return image
     
-    def _get_environment_vars(self, container) -> Dict[str, str]:
-        """Get environment variables from container (filtered for security)."""
+    def _get_environment_vars(self, config: Dict[str, Any]) -> Dict[str, str]:
+        """Get environment variables from a container's Config section (filtered for security)."""
         try:
-            env_list = container.attrs.get('Config', {}).get('Env', [])
+            env_list = config.get('Env') or ()
             env_dict = {}
-            
-            # Filter sensitive environment variables
-            sensitive_patterns = ['password', 'secret', 'key', 'token', 'api']
+            is_sensitive = _is_sensitive_env
             
             for env_var in env_list:
-                if '=' in env_var:
-                    key, value = env_var.split('=', 1)
+                key, separator, value = env_var.partition('=')
+                if separator:
                     # Hide sensitive values
-                    if any(pattern.lower() in key.lower() for pattern in sensitive_patterns):
-                        env_dict[key] = '***'
-                    else:
-                        env_dict[key] = value
+                    env_dict[key] = '***' if is_sensitive(key) else value
             
             return env_dict
         except Exception:
             return {}
     
-    def _get_health_status(self, container) -> Optional[str]:
-        """Get health check status if available."""
-        try:
-            health = container.attrs.get('State', {}).get('Health', {})
-            return health.get('Status')
-        except Exception:
+    def _get_health_status(self, container: Dict[str, Any]) -> Optional[str]:
+        """Get health check status from a container's list entry if available."""
+        match = _HEALTH_STATUS_RE.search(container.get('Status') or '')
+        if match is None:
             return None
+        health = match.group(1)
+        return 'starting' if health == 'health: starting' else health
     
     def _get_network_stats(self, stats: Dict[str, Any]) -> Dict[str, str]:
         """Extract network statistics from container stats."""
         try:
-            networks = stats.get('networks', {})
-            total_rx = 0
-            total_tx = 0
-            
-            for network_data in networks.values():
-                total_rx += network_data.get('rx_bytes', 0)
-                total_tx += network_data.get('tx_bytes', 0)
+            networks = stats.get('networks', {}).values()
+            total_rx = sum(network_data.get('rx_bytes', 0) for network_data in networks)
+            total_tx = sum(network_data.get('tx_bytes', 0) for network_data in networks)
             
-            from ..utils.formatters import ByteFormatter
             return {
                 'rx_bytes': ByteFormatter.format_bytes(total_rx),
                 'tx_bytes': ByteFormatter.format_bytes(total_tx)
@@ -226,16 +674,15 @@ class DockerClient:
             blkio_stats = stats.get('blkio_stats', {})
             io_service_bytes = blkio_stats.get('io_service_bytes_recursive', [])
             
-            read_bytes = 0
-            write_bytes = 0
-            
+            # Accumulate per operation in one pass; other ops are ignored
+            totals = {'Read': 0, 'Write': 0}
             for entry in io_service_bytes:
-                if entry.get('op') == 'Read':
-                    read_bytes += entry.get('value', 0)
-                elif entry.get('op') == 'Write':
-                    write_bytes += entry.get('value', 0)
+                op = entry.get('op')
+                if op in totals:
+                    totals[op] += entry.get('value', 0)
+            read_bytes = totals['Read']
+            write_bytes = totals['Write']
             
-            from ..utils.formatters import ByteFormatter
             return {
                 'read_bytes': ByteFormatter.format_bytes(read_bytes),
                 'write_bytes': ByteFormatter.format_bytes(write_bytes)
@@ -247,68 +694,160 @@ class DockerClient:
         """
         Get Docker system information.
         
+        The daemon version is cached until the connection is closed and
+        ``info`` for SYSTEM_INFO_TTL seconds, so the container and image
+        counts may lag by up to that long.
+        
         Returns:
             Dictionary with system information
             
         Raises:
-            ConnectionError: If not connected to Docker daemon
+            ConnectionError: If the Docker daemon cannot be reached
         """
-        if not self.is_connected():
-            raise ConnectionError("Not connected to Docker daemon")
-            
         try:
-            if self.client is None:
-                raise ConnectionError("Docker client is not initialized")
-                
-            info = self.client.info()
-            version = self.client.version()
-            
-            return {
-                'server_version': version.get('Version', 'unknown'),
-                'api_version': version.get('ApiVersion', 'unknown'),
-                'operating_system': info.get('OperatingSystem', 'unknown'),
-                'architecture': info.get('Architecture', 'unknown'),
-                'cpus': info.get('NCPU', 'unknown'),
-                'memory_total': info.get('MemTotal', 'unknown'),
-                'containers_running': info.get('ContainersRunning', 0),
-                'containers_stopped': info.get('ContainersStopped', 0),
-                'images': info.get('Images', 0)
-            }
-        except DockerException as e:
+            return self._call_with_reconnect(self._collect_system_info)
+        except (DockerException, RequestException) as e:
             logger.error(f"Error getting system information: {e}")
             raise ConnectionError(f"Error getting system information: {e}") from e
     
+    def _collect_system_info(self) -> Dict[str, Any]:
+        """Query system information; see get_system_info."""
+        info = self._info_cache.get()
+        version = self._version_cache.get()
+        
+        return {
+            'server_version': version.get('Version', 'unknown'),
+            'api_version': version.get('ApiVersion', 'unknown'),
+            'operating_system': info.get('OperatingSystem', 'unknown'),
+            'architecture': info.get('Architecture', 'unknown'),
+            'cpus': info.get('NCPU', 'unknown'),
+            'memory_total': info.get('MemTotal', 'unknown'),
+            'containers_running': info.get('ContainersRunning', 0),
+            'containers_stopped': info.get('ContainersStopped', 0),
+            'images': info.get('Images', 0)
+        }
+    
+    def events(self, since: Optional[int] = None,
+               filters: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Open the daemon's container event stream.
+        
+        The returned stream blocks until the next event arrives; it ends when
+        the connection drops and can be cancelled from another thread with
+        its ``close()`` method.
+        
+        Args:
+            since: Replay events from this Unix timestamp, e.g. the time of the
+                last event seen before a disconnect
+            filters: Extra event filters; ``type`` is always ``container``
+            
+        Returns:
+            Iterator of decoded event dictionaries
+            
+        Raises:
+            ConnectionError: If the Docker daemon cannot be reached
+        """
+        event_filters = dict(filters or {}, type='container')
+        try:
+            return self._call_with_reconnect(self._open_events, since, event_filters)
+        except (DockerException, RequestException) as e:
+            logger.error(f"Error opening Docker event stream: {e}")
+            raise ConnectionError(f"Error opening Docker event stream: {e}") from e
+    
+    def _open_events(self, since: Optional[int], filters: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Open the event stream on the current client; see events."""
+        return self.client.events(since=since, filters=filters, decode=True)
+    
+    def _call_with_reconnect(self, operation: Callable[..., T], *args: Any) -> T:
+        """
+        Run a Docker API operation, reconnecting once if the transport fails.
+        
+        Connection problems surface from the real request rather than from
+        a ping before every call, which saves a round-trip per call. HTTP
+        errors from the daemon (docker's APIError, e.g. a 409 for a container
+        being removed) are not connection problems and propagate unchanged.
+        
+        Args:
+            operation: Callable issuing the Docker API requests
+            *args: Arguments passed to the operation
+            
+        Returns:
+            The operation's result
+            
+        Raises:
+            ConnectionError: If no client exists and reconnecting fails
+            RequestException: If the operation fails again after reconnecting,
+                or with an HTTP error from the daemon
+        """
+        if self.client is None and not self.reconnect():
+            raise ConnectionError("Not connected to Docker daemon")
+        
+        try:
+            return operation(*args)
+        except RequestsConnectionError as e:
+            self._connected = False
+            logger.warning(f"Docker request failed, reconnecting: {e}")
+            if not self.reconnect():
+                raise
+            return operation(*args)
+    
     def is_connected(self) -> bool:
         """
         Check if client is connected to Docker daemon.
         
+        Issues a ping, so it is meant for health checks; the query methods
+        detect and recover from lost connections on their own.
+        
+        Does not take the lock: the client reference is read once into a
+        local, and the SDK's connection pool makes concurrent pings safe.
+        Only _connect() and close() need mutual exclusion.
+        
         Returns:
             True if connected, False otherwise
         """
-        with self._lock:
-            if not self.client or not self._connected:
-                return False
-            
-            try:
-                self.client.ping()
-                return True
-            except DockerException:
-                self._connected = False
-                return False
+        client = self.client
+        if client is None or not self._connected:
+            return False
+        
+        try:
+            client.ping()
+            return True
+        except (DockerException, RequestException):
+            self._connected = False
+            return False
     
     def reconnect(self) -> bool:
         """
         Attempt to reconnect to Docker daemon.
         
+        The new client is connected before it replaces the old one, so
+        threads using the client concurrently never see it unset and the
+        stats executor keeps running.
+        
         Returns:
             True if reconnection successful, False otherwise
         """
         logger.info("Attempting to reconnect to Docker daemon...")
         try:
-            self.close()  # Close existing connection
-            self._connect()  # Establish new connection
-            logger.info("Successfully reconnected to Docker daemon")
-            return True
+            client = self._create_client()
         except Exception as e:
             logger.error(f"Failed to reconnect to Docker daemon: {e}")
-            return False 
\ No newline at end of file
+            return False
+        
+        with self._lock:
+            old_client, self.client = self.client, client
+            self._connected = True
+            # Samplers on the old connection end with it and restart next poll
+            self._stats_threads.clear()
+            self._stats_cache.clear()
+            self._version_cache.invalidate()
+            self._info_cache.invalidate()
+        
+        if old_client is not None:
+            try:
+                old_client.close()
+            except Exception as e:
+                logger.warning(f"Error closing previous Docker client: {e}")
+        
+        logger.info("Successfully reconnected to Docker daemon")
+        return True 
\ No newline at end of file
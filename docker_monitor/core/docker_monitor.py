@@ -1,17 +1,48 @@
 """Main Docker monitoring orchestrator."""
 
-import schedule
+import threading
 import time
-from typing import Optional, Dict, Any
+from collections import Counter
+from datetime import datetime, timedelta
+from operator import itemgetter
+from typing import Optional, Dict, Any, List
 
 from .docker_client import DockerClient
+from .notification_dispatcher import NotificationDispatcher
 from .realtime_monitor import RealTimeMonitor
 from ..integrations.slack import SlackNotifier
+from ..utils.cache import CachedValue
 from ..utils.config import Config
 from ..utils.logging_config import get_logger, setup_logging
 
 logger = get_logger(__name__)
 
+# Seconds container statuses and system info are shared between the
+# status summary and the connection test
+STATUS_CACHE_TTL = 5.0
+
+# Longest single wait of the daily scheduler; waking up occasionally keeps
+# the run time correct across wall-clock changes (DST, NTP steps)
+MAX_SCHEDULER_WAIT = 3600.0
+
+
+def next_daily_run(check_time: str, now: datetime) -> datetime:
+    """
+    Get the next occurrence of a daily HH:MM time.
+    
+    Args:
+        check_time: Time of day in HH:MM format
+        now: Reference time
+        
+    Returns:
+        Today's occurrence if it is still ahead, otherwise tomorrow's
+    """
+    at = datetime.strptime(check_time, "%H:%M").time()
+    next_run = datetime.combine(now.date(), at)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return next_run
+
 
 class DockerMonitor:
     """Main Docker monitoring orchestrator."""
@@ -32,38 +63,70 @@ class DockerMonitor:
         )
         
         # Initialize components
-        self.docker_client = DockerClient(self.config.docker_socket)
+        self.docker_client = DockerClient(
+            self.config.docker_socket,
+            max_stats_workers=self.config.docker_max_workers,
+            stream_stats=self.config.stream_stats
+        )
         self.slack_notifier = SlackNotifier(self.config.slack_webhook_url)
+        self.dispatcher = NotificationDispatcher(self.slack_notifier)
+        
+        # Short-lived caches so one status request hits Docker only once
+        self._status_containers = CachedValue(self._load_status_containers, ttl=STATUS_CACHE_TTL)
+        self._system_info = CachedValue(self.docker_client.get_system_info, ttl=STATUS_CACHE_TTL)
+        
+        # Set to end the scheduled loop
+        self._shutdown_event = threading.Event()
         
         logger.info("Docker Monitor initialized successfully")
     
-    def run_check(self) -> bool:
+    def invalidate(self) -> None:
+        """Drop cached container statuses and system information."""
+        self._status_containers.invalidate()
+        self._system_info.invalidate()
+    
+    def _load_status_containers(self) -> List[Dict[str, Any]]:
+        """Get containers with the fields needed for status reporting."""
+        # Only statuses are counted, so the list payload alone suffices
+        return self.docker_client.get_containers(
+            include_stopped=self.config.include_stopped_containers,
+            name_filter=self.config.container_name_filter_re,
+            with_stats=False,
+            fields=('status',)
+        )
+    
+    def run_check(self, wait: bool = True) -> bool:
         """
         Run a single monitoring check.
         
+        Args:
+            wait: Send the report before returning; if False it is queued on
+                the background dispatcher and delivery failures are only logged
+        
         Returns:
             True if check completed successfully, False otherwise
         """
         logger.info("Starting Docker container check...")
+        # A check always reports fresh data
+        self.invalidate()
         
         try:
-            # Check Docker connection
-            if not self.docker_client.is_connected():
-                logger.warning("Docker client disconnected, attempting to reconnect...")
-                if not self.docker_client.reconnect():
-                    raise ConnectionError("Failed to reconnect to Docker daemon")
-            
-            # Get container information
+            # Get container information (reconnects on its own if needed)
             container_info = self.docker_client.get_containers(
                 include_stopped=self.config.include_stopped_containers,
-                name_filter=self.config.container_name_filter
+                name_filter=self.config.container_name_filter_re,
+                with_env=False
             )
             
             # Get system information
-            system_info = self.docker_client.get_system_info()
+            system_info = self._system_info.get()
             
             # Send notification if enabled
-            if self.config.notification_enabled:
+            if self.config.notification_enabled and not wait:
+                message = self.slack_notifier.create_status_message(container_info, system_info)
+                self.dispatcher.enqueue(message['attachments'])
+                logger.info("Queued container report for Slack")
+            elif self.config.notification_enabled:
                 success = self.slack_notifier.send_container_report(
                     container_info, system_info
                 )
@@ -98,22 +161,39 @@ class DockerMonitor:
         """
         logger.info("Starting Docker monitor with scheduled execution...")
         
-        # Schedule the daily check
-        schedule.every().day.at(self.config.daily_check_time).do(self.run_check)
-        
         # Don't run initial check - wait for scheduled time
+        next_run = next_daily_run(self.config.daily_check_time, datetime.now())
         logger.info(f"Scheduler started. Next check scheduled for {self.config.daily_check_time}")
         
-        # Main scheduling loop
+        # Main scheduling loop: sleep until the next run instead of polling
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+            while not self._shutdown_event.is_set():
+                remaining = (next_run - datetime.now()).total_seconds()
+                if remaining > 0:
+                    self._shutdown_event.wait(min(remaining, MAX_SCHEDULER_WAIT))
+                    continue
+                
+                self.run_check(wait=False)
+                next_run = next_daily_run(self.config.daily_check_time, datetime.now())
+                logger.info(f"Next check scheduled for {next_run:%Y-%m-%d %H:%M}")
         except KeyboardInterrupt:
             logger.info("Scheduled monitoring stopped by user")
         except Exception as e:
             logger.error(f"Scheduler error: {e}")
             raise
+        finally:
+            self.dispatcher.stop()
+    
+    def stop(self) -> None:
+        """Stop the scheduled loop; an in-progress check is completed first."""
+        self._shutdown_event.set()
+    
+    def close(self) -> None:
+        """Stop monitoring and release pooled Docker and Slack connections."""
+        self.stop()
+        self.dispatcher.stop()
+        self.slack_notifier.close()
+        self.docker_client.close()
     
     def test_connections(self) -> Dict[str, bool]:
         """
@@ -124,14 +204,13 @@ class DockerMonitor:
         """
         results = {}
         
-        # Test Docker connection
+        # Test Docker connection; a successful system info request proves
+        # connectivity and is shared with get_status_summary
         logger.info("Testing Docker connection...")
         try:
-            results['docker'] = self.docker_client.is_connected()
-            if results['docker']:
-                logger.info("✅ Docker connection successful")
-            else:
-                logger.error("❌ Docker connection failed")
+            self._system_info.get()
+            results['docker'] = True
+            logger.info("✅ Docker connection successful")
         except Exception as e:
             logger.error(f"❌ Docker connection test failed: {e}")
             results['docker'] = False
@@ -159,19 +238,13 @@ class DockerMonitor:
         """
         try:
             # Get container info
-            containers = self.docker_client.get_containers(
-                include_stopped=self.config.include_stopped_containers,
-                name_filter=self.config.container_name_filter
-            )
+            containers = self._status_containers.get()
             
             # Get system info
-            system_info = self.docker_client.get_system_info()
+            system_info = self._system_info.get()
             
-            # Count containers by status
-            status_counts = {}
-            for container in containers:
-                status = container.get('status', 'unknown')
-                status_counts[status] = status_counts.get(status, 0) + 1
+            # Count containers by status; DockerClient always sets 'status'
+            status_counts = dict(Counter(map(itemgetter('status'), containers)))
             
             return {
                 'total_containers': len(containers),
@@ -234,7 +307,7 @@ class DockerMonitor:
         
         try:
             while True:
-                self.run_check()
+                self.run_check(wait=False)
                 logger.info(f"Sleeping for {interval_minutes} minutes...")
                 time.sleep(interval_minutes * 60)
         except KeyboardInterrupt:
@@ -242,6 +315,8 @@ class DockerMonitor:
         except Exception as e:
             logger.error(f"Continuous monitoring error: {e}")
             raise
+        finally:
+            self.dispatcher.stop()
     
     def monitor_containers_realtime(self, interval_seconds: int = 10) -> None:
         """
@@ -263,13 +338,15 @@ class DockerMonitor:
             realtime_monitor = RealTimeMonitor(self.config)
             realtime_monitor.start_monitoring(interval_seconds)
             
-            # Keep the main thread alive
+            # Block the main thread until the monitoring loop exits
             try:
-                while realtime_monitor.monitoring:
-                    time.sleep(1)
+                realtime_monitor.wait_until_stopped()
             except KeyboardInterrupt:
                 logger.info("Real-time monitoring interrupted by user")
                 realtime_monitor.stop_monitoring()
+            finally:
+                realtime_monitor.dispatcher.stop()
+                realtime_monitor.slack_notifier.close()
                 
         except Exception as e:
             logger.error(f"Real-time monitoring error: {e}")
@@ -0,0 +1,154 @@
+"""Docker event stream watching for immediate change detection."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .docker_client import DockerClient
+from ..utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Container event actions that can change what the state tracker reports;
+# health events carry the result after a colon ("health_status: unhealthy")
+WAKE_ACTIONS = frozenset({
+    'create', 'start', 'restart', 'die', 'stop', 'kill', 'oom',
+    'pause', 'unpause', 'destroy', 'rename', 'health_status'
+})
+
+
+def is_state_event(event: Dict[str, Any]) -> bool:
+    """
+    Check whether a container event may change a container's reported state.
+    
+    Args:
+        event: Decoded Docker event
+    
+    Returns:
+        True for lifecycle and health events, False for e.g. exec or attach
+    """
+    action = event.get('Action') or event.get('status') or ''
+    return action.split(':', 1)[0] in WAKE_ACTIONS
+
+
+class EventWatcher:
+    """Follows the Docker event stream in a daemon thread and reports state events."""
+    
+    def __init__(self, docker_client: DockerClient, on_event: Callable[[Dict[str, Any]], None],
+                 reconnect_delay: float = 1.0, max_reconnect_delay: float = 60.0):
+        """
+        Initialize event watcher.
+        
+        Args:
+            docker_client: Docker client to stream events from
+            on_event: Called from the watcher thread for every state event,
+                and with an empty dict after the stream reconnects since events
+                may have been missed while it was down
+            reconnect_delay: First wait in seconds before reconnecting (default: 1)
+            max_reconnect_delay: Longest wait in seconds; the wait doubles after
+                each failed attempt (default: 60)
+        """
+        self.docker_client = docker_client
+        self.on_event = on_event
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        # Time of the last event seen, used to resume the stream after a disconnect
+        self.last_event_time: Optional[int] = None
+        
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._stream: Optional[Any] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def running(self) -> bool:
+        """Whether the watcher thread is alive."""
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+    
+    def start(self) -> None:
+        """Start watching events in a background thread."""
+        with self._lock:
+            if self.running:
+                logger.warning("Event watcher is already running")
+                return
+            
+            self._stop_event.clear()
+            self.last_event_time = None
+            self._thread = threading.Thread(target=self._watch_loop, daemon=True, name="DockerEventWatcher")
+            self._thread.start()
+        
+        logger.info("Docker event watcher started")
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop watching and close the event stream.
+        
+        Args:
+            timeout: Seconds to wait for the watcher thread (default: 5)
+        """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+            self._stop_event.set()
+            stream = self._stream
+        
+        # Closing the stream unblocks the thread waiting for the next event
+        self._close_stream(stream)
+        
+        if thread is not None:
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                logger.warning("Docker event watcher did not stop within timeout")
+            else:
+                logger.info("Docker event watcher stopped")
+    
+    def _watch_loop(self) -> None:
+        """Follow the event stream, reconnecting with exponential backoff."""
+        delay = self.reconnect_delay
+        connected_before = False
+        
+        while not self._stop_event.is_set():
+            if self.last_event_time is None:
+                self.last_event_time = int(time.time())
+            try:
+                stream = self.docker_client.events(since=self.last_event_time)
+                with self._lock:
+                    if self._stop_event.is_set():
+                        self._close_stream(stream)
+                        break
+                    self._stream = stream
+                
+                if connected_before:
+                    logger.info("Docker event stream reconnected")
+                    self.on_event({})
+                connected_before = True
+                
+                for event in stream:
+                    delay = self.reconnect_delay
+                    self.last_event_time = event.get('time', self.last_event_time)
+                    if is_state_event(event):
+                        self.on_event(event)
+                
+                if not self._stop_event.is_set():
+                    logger.warning("Docker event stream ended")
+            except Exception as e:
+                logger.warning(f"Docker event stream failed: {e}")
+            finally:
+                with self._lock:
+                    self._stream = None
+            
+            if self._stop_event.wait(timeout=delay):
+                break
+            logger.info(f"Reconnecting to Docker event stream (waited {delay:g}s)")
+            delay = min(delay * 2, self.max_reconnect_delay)
+    
+    @staticmethod
+    def _close_stream(stream: Optional[Any]) -> None:
+        """Close an event stream, ignoring errors from an already broken connection."""
+        if stream is None:
+            return
+        try:
+            stream.close()
+        except Exception as e:
+            logger.debug(f"Error closing Docker event stream: {e}")
@@ -2,7 +2,7 @@
 
 import threading
 import time
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 
 from ..utils.logging_config import get_logger
 
@@ -12,45 +12,99 @@ logger = get_logger(__name__)
 class MonitoringThread:
     """Manages the background monitoring loop."""
     
-    def __init__(self, check_function: Callable[[], None], check_interval: int = 10):
+    def __init__(self, check_function: Callable[[], Optional[bool]], check_interval: int = 10,
+                 min_interval: Optional[float] = None, max_interval: Optional[float] = None,
+                 wake_delay: float = 0.5):
         """
         Initialize monitoring thread.
         
+        The wait between cycles adapts to activity: it is halved (down to
+        min_interval) after a cycle that detected changes and grown by half
+        (up to max_interval) after a quiet one.
+        
         Args:
-            check_function: Function to call on each monitoring cycle
-            check_interval: Check interval in seconds (default: 10)
+            check_function: Function to call on each monitoring cycle; returns
+                True when changes were detected, False when idle, or None to
+                leave the interval unchanged
+            check_interval: Initial check interval in seconds (default: 10)
+            min_interval: Shortest interval in seconds
+                (default: a quarter of check_interval, at least 1)
+            max_interval: Longest interval in seconds
+                (default: six times check_interval)
+            wake_delay: Seconds a wake() waits before the cycle runs, so a
+                burst of wake-ups (e.g. a compose up) shares one cycle
+                (default: 0.5)
         """
         self.check_function = check_function
         self.check_interval = check_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.wake_delay = wake_delay
+        self.current_interval: float = check_interval
         
-        # Thread management
-        self._lock = threading.RLock()
-        self._monitoring = False
+        # Thread management; the lock only serializes start() and stop(),
+        # run state is read lock-free from the events
+        self._lock = threading.Lock()
+        self._running = threading.Event()
         self._monitor_thread: Optional[threading.Thread] = None
         self._shutdown_event = threading.Event()
+        # Ends the current wait early; set by wake() and stop()
+        self._wake_event = threading.Event()
+        # Set whenever the loop is not running
+        self._stopped_event = threading.Event()
+        self._stopped_event.set()
+    
+    def _interval_bounds(self) -> Tuple[float, float]:
+        """Resolve (min, max) interval, deriving defaults from check_interval."""
+        low = self.min_interval if self.min_interval is not None else max(1, self.check_interval / 4)
+        high = self.max_interval if self.max_interval is not None else self.check_interval * 6
+        return low, max(low, high)
+    
+    def _next_interval(self, changed: Optional[bool]) -> float:
+        """
+        Compute the wait before the next cycle.
+        
+        Args:
+            changed: Result of the last check_function call
+            
+        Returns:
+            Interval in seconds, clamped to the configured bounds
+        """
+        low, high = self._interval_bounds()
+        if changed is None:
+            interval = self.current_interval
+        elif changed:
+            interval = self.current_interval / 2
+        else:
+            interval = self.current_interval * 1.5
+        return min(high, max(low, interval))
     
     @property
     def monitoring(self) -> bool:
         """Thread-safe monitoring status getter."""
-        with self._lock:
-            return self._monitoring
+        return self._running.is_set()
     
     @monitoring.setter
     def monitoring(self, value: bool) -> None:
         """Thread-safe monitoring status setter."""
-        with self._lock:
-            self._monitoring = value
+        if value:
+            self._running.set()
+        else:
+            self._running.clear()
     
     def start(self) -> None:
         """Start the monitoring thread."""
         with self._lock:
-            if self._monitoring:
+            if self._running.is_set():
                 logger.warning("Monitoring thread is already running")
                 return
             
             logger.info(f"Starting monitoring thread with {self.check_interval}s interval...")
-            self._monitoring = True
+            self._running.set()
+            self.current_interval = self.check_interval
             self._shutdown_event.clear()
+            self._wake_event.clear()
+            self._stopped_event.clear()
         
         logger.info(f"Monitoring flag set to: {self.monitoring}")
         
@@ -76,15 +130,16 @@ class MonitoringThread:
         logger.info("Stopping monitoring thread...")
         
         with self._lock:
-            if not self._monitoring:
+            if not self._running.is_set():
                 logger.warning("Monitoring thread is not running")
                 return
             
-            self._monitoring = False
+            self._running.clear()
             monitor_thread = self._monitor_thread
         
         # Signal shutdown
         self._shutdown_event.set()
+        self._wake_event.set()
         
         # Wait for thread to finish
         if monitor_thread and monitor_thread.is_alive():
@@ -111,22 +166,23 @@ class MonitoringThread:
             cycle_count = 0
             logger.info("Entering monitoring while loop...")
             
-            while self.monitoring and not self._shutdown_event.is_set():
+            while not self._shutdown_event.is_set():
                 try:
                     cycle_count += 1
-                    logger.info(f"Starting monitoring cycle #{cycle_count}...")
-                    self.check_function()
-                    logger.info(f"Monitoring cycle #{cycle_count} completed")
+                    logger.debug("Starting monitoring cycle #%d", cycle_count)
+                    changed = self.check_function()
+                    self.current_interval = self._next_interval(changed)
+                    logger.debug("Monitoring cycle #%d completed (next check in %gs)",
+                                 cycle_count, self.current_interval)
                     
-                    # Use shutdown event for interruptible sleep
-                    if self._shutdown_event.wait(timeout=self.check_interval):
+                    if self._wait():
                         logger.info("Shutdown event received, stopping monitoring loop")
                         break
                         
                 except Exception as e:
                     logger.error(f"Error in monitoring loop cycle #{cycle_count}: {e}")
                     # Still sleep on error to avoid tight error loop
-                    if self._shutdown_event.wait(timeout=self.check_interval):
+                    if self._wait():
                         break
             
             logger.info(f"Monitoring loop stopped (monitoring flag: {self.monitoring})")
@@ -136,15 +192,49 @@ class MonitoringThread:
             logger.error(f"Traceback: {traceback.format_exc()}")
         finally:
             # Ensure monitoring flag is set to False
-            with self._lock:
-                self._monitoring = False
+            self._running.clear()
+            self._stopped_event.set()
+    
+    def wake(self) -> None:
+        """Run the next monitoring cycle now instead of after the current interval."""
+        self._wake_event.set()
+    
+    def _wait(self) -> bool:
+        """
+        Sleep for the current interval, returning early on wake() or stop().
+        
+        After a wake-up the loop settles for wake_delay seconds; wake-ups
+        arriving during a cycle or the settle delay are coalesced into one
+        early cycle.
+        
+        Returns:
+            True if shutdown was requested
+        """
+        woken = self._wake_event.wait(timeout=self.current_interval)
+        if woken and self.wake_delay > 0:
+            self._shutdown_event.wait(timeout=self.wake_delay)
+        self._wake_event.clear()
+        return self._shutdown_event.is_set()
+    
+    def wait_until_stopped(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the monitoring loop has exited.
+        
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            True if the loop is stopped, False if the timeout expired first
+        """
+        return self._stopped_event.wait(timeout)
     
     def get_status(self) -> dict:
         """Get current thread status."""
-        with self._lock:
-            return {
-                'monitoring': self._monitoring,
-                'thread_alive': self._monitor_thread.is_alive() if self._monitor_thread else False,
-                'check_interval': self.check_interval,
-                'shutdown_event_set': self._shutdown_event.is_set()
-            } 
\ No newline at end of file
+        monitor_thread = self._monitor_thread
+        return {
+            'monitoring': self._running.is_set(),
+            'thread_alive': monitor_thread.is_alive() if monitor_thread else False,
+            'check_interval': self.check_interval,
+            'current_interval': self.current_interval,
+            'shutdown_event_set': self._shutdown_event.is_set()
+        } 
\ No newline at end of file
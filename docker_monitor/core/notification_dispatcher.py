@@ -0,0 +1,137 @@
+"""Background delivery of Slack notifications."""
+
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..integrations.slack import SlackNotifier
+from ..utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Queued item: Slack attachments plus an optional callback run after delivery
+_Item = Tuple[List[Dict[str, Any]], Optional[Callable[[], None]]]
+
+
+class NotificationDispatcher:
+    """Sends queued Slack messages from a daemon thread so callers never block on Slack."""
+    
+    def __init__(self, slack_notifier: SlackNotifier, maxsize: int = 1024, batch_size: int = 16):
+        """
+        Initialize notification dispatcher.
+        
+        Args:
+            slack_notifier: SlackNotifier used for delivery
+            maxsize: Queue capacity; the oldest message is dropped when full (default: 1024)
+            batch_size: Queued messages merged into one Slack post (default: 16)
+        """
+        self.slack_notifier = slack_notifier
+        self.batch_size = batch_size
+        self.dropped = 0
+        
+        self._queue: "queue.Queue[Optional[_Item]]" = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._worker_thread: Optional[threading.Thread] = None
+    
+    def enqueue(self, attachments: List[Dict[str, Any]],
+                on_sent: Optional[Callable[[], None]] = None) -> None:
+        """
+        Queue attachments for delivery and return immediately.
+        
+        Args:
+            attachments: Slack attachments to send
+            on_sent: Called from the worker thread once the attachments were delivered
+        """
+        self._ensure_started()
+        self._put((attachments, on_sent))
+    
+    @property
+    def pending(self) -> int:
+        """Approximate number of messages waiting for delivery."""
+        return self._queue.qsize()
+    
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Deliver what is queued, then stop the worker thread.
+        
+        Args:
+            timeout: Seconds to wait for the worker to finish (default: 10)
+        """
+        with self._lock:
+            worker = self._worker_thread
+            self._worker_thread = None
+        
+        if worker is None:
+            return
+        
+        self._put(None)
+        worker.join(timeout=timeout)
+        if worker.is_alive():
+            logger.warning("Notification dispatcher did not stop within timeout")
+    
+    def _ensure_started(self) -> None:
+        """Start the worker thread on first use."""
+        with self._lock:
+            if self._worker_thread is None:
+                self._worker_thread = threading.Thread(
+                    target=self._worker,
+                    daemon=True,
+                    name="SlackNotificationDispatcher"
+                )
+                self._worker_thread.start()
+    
+    def _put(self, item: Optional[_Item]) -> None:
+        """Queue an item, dropping the oldest one if the queue is full."""
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    continue
+                self.dropped += 1
+                logger.warning(f"Notification queue full, dropped oldest message ({self.dropped} dropped so far)")
+    
+    def _worker(self) -> None:
+        """Deliver queued messages in batches until the stop sentinel arrives."""
+        running = True
+        while running:
+            item = self._queue.get()
+            if item is None:
+                break
+            
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+            
+            self._deliver(batch)
+        
+        logger.info("Notification dispatcher stopped")
+    
+    def _deliver(self, batch: List[_Item]) -> None:
+        """
+        Send a batch of queued messages as one Slack post.
+        
+        Args:
+            batch: Queued (attachments, on_sent) items
+        """
+        attachments = [attachment for item_attachments, _ in batch for attachment in item_attachments]
+        try:
+            if not self.slack_notifier.send_batch(attachments):
+                logger.error(f"Failed to deliver {len(batch)} queued notifications")
+                return
+            
+            for _, on_sent in batch:
+                if on_sent is not None:
+                    on_sent()
+        except Exception as e:
+            logger.error(f"Error delivering queued notifications: {e}")
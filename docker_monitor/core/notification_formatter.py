@@ -1,16 +1,205 @@
 """Notification content creation and formatting."""
 
-from typing import Dict, Any
+import dataclasses
+import functools
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
+from .change_detector import EMPTY_DICT
+from .changes import Change
 from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+class NotifSpec(NamedTuple):
+    """Static presentation of one kind of change."""
+    
+    # Key of NotificationFormatter._LEVEL_STYLE; sets the emoji and color
+    alert_level: str
+    # Formatted with name=<container name>
+    title_tmpl: str
+    # Formatted with the change's fields
+    desc_tmpl: str
+    # Optional hook (change, spec, description) -> (spec, description) for
+    # cases the table cannot express, e.g. escalating by current status
+    escalate: Optional[Callable[[Dict[str, Any], 'NotifSpec', str], Tuple['NotifSpec', str]]] = None
+    # Whether the container details block is attached
+    with_details: bool = True
+    # Title emoji when it differs from the alert level's
+    emoji: Optional[str] = None
+
+
+def _escalate_unless_running(change: Change, spec: NotifSpec, description: str) -> Tuple[NotifSpec, str]:
+    """Make a restart critical when the container did not come back up."""
+    current_status = change['current_status']
+    if current_status == 'running':
+        return spec, description
+    critical = spec._replace(alert_level='critical', emoji=None)
+    return critical, description + f"\n⚠️ Current status: `{current_status}`"
+
+
+_STOPPED_SPEC = NotifSpec('critical', "Container {name} STOPPED",
+                          "Container transitioned from `{previous_status}` to `{current_status}`")
+
+# (previous_status, current_status) -> spec for state changes; a None
+# previous status matches any transition into current_status
+_STATE_SPECS = {
+    ('running', 'exited'): _STOPPED_SPEC,
+    ('running', 'stopped'): _STOPPED_SPEC,
+    ('running', 'dead'): _STOPPED_SPEC,
+    (None, 'restarting'): NotifSpec('warning', "Container {name} RESTARTING",
+                                    "Container is in restarting state (may indicate issues)"),
+    ('running', 'unhealthy'): NotifSpec('warning', "Container {name} UNHEALTHY",
+                                        "Container health check failed"),
+}
+_DEFAULT_STATE_SPEC = NotifSpec('info', "Container {name} Status Change",
+                                "Container transitioned from `{previous_status}` to `{current_status}`")
+
+# restart_type -> spec for container_restarted changes
+_RESTART_SPECS = {
+    'automatic': NotifSpec(
+        'warning', "Container {name} AUTO-RESTARTED",
+        "Container automatically restarted {times}due to {failures} "
+        "(restart count: {previous_restart_count} → {current_restart_count})",
+        escalate=_escalate_unless_running, emoji='🔄'
+    ),
+    'manual': NotifSpec('warning', "Container {name} RESTARTED",
+                        "Container was manually restarted (started time changed)",
+                        escalate=_escalate_unless_running, emoji='🔄'),
+}
+_DEFAULT_RESTART_SPEC = NotifSpec('warning', "Container {name} RESTARTED",
+                                  "Container restart detected (type: {restart_type})", emoji='🔄')
+
+# change['type'] -> spec for the remaining change types
+_NOTIF_SPECS = {
+    'container_started': NotifSpec(
+        'ok', "Container {name} STARTED",
+        "Container started successfully (transitioned from `{previous_status}` to `running`)"
+    ),
+    'container_stopped': NotifSpec(
+        'critical', "Container {name} STOPPED",
+        "Container stopped (transitioned from `running` to `{current_status}`)"
+    ),
+    'container_removed': NotifSpec(
+        'critical', "Container {name} REMOVED",
+        "Container was unexpectedly removed (was `{previous_status}`)",
+        with_details=False
+    ),
+    'container_added': NotifSpec(
+        'ok', "Container {name} ADDED",
+        "New container detected with status: `{current_status}`"
+    ),
+}
+_GENERIC_SPEC = NotifSpec('info', "Container {name} Event",
+                          "Unknown change type: {type}")
+
+# (container_info key, label, skip when empty) for the notification details block
+_DETAIL_FIELDS = (
+    ('image', '**Image:** ', False),
+    ('ports', '**Ports:** ', True),
+    ('created', '**Created:** ', False),
+)
+
+# Placeholder for detail fields absent from container_info
+_MISSING = object()
+
+# Lines listed in a grouped attachment before the rest are summarised
+MAX_GROUP_LINES = 40
+
+
+@functools.lru_cache(maxsize=8)
+def _format_timestamp(timestamp: datetime) -> str:
+    """
+    Format a change timestamp for display.
+    
+    All changes from one detection pass share a timestamp, so a cycle's
+    notifications format it once and share the resulting string.
+    """
+    return timestamp.strftime('%Y-%m-%d %H:%M:%S')
+
+
+@functools.lru_cache(maxsize=256)
+def _format_details(values: Tuple[Any, ...]) -> Optional[str]:
+    """
+    Format the container details block.
+    
+    Container metadata rarely changes between events, so the block is
+    cached by its field values.
+    
+    Args:
+        values: Values of the _DETAIL_FIELDS keys, _MISSING when absent
+    
+    Returns:
+        Details text, or None when no field is shown
+    """
+    return '\n'.join(
+        label + str(value)
+        for (_, label, skip_empty), value in zip(_DETAIL_FIELDS, values)
+        if value is not _MISSING and not (skip_empty and not value)
+    ) or None
+
+
+def _select_spec(change: Change) -> Tuple[NotifSpec, Dict[str, Any]]:
+    """
+    Pick the presentation spec for a change.
+    
+    Args:
+        change: Change information dictionary
+        
+    Returns:
+        Tuple of (spec, fields for its description template)
+    """
+    change_type = change['type']
+    if change_type == 'state_change':
+        transition = (change['previous_status'], change['current_status'])
+        spec = (_STATE_SPECS.get(transition)
+                or _STATE_SPECS.get((None, transition[1]))
+                or _DEFAULT_STATE_SPEC)
+        return spec, change
+    
+    if change_type == 'container_restarted':
+        restart_type = change.get('restart_type', 'unknown')
+        spec = _RESTART_SPECS.get(restart_type, _DEFAULT_RESTART_SPEC)
+        fields = {**change, 'restart_type': restart_type}
+        if restart_type == 'automatic':
+            restart_diff = change['current_restart_count'] - change['previous_restart_count']
+            fields['times'] = '' if restart_diff == 1 else f"{restart_diff} times "
+            fields['failures'] = 'failure' if restart_diff == 1 else 'failures'
+        return spec, fields
+    
+    return _NOTIF_SPECS.get(change_type, _GENERIC_SPEC), change
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Notification:
+    """Formatted notification for a single container change."""
+    
+    alert_level: str
+    title: str
+    description: str
+    timestamp: str
+    container_name: str
+    container_id: str
+    color: str
+    details: Optional[str] = None
+
+
 class NotificationFormatter:
     """Creates notification content and formatting."""
     
-    def create_notification(self, change: Dict[str, Any]) -> Dict[str, Any]:
+    # alert_level -> (emoji, Slack color)
+    _LEVEL_STYLE = {
+        'critical': ('🚨', '#FF0000'),  # Red
+        'warning': ('⚠️', '#FFA500'),  # Orange
+        'info': ('ℹ️', '#0099CC'),  # Blue
+        'ok': ('✅', '#00AA00'),  # Green
+    }
+    # alert_level -> title prefix, formatted once
+    TITLE_PREFIX = {level: emoji + ' ' for level, (emoji, _) in _LEVEL_STYLE.items()}
+    
+    def create_notification(self, change: Change) -> Notification:
         """
         Create a notification message for a change.
         
@@ -18,204 +207,144 @@ class NotificationFormatter:
             change: Change information dictionary
             
         Returns:
-            Formatted notification dictionary
+            Formatted notification
         """
-        change_type = change['type']
-        container_info = change.get('container_info', {})
-        container_name = container_info.get('name', change['container_id'][:12])
-        timestamp = change['timestamp'].strftime('%Y-%m-%d %H:%M:%S')
-        
-        if change_type == 'state_change':
-            return self._create_state_change_notification(change, container_name, timestamp)
-        elif change_type == 'container_restarted':
-            return self._create_restart_notification(change, container_name, timestamp)
-        elif change_type == 'container_started':
-            return self._create_start_notification(change, container_name, timestamp)
-        elif change_type == 'container_stopped':
-            return self._create_stop_notification(change, container_name, timestamp)
-        elif change_type == 'container_removed':
-            return self._create_removal_notification(change, container_name, timestamp)
-        elif change_type == 'container_added':
-            return self._create_addition_notification(change, container_name, timestamp)
-        else:
-            return self._create_generic_notification(change, container_name, timestamp)
-    
-    def _create_state_change_notification(self, change: Dict[str, Any], container_name: str, timestamp: str) -> Dict[str, Any]:
-        """Create notification for state changes."""
-        previous_status = change['previous_status']
-        current_status = change['current_status']
-        container_info = change.get('container_info', {})
-        
-        # Determine alert level
-        if previous_status == 'running' and current_status in ['exited', 'stopped', 'dead']:
-            alert_level = 'critical'
-            emoji = '🚨'
-            color = '#FF0000'  # Red
-            title = f"Container {container_name} STOPPED"
-            description = f"Container transitioned from `{previous_status}` to `{current_status}`"
-        elif current_status == 'restarting':
-            alert_level = 'warning'
-            emoji = '⚠️'
-            color = '#FFA500'  # Orange
-            title = f"Container {container_name} RESTARTING"
-            description = f"Container is in restarting state (may indicate issues)"
-        elif previous_status == 'running' and current_status == 'unhealthy':
-            alert_level = 'warning'
-            emoji = '⚠️'
-            color = '#FFA500'  # Orange
-            title = f"Container {container_name} UNHEALTHY"
-            description = f"Container health check failed"
-        else:
-            alert_level = 'info'
-            emoji = 'ℹ️'
-            color = '#0099CC'  # Blue
-            title = f"Container {container_name} Status Change"
-            description = f"Container transitioned from `{previous_status}` to `{current_status}`"
+        container_info = change.get('container_info') or EMPTY_DICT
+        # ChangeDetector resolves the display name once; removed containers
+        # have no info or ID left, only their tracked name
+        container_name = (change.get('display_name') or container_info.get('name')
+                          or change['container_id'][:12])
         
-        return self._build_notification(alert_level, emoji, title, description, timestamp, 
-                                      container_name, change['container_id'], color, container_info)
-    
-    def _create_restart_notification(self, change: Dict[str, Any], container_name: str, timestamp: str) -> Dict[str, Any]:
-        """Create notification for container restarts."""
-        restart_type = change.get('restart_type', 'unknown')
-        current_status = change['current_status']
-        container_info = change.get('container_info', {})
+        timestamp = _format_timestamp(change['timestamp'])
         
-        if restart_type == 'automatic':
-            previous_count = change['previous_restart_count']
-            current_count = change['current_restart_count']
-            restart_diff = current_count - previous_count
-            
-            alert_level = 'warning'
-            emoji = '🔄'
-            color = '#FFA500'  # Orange
-            title = f"Container {container_name} AUTO-RESTARTED"
-            
-            if restart_diff == 1:
-                description = f"Container automatically restarted due to failure (restart count: {previous_count} → {current_count})"
-            else:
-                description = f"Container automatically restarted {restart_diff} times due to failures (restart count: {previous_count} → {current_count})"
-            
-            if current_status != 'running':
-                description += f"\n⚠️ Current status: `{current_status}`"
-                alert_level = 'critical'
-                emoji = '🚨'
-                color = '#FF0000'  # Red
+        spec, fields = _select_spec(change)
+        description = spec.desc_tmpl.format_map(fields)
+        if spec.escalate is not None:
+            spec, description = spec.escalate(change, spec, description)
         
-        elif restart_type == 'manual':
-            alert_level = 'warning'
-            emoji = '🔄'
-            color = '#FFA500'  # Orange
-            title = f"Container {container_name} RESTARTED"
-            description = f"Container was manually restarted (started time changed)"
-            
-            if current_status != 'running':
-                description += f"\n⚠️ Current status: `{current_status}`"
-                alert_level = 'critical'
-                emoji = '🚨'
-                color = '#FF0000'  # Red
+        notification = self._build_notification(
+            spec.alert_level, spec.title_tmpl.format(name=container_name), description,
+            timestamp, container_name, change['container_id'],
+            container_info if spec.with_details else {}, spec.emoji
+        )
         
-        else:
-            alert_level = 'warning'
-            emoji = '🔄'
-            color = '#FFA500'  # Orange
-            title = f"Container {container_name} RESTARTED"
-            description = f"Container restart detected (type: {restart_type})"
+        # Coalesced changes stand for several events
+        count = change.get('count', 1)
+        if count > 1:
+            notification = dataclasses.replace(notification, title=f"[x{count}] " + notification.title)
         
-        return self._build_notification(alert_level, emoji, title, description, timestamp,
-                                      container_name, change['container_id'], color, container_info)
+        # Burst summaries say over which period the events were folded
+        burst_window = change.get('burst_window')
+        if burst_window is not None:
+            notification = dataclasses.replace(
+                notification,
+                description=f"{notification.description}\n{count} {change['type']} events in {burst_window:g}s"
+            )
+        return notification
     
-    def _create_start_notification(self, change: Dict[str, Any], container_name: str, timestamp: str) -> Dict[str, Any]:
-        """Create notification for container starts."""
-        previous_status = change['previous_status']
-        container_info = change.get('container_info', {})
-        
-        alert_level = 'info'
-        emoji = '✅'
-        color = '#00AA00'  # Green
-        title = f"Container {container_name} STARTED"
-        description = f"Container started successfully (transitioned from `{previous_status}` to `running`)"
-        
-        return self._build_notification(alert_level, emoji, title, description, timestamp,
-                                      container_name, change['container_id'], color, container_info)
-    
-    def _create_stop_notification(self, change: Dict[str, Any], container_name: str, timestamp: str) -> Dict[str, Any]:
-        """Create notification for container stops."""
-        current_status = change['current_status']
-        container_info = change.get('container_info', {})
+    def create_notifications(self, changes: List[Change]) -> Dict[str, Any]:
+        """
+        Create one Slack message covering several changes.
         
-        alert_level = 'critical'
-        emoji = '🚨'
-        color = '#FF0000'  # Red
-        title = f"Container {container_name} STOPPED"
-        description = f"Container stopped (transitioned from `running` to `{current_status}`)"
+        Changes are grouped by alert level and change type, so a batch
+        operation touching many containers yields a few summary attachments
+        instead of one per container. A group of one keeps the full
+        single-change attachment.
         
-        return self._build_notification(alert_level, emoji, title, description, timestamp,
-                                      container_name, change['container_id'], color, container_info)
-    
-    def _create_removal_notification(self, change: Dict[str, Any], container_name: str, timestamp: str) -> Dict[str, Any]:
-        """Create notification for container removal."""
-        alert_level = 'critical'
-        emoji = '🚨'
-        color = '#FF0000'  # Red
-        title = f"Container {container_name} REMOVED"
-        description = f"Container was unexpectedly removed (was `{change['previous_status']}`)"
+        Args:
+            changes: Change information dictionaries
+            
+        Returns:
+            Slack message with one attachment per group
+        """
+        ts = int(time.time())
+        groups: Dict[Tuple[str, str], List[Notification]] = {}
+        for change in changes:
+            notification = self.create_notification(change)
+            groups.setdefault((notification.alert_level, change['type']), []).append(notification)
         
-        return self._build_notification(alert_level, emoji, title, description, timestamp,
-                                      container_name, change['container_id'], color, {})
+        return {
+            "attachments": [
+                self.to_attachment(notifications[0], ts) if len(notifications) == 1
+                else self.to_group_attachment(change_type, notifications, ts)
+                for (_, change_type), notifications in groups.items()
+            ]
+        }
     
-    def _create_addition_notification(self, change: Dict[str, Any], container_name: str, timestamp: str) -> Dict[str, Any]:
-        """Create notification for container addition."""
-        container_info = change.get('container_info', {})
-        
-        alert_level = 'info'
-        emoji = '✅'
-        color = '#00AA00'  # Green
-        title = f"Container {container_name} ADDED"
-        description = f"New container detected with status: `{change['current_status']}`"
+    @staticmethod
+    def to_attachment(notification: Notification, ts: int) -> Dict[str, Any]:
+        """
+        Convert a notification into a Slack attachment.
         
-        return self._build_notification(alert_level, emoji, title, description, timestamp,
-                                      container_name, change['container_id'], color, container_info)
+        Args:
+            notification: Notification from create_notification
+            ts: Unix timestamp shown in the attachment footer
+            
+        Returns:
+            Slack attachment dictionary
+        """
+        if notification.details:
+            text = "\n\n".join((notification.description, notification.details))
+        else:
+            text = notification.description
+        return {
+            "color": notification.color,
+            "title": notification.title,
+            "text": text,
+            "footer": "Docker Monitor",
+            "ts": ts
+        }
     
-    def _create_generic_notification(self, change: Dict[str, Any], container_name: str, timestamp: str) -> Dict[str, Any]:
-        """Create notification for unknown change types."""
-        change_type = change['type']
-        container_info = change.get('container_info', {})
-        
-        alert_level = 'info'
-        emoji = 'ℹ️'
-        color = '#0099CC'  # Blue
-        title = f"Container {container_name} Event"
-        description = f"Unknown change type: {change_type}"
+    @classmethod
+    def to_group_attachment(cls, change_type: str, notifications: List[Notification],
+                            ts: int) -> Dict[str, Any]:
+        """
+        Summarise notifications of one alert level and change type in one attachment.
         
-        return self._build_notification(alert_level, emoji, title, description, timestamp,
-                                      container_name, change['container_id'], color, container_info)
-    
-    def _build_notification(self, alert_level: str, emoji: str, title: str, description: str, 
-                           timestamp: str, container_name: str, container_id: str, color: str, 
-                           container_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Build the final notification dictionary."""
-        notification = {
-            'alert_level': alert_level,
-            'title': f"{emoji} {title}",
-            'description': description,
-            'timestamp': timestamp,
-            'container_name': container_name,
-            'container_id': container_id,
-            'color': color
+        Args:
+            change_type: Change type shared by the notifications
+            notifications: Notifications from create_notification
+            ts: Unix timestamp shown in the attachment footer
+            
+        Returns:
+            Slack attachment with one line per container, truncated after
+            MAX_GROUP_LINES lines
+        """
+        first = notifications[0]
+        label = change_type.replace('container_', '').replace('_', ' ')
+        lines = [
+            f"*{notification.container_name}*: {' '.join(notification.description.splitlines())}"
+            for notification in notifications[:MAX_GROUP_LINES]
+        ]
+        if len(notifications) > MAX_GROUP_LINES:
+            lines.append(f"... and {len(notifications) - MAX_GROUP_LINES} more")
+        return {
+            "color": first.color,
+            "title": f"{cls.TITLE_PREFIX[first.alert_level]}{len(notifications)} containers: {label}",
+            "text": '\n'.join(lines),
+            "footer": "Docker Monitor",
+            "ts": ts
         }
-        
+    
+    def _build_notification(self, alert_level: str, title: str, description: str,
+                           timestamp: str, container_name: str, container_id: str,
+                           container_info: Dict[str, Any], emoji: Optional[str] = None) -> Notification:
+        """Build the final notification; emoji overrides the alert level's."""
+        prefix = self.TITLE_PREFIX[alert_level] if emoji is None else emoji + " "
         # Add container details if available
+        details = None
         if container_info:
-            details = []
-            if 'image' in container_info:
-                details.append(f"**Image:** {container_info['image']}")
-            if 'ports' in container_info and container_info['ports']:
-                details.append(f"**Ports:** {container_info['ports']}")
-            if 'created' in container_info:
-                details.append(f"**Created:** {container_info['created']}")
-            
-            if details:
-                notification['details'] = '\n'.join(details)
+            details = _format_details(tuple(
+                container_info.get(key, _MISSING) for key, _, _ in _DETAIL_FIELDS
+            ))
         
-        return notification 
\ No newline at end of file
+        return Notification(
+            alert_level=alert_level,
+            title=prefix + title,
+            description=description,
+            timestamp=timestamp,
+            container_name=container_name,
+            container_id=container_id,
+            color=self._LEVEL_STYLE[alert_level][1],
+            details=details
+        )
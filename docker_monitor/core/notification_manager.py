@@ -1,31 +1,85 @@
 """Notification management and coordination."""
 
-from typing import Dict, Any, List
+import logging
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Any, List, Optional, Tuple, Union
 
+from .changes import Change
 from .cooldown_manager import CooldownManager
+from .notification_dispatcher import NotificationDispatcher
 from .notification_formatter import NotificationFormatter
 from ..integrations.slack import SlackNotifier
 from ..utils.logging_config import get_logger
+from ..utils.rate_limit import TokenBucket
 
 logger = get_logger(__name__)
 
+# Notifications allowed per second, and the burst allowed on top of it
+NOTIFICATION_RATE = 5.0
+NOTIFICATION_BURST = 20
+
+# A container repeating the same change BURST_THRESHOLD times within
+# BURST_WINDOW seconds is folded into one summary per window
+BURST_WINDOW = 60.0
+BURST_THRESHOLD = 5
+
+# Plain ASCII marker for restart log lines, which end up in log files and
+# aggregators; emoji are kept for Slack messages
+RESTART_MARK = "[restart]"
+
+# Change types notified even while the container is in cooldown
+_CRITICAL_TYPES = frozenset({
+    'container_removed',
+    'container_failed',
+    'container_unhealthy',
+    'container_stopped',
+    'container_restarted',
+    'container_started',
+})
+
+# Change types that can produce a notification at all; others are skipped
+# before any cooldown or formatting work
+_NOTIFIABLE_TYPES = _CRITICAL_TYPES | {'state_change', 'container_added'}
+
+
+def _cooldown_key(change: Change) -> str:
+    """Key a change's cooldown by container name, falling back to its ID."""
+    return change.get('container_name') or change.get('container_id', '')
+
 
 class NotificationManager:
     """Coordinates notifications using formatter, cooldown manager, and slack notifier."""
     
-    def __init__(self, slack_notifier: SlackNotifier, cooldown_seconds: int = 120):
+    def __init__(self, slack_notifier: SlackNotifier, cooldown_seconds: int = 120,
+                 dispatcher: Optional[NotificationDispatcher] = None,
+                 state_path: Optional[Union[str, Path]] = None):
         """
         Initialize notification manager.
         
         Args:
             slack_notifier: SlackNotifier instance
             cooldown_seconds: Cooldown period in seconds (default: 120)
+            dispatcher: Optional background dispatcher; when given, notifications
+                are queued instead of sent from the calling thread
+            state_path: Optional file persisting cooldowns across restarts
         """
         self.slack_notifier = slack_notifier
-        self.cooldown_manager = CooldownManager(cooldown_seconds)
+        self.dispatcher = dispatcher
+        self.cooldown_manager = CooldownManager(cooldown_seconds, state_path=state_path)
         self.formatter = NotificationFormatter()
+        self.rate_limiter = TokenBucket(NOTIFICATION_RATE, NOTIFICATION_BURST)
+        
+        # Burst folding, keyed by (cooldown key, change type): recent change
+        # times, the latest folded change, and the timer sending its summary
+        self._burst_lock = threading.Lock()
+        self._recent_events: Dict[Tuple[str, str], Deque[float]] = {}
+        self._folded: Dict[Tuple[str, str], Change] = {}
+        self._burst_timers: Dict[Tuple[str, str], threading.Timer] = {}
     
-    def process_changes(self, changes: List[Dict[str, Any]]) -> None:
+    def process_changes(self, changes: List[Change]) -> None:
         """
         Process detected changes and send notifications as needed.
         
@@ -33,34 +87,152 @@ class NotificationManager:
             changes: List of detected changes
         """
         if not changes:
-            logger.info("No changes detected")
+            logger.debug("No changes detected")
             return
         
-        logger.info(f"Processing {len(changes)} changes")
+        logger.debug("Processing %d changes", len(changes))
         
+        pending = []
         for change in changes:
-            container_name = change.get('container_name', change.get('container_info', {}).get('name', change.get('container_id', 'unknown')[:12]))
+            change_type = change['type']
+            if change_type not in _NOTIFIABLE_TYPES:
+                logger.debug("Ignoring change type %s", change_type)
+                continue
+            
+            container_name = change['display_name']
             
             # Log restart events for debugging first
-            if change['type'] == 'container_restarted':
+            if change_type == 'container_restarted':
                 self._log_restart_event(change)
             
             # Check if we should notify
             should_notify = self._should_notify(change)
-            logger.info(f"Should notify for {change['type']} on {container_name}: {should_notify}")
+            logger.debug("Should notify for %s on %s: %s", change_type, container_name, should_notify)
             
             if should_notify:
-                self._send_notification(change)
+                pending.append(change)
             else:
-                logger.info(f"Skipped notification for {change['type']} on {container_name}")
-                # Debug why notification was skipped
-                container_key = change.get('container_name', change.get('container_id', ''))
-                if self.cooldown_manager.is_in_cooldown(container_key):
-                    logger.info(f"  Reason: Container {container_name} is in cooldown period")
-                else:
-                    logger.info(f"  Reason: Change type {change['type']} not configured for notification")
+                if logger.isEnabledFor(logging.DEBUG):
+                    # Debug why notification was skipped
+                    if self.cooldown_manager.is_in_cooldown(_cooldown_key(change)):
+                        reason = f"container {container_name} is in cooldown period"
+                    else:
+                        reason = f"change type {change_type} not configured for notification"
+                    logger.debug("Skipped notification for %s on %s: %s", change_type, container_name, reason)
+        
+        pending = self._fold_bursts(self._coalesce(pending))
+        # Only non-critical changes are rate limited; a stopped or removed
+        # container is always reported
+        allowed = [
+            change for change in pending
+            if change['type'] in _CRITICAL_TYPES or self.rate_limiter.try_acquire()
+        ]
+        if len(allowed) < len(pending):
+            logger.warning(f"Rate limit reached, dropped {len(pending) - len(allowed)} notifications")
+        
+        if allowed:
+            self._send_notifications(allowed)
+        
+        # Drop cooldown entries of removed containers to keep the table bounded
+        for change in changes:
+            if change['type'] == 'container_removed':
+                self.cooldown_manager.clear_cooldown(_cooldown_key(change))
+    
+    @staticmethod
+    def _coalesce(changes: List[Change]) -> List[Change]:
+        """
+        Merge repeated changes of the same type for the same container.
+        
+        Args:
+            changes: Changes in detection order
+            
+        Returns:
+            One change per (container, type), the latest one, with 'count'
+            set to the number of changes it stands for
+        """
+        merged: Dict[Tuple[str, str], Change] = {}
+        for change in changes:
+            # Removed containers have no ID left, so key by name
+            key = (_cooldown_key(change), change['type'])
+            previous = merged.pop(key, None)
+            if previous is not None:
+                change = {**change, 'count': previous.get('count', 1) + change.get('count', 1)}
+            merged[key] = change
+        return list(merged.values())
+    
+    def _fold_bursts(self, changes: List[Change]) -> List[Change]:
+        """
+        Hold back changes that repeat too often and summarise them per window.
+        
+        Once a container has had BURST_THRESHOLD changes of one type within
+        BURST_WINDOW seconds, further ones are folded into a single summary
+        sent when the window ends, e.g. for a crash-looping container.
+        
+        Args:
+            changes: Coalesced changes of the current cycle
+            
+        Returns:
+            Changes to notify individually
+        """
+        now = time.monotonic()
+        cutoff = now - BURST_WINDOW
+        passed = []
+        
+        with self._burst_lock:
+            for change in changes:
+                key = (_cooldown_key(change), change['type'])
+                recent = self._recent_events.get(key)
+                if recent is None:
+                    recent = self._recent_events[key] = deque(maxlen=BURST_THRESHOLD * 4)
+                recent.extend([now] * change.get('count', 1))
+                while recent[0] <= cutoff:
+                    recent.popleft()
+                
+                if len(recent) < BURST_THRESHOLD:
+                    passed.append(change)
+                    continue
+                
+                folded = self._folded.get(key)
+                count = change.get('count', 1) + (folded.get('count', 1) if folded else 0)
+                self._folded[key] = {**change, 'count': count, 'burst_window': BURST_WINDOW}
+                if key not in self._burst_timers:
+                    logger.warning(f"Notification burst for {change['display_name']} ({change['type']}), "
+                                   f"sending a summary in {BURST_WINDOW:g}s")
+                    timer = threading.Timer(BURST_WINDOW, self._flush_burst, args=(key,))
+                    timer.daemon = True
+                    self._burst_timers[key] = timer
+                    timer.start()
+            
+            # Forget containers that have been quiet for a whole window
+            for key in [key for key, recent in self._recent_events.items() if recent[-1] <= cutoff]:
+                del self._recent_events[key]
+        
+        return passed
     
-    def _should_notify(self, change: Dict[str, Any]) -> bool:
+    def _flush_burst(self, key: Tuple[str, str]) -> None:
+        """
+        Send the summary of a folded burst.
+        
+        Args:
+            key: (cooldown key, change type) of the burst
+        """
+        with self._burst_lock:
+            self._burst_timers.pop(key, None)
+            folded = self._folded.pop(key, None)
+        
+        if folded is not None:
+            self._send_notifications([folded])
+    
+    def flush_bursts(self) -> None:
+        """Send all pending burst summaries now, e.g. before shutting down."""
+        with self._burst_lock:
+            timers = list(self._burst_timers.items())
+        
+        for key, timer in timers:
+            timer.cancel()
+            self._flush_burst(key)
+    
+    def _should_notify(self, change: Change) -> bool:
         """
         Determine if a change should trigger a notification.
         
@@ -70,83 +242,66 @@ class NotificationManager:
         Returns:
             True if notification should be sent, False otherwise
         """
-        container_key = change.get('container_name', change.get('container_id', ''))
         change_type = change.get('type', '')
         
-        # Always notify for critical changes regardless of cooldown
-        critical_changes = [
-            'container_removed',
-            'container_failed',
-            'container_unhealthy',
-            'container_stopped',  # Container stops are critical
-            'container_restarted',  # Restarts are important and should bypass cooldown
-            'container_started'     # Starts are important and should bypass cooldown
-        ]
-        
-        if change_type in critical_changes:
+        # Critical changes are always notified, regardless of cooldown
+        if change_type in _CRITICAL_TYPES:
             return True
         
         # Check cooldown for other types of changes
+        container_key = _cooldown_key(change)
         if self.cooldown_manager.is_in_cooldown(container_key):
-            logger.info(f"Skipping notification for {container_key[:12]} - in cooldown period")
+            logger.debug("Skipping notification for %s - in cooldown period", container_key[:12])
             return False
         
-        # Notify for status changes but not for routine running containers
-        if change.get('type') == 'state_change':
-            previous_status = change.get('previous_status', '')
-            current_status = change.get('current_status', '')
-            
-            # Don't notify for containers that are just continuing to run
-            if previous_status == 'running' and current_status == 'running':
-                return False
-            
-            # Always notify for critical state changes (running -> stopped/exited/dead)
-            if previous_status == 'running' and current_status in ['exited', 'stopped', 'dead']:
-                return True
-            
-            return True
+        # Don't notify for containers that are just continuing to run
+        if change_type == 'state_change':
+            return not (change.get('previous_status') == change.get('current_status') == 'running')
         
         # Default to notify for other changes
         return True
     
-    def _send_notification(self, change: Dict[str, Any]) -> None:
+    def _send_notifications(self, changes: List[Change]) -> None:
         """
-        Send notification for a change.
+        Send notifications for a cycle's changes as one Slack batch.
         
         Args:
-            change: Change information dictionary
+            changes: Changes that passed the notification checks
         """
         try:
-            container_key = change.get('container_name', change.get('container_id', ''))
-            container_name = change.get('container_name', change.get('container_info', {}).get('name', container_key[:12]))
-            
-            # Create notification
-            notification = self.formatter.create_notification(change)
+            message = self.formatter.create_notifications(changes)
+            attachments = message['attachments']
             
-            # Combine description and details for the message
-            message_text = notification['description']
-            if notification.get('details'):
-                message_text += f"\n\n{notification['details']}"
-            
-            success = self.slack_notifier.send_custom_message(
-                title=notification['title'],
-                message=message_text,
-                color=notification['color']
-            )
-            
-            if success:
-                logger.info(f"Sent notification for {change['type']}: {notification['title']}")
-                # Update cooldown using container name as key
-                self.cooldown_manager.update_cooldown(container_key)
+            if self.dispatcher is not None:
+                self.dispatcher.enqueue(attachments, lambda: self._mark_sent(changes, attachments))
+                logger.info(f"Queued {len(attachments)} notifications")
+            elif self.slack_notifier.send_batch(attachments):
+                self._mark_sent(changes, attachments)
             else:
-                logger.error(f"Failed to send notification for {change['type']}")
+                logger.error(f"Failed to send {len(changes)} notifications")
                 
         except Exception as e:
-            logger.error(f"Error sending notification: {e}")
+            logger.error(f"Error sending notifications: {e}")
+    
+    def _mark_sent(self, changes: List[Change], attachments: List[Dict[str, Any]]) -> None:
+        """
+        Log delivered notifications and start their cooldowns.
+        
+        Args:
+            changes: Changes that were notified
+            attachments: Attachments sent for those changes; grouped changes
+                share one attachment
+        """
+        logger.info(f"Sent {len(attachments)} Slack attachments for {len(changes)} changes")
+        for change in changes:
+            logger.info(f"Sent notification for {change['type']} on {change['display_name']}")
+            # Removed containers get no cooldown; their entry is dropped instead
+            if change['type'] != 'container_removed':
+                self.cooldown_manager.update_cooldown(_cooldown_key(change))
     
-    def _log_restart_event(self, change: Dict[str, Any]) -> None:
+    def _log_restart_event(self, change: Change) -> None:
         """Log restart event details for debugging."""
-        container_name = change.get('container_name', change.get('container_info', {}).get('name', change.get('container_id', 'unknown')[:12]))
+        container_name = change['display_name']
         restart_type = change.get('restart_type', 'unknown')
         current_status = change['current_status']
         
@@ -154,17 +309,17 @@ class NotificationManager:
             previous_count = change['previous_restart_count']
             current_count = change['current_restart_count']
             logger.info(
-                f"🔄 AUTO-RESTART DETECTED: {container_name} "
-                f"(restart count: {previous_count} → {current_count}, "
+                f"{RESTART_MARK} AUTO-RESTART DETECTED: {container_name} "
+                f"(restart count: {previous_count} -> {current_count}, "
                 f"status: {current_status})"
             )
         elif restart_type == 'manual':
             logger.info(
-                f"🔄 MANUAL RESTART DETECTED: {container_name} "
+                f"{RESTART_MARK} MANUAL RESTART DETECTED: {container_name} "
                 f"(started time changed, status: {current_status})"
             )
         else:
             logger.info(
-                f"🔄 RESTART DETECTED: {container_name} "
+                f"{RESTART_MARK} RESTART DETECTED: {container_name} "
                 f"(type: {restart_type}, status: {current_status})"
             ) 
\ No newline at end of file
@@ -1,10 +1,13 @@
 """Real-time Docker container monitoring for immediate failure detection."""
 
+import logging
 from typing import Dict, Optional, Any
 
 from .docker_client import DockerClient
 from .state_tracker import StateTracker
 from .change_detector import ChangeDetector
+from .event_watcher import EventWatcher
+from .notification_dispatcher import NotificationDispatcher
 from .notification_manager import NotificationManager
 from .monitoring_thread import MonitoringThread
 from ..integrations.slack import SlackNotifier
@@ -13,6 +16,11 @@ from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+__all__ = ['RealTimeMonitor']
+
+# Longest wait between reconciling checks while the event stream is followed
+HOUSEKEEPING_INTERVAL = 60
+
 
 class RealTimeMonitor:
     """Real-time container monitoring for immediate failure detection."""
@@ -25,14 +33,22 @@ class RealTimeMonitor:
             config: Configuration instance
         """
         self.config = config or Config()
-        self.docker_client = DockerClient(self.config.docker_socket)
+        self.docker_client = DockerClient(
+            self.config.docker_socket,
+            max_stats_workers=self.config.docker_max_workers
+        )
         self.slack_notifier = SlackNotifier(self.config.slack_webhook_url)
         
         # Initialize components
-        self.state_tracker = StateTracker(self.docker_client, self.config.container_name_filter)
+        self.state_tracker = StateTracker(self.docker_client, self.config.container_name_filter_re)
         self.change_detector = ChangeDetector(self.state_tracker)
-        self.notification_manager = NotificationManager(self.slack_notifier, 120)  # 2 minutes cooldown
+        self.dispatcher = NotificationDispatcher(self.slack_notifier)
+        self.notification_manager = NotificationManager(
+            self.slack_notifier, 120, dispatcher=self.dispatcher,  # 2 minutes cooldown
+            state_path=self.config.cooldown_state_file
+        )
         self.monitoring_thread = MonitoringThread(self._check_for_changes)
+        self.event_watcher = EventWatcher(self.docker_client, self._on_docker_event)
         
         logger.info("Real-time monitor initialized")
     
@@ -41,17 +57,28 @@ class RealTimeMonitor:
         """Thread-safe monitoring status getter."""
         return self.monitoring_thread.monitoring
     
-    def start_monitoring(self, check_interval: int = 10) -> None:
+    def start_monitoring(self, check_interval: int = 10, use_events: Optional[bool] = None) -> None:
         """
         Start real-time monitoring in a background thread.
         
+        With use_events, Docker container events trigger a check right away;
+        the periodic checks then only reconcile what the stream may have
+        missed, backing off to HOUSEKEEPING_INTERVAL (or check_interval, if
+        longer) while idle.
+        
         Args:
             check_interval: Check interval in seconds (default: 10)
+            use_events: Follow the Docker event stream (default: True unless
+                the REALTIME_USE_POLLING setting forces plain polling)
         """
-        logger.info(f"Setting up real-time monitoring with {check_interval}s interval...")
+        if use_events is None:
+            use_events = not self.config.realtime_use_polling
+        mode = "event-driven" if use_events else "polling"
+        logger.info(f"Setting up {mode} real-time monitoring with {check_interval}s interval...")
         
         # Update monitoring thread interval
         self.monitoring_thread.check_interval = check_interval
+        self.monitoring_thread.max_interval = max(check_interval, HOUSEKEEPING_INTERVAL) if use_events else None
         
         # Initialize container states
         logger.info("Initializing container states...")
@@ -59,46 +86,86 @@ class RealTimeMonitor:
         
         # Start monitoring thread
         self.monitoring_thread.start()
+        if use_events:
+            self.event_watcher.start()
         
         logger.info(f"Real-time monitoring started (interval: {check_interval}s)")
     
     def stop_monitoring(self) -> None:
         """Stop real-time monitoring gracefully."""
         logger.info("Stopping real-time monitoring...")
+        self.event_watcher.stop()
         self.monitoring_thread.stop()
+        # Summarise folded bursts now rather than when their windows end
+        self.notification_manager.flush_bursts()
+        # Deliver notifications still queued from the last cycles
+        self.dispatcher.stop()
+        # Write cooldowns started by those deliveries without waiting for the timer
+        self.notification_manager.cooldown_manager.save()
         logger.info("Real-time monitoring stopped")
     
-    def _check_for_changes(self) -> None:
-        """Check for container state changes and send notifications."""
+    def _on_docker_event(self, event: Dict[str, Any]) -> None:
+        """
+        Run a check as soon as a container event arrives.
+        
+        Args:
+            event: Decoded Docker event (empty after a stream reconnect)
+        """
+        if event and logger.isEnabledFor(logging.DEBUG):
+            container_name = event.get('Actor', {}).get('Attributes', {}).get('name', 'unknown')
+            logger.debug("Docker event: %s for %s", event.get('Action'), container_name)
+        self.monitoring_thread.wake()
+    
+    def _check_for_changes(self) -> Optional[bool]:
+        """
+        Check for container state changes and send notifications.
+        
+        Returns:
+            True if changes were detected, False if not, None on error
+        """
         try:
             # Get current and previous container states
             current_states = self.state_tracker.get_current_states()
-            previous_states = self.state_tracker.get_previous_states()
+            previous_states = self.state_tracker.previous_states
             
             # Detect changes
             changes = self.change_detector.detect_changes(current_states, previous_states)
             
-            # Debug logging
-            if changes:
-                logger.info(f"Detected {len(changes)} changes")
+            # Counts (or "No changes detected") are logged by process_changes
+            if logger.isEnabledFor(logging.DEBUG):
                 for change in changes:
-                    container_name = change.get('container_name', change.get('container_info', {}).get('name', change.get('container_id', 'unknown')[:12]))
-                    logger.info(f"Change: {change['type']} for {container_name}")
-            else:
-                logger.info("No changes detected")
+                    logger.debug("Change: %s for %s", change['type'], change['display_name'])
             
             # Process changes and send notifications
             self.notification_manager.process_changes(changes)
             
             # Update previous states
             self.state_tracker.update_previous_states(current_states)
+            return bool(changes)
             
         except Exception as e:
             logger.error(f"Error checking for changes: {e}")
+            return None
+    
+    def wait_until_stopped(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until real-time monitoring stops.
+        
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            True if monitoring has stopped, False if the timeout expired first
+        """
+        return self.monitoring_thread.wait_until_stopped(timeout)
     
     def get_monitoring_status(self) -> Dict[str, Any]:
         """Get current monitoring status (thread-safe)."""
-        return self.monitoring_thread.get_status()
+        status = self.monitoring_thread.get_status()
+        status['event_stream'] = self.event_watcher.running
+        status['notifications_pending'] = self.dispatcher.pending
+        status['notifications_dropped'] = self.dispatcher.dropped
+        return status
 
     def test_restart_detection(self) -> None:
         """Test restart detection functionality."""
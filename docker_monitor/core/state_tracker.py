@@ -1,10 +1,11 @@
 """Container state tracking for monitoring."""
 
 import threading
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, List, Mapping, Optional
 from datetime import datetime
 
-from .docker_client import DockerClient
+from .docker_client import DockerClient, NameFilter
 from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -13,13 +14,17 @@ logger = get_logger(__name__)
 class StateTracker:
     """Manages container state persistence and retrieval."""
     
-    def __init__(self, docker_client: DockerClient, container_name_filter: Optional[str] = None):
+    def __init__(
+        self,
+        docker_client: DockerClient,
+        container_name_filter: Optional[NameFilter] = None
+    ):
         """
         Initialize state tracker.
         
         Args:
             docker_client: Docker client instance
-            container_name_filter: Optional container name filter
+            container_name_filter: Optional container name filter (regex, exact names or predicate)
         """
         self.docker_client = docker_client
         self.container_name_filter = container_name_filter
@@ -36,19 +41,22 @@ class StateTracker:
         Get current container states.
         
         Returns:
-            Dictionary mapping container names to their current states
+            Newly built dictionary mapping container names to their current
+            states; the caller owns it and may hand it to update_previous_states
         """
         try:
+            # State tracking never reads stats or environment variables
             containers = self.docker_client.get_containers(
                 include_stopped=True,
-                name_filter=self.container_name_filter
+                name_filter=self.container_name_filter,
+                with_stats=False,
+                with_env=False
             )
             
             states = {}
             container_info = {}
             
             for container in containers:
-                container_id = container.get('id', '')
                 container_name = container.get('name', '')
                 status = container.get('status', 'unknown')
                 
@@ -80,11 +88,14 @@ class StateTracker:
         """
         Update previous states (thread-safe).
         
+        The dictionary is stored without copying, so the caller must not
+        modify it afterwards; pass the result of get_current_states.
+        
         Args:
             states: New states to store as previous
         """
         with self._state_lock:
-            self._previous_states = states.copy()
+            self._previous_states = states
     
     def get_container_info(self, container_name: str) -> Dict[str, Any]:
         """
@@ -109,6 +120,36 @@ class StateTracker:
         with self._state_lock:
             return self._container_info.copy()
     
+    @property
+    def container_info_map(self) -> Mapping[str, Dict[str, Any]]:
+        """
+        Read-only view of the latest container info, keyed by container name.
+        
+        The underlying dict is replaced (never mutated) on each poll, so the
+        view is a consistent snapshot that hot loops can read without locking.
+        """
+        return MappingProxyType(self._container_info)
+    
+    @property
+    def previous_states(self) -> Mapping[str, str]:
+        """
+        Read-only view of the previous container states, keyed by container name.
+        
+        Like container_info_map, the underlying dict is replaced rather than
+        mutated, so the view needs no copy.
+        """
+        return MappingProxyType(self._previous_states)
+    
+    @property
+    def restart_counts(self) -> Mapping[str, int]:
+        """Read-only view of the recorded restart counts, keyed by container name."""
+        return MappingProxyType(self._previous_restart_counts)
+    
+    @property
+    def started_times(self) -> Mapping[str, str]:
+        """Read-only view of the recorded start times, keyed by container name."""
+        return MappingProxyType(self._previous_started_times)
+    
     def get_previous_restart_count(self, container_name: str) -> int:
         """
         Get previous restart count for a container (thread-safe).
@@ -122,6 +163,23 @@ class StateTracker:
         with self._state_lock:
             return self._previous_restart_counts.get(container_name, 0)
     
+    def get_restarted_containers(self, container_names: Iterable[str]) -> List[str]:
+        """
+        Get containers whose restart count grew since it was last recorded (thread-safe).
+        
+        Args:
+            container_names: Container names to check
+            
+        Returns:
+            Names of containers with a higher restart count than previously recorded
+        """
+        with self._state_lock:
+            return [
+                container_name for container_name in container_names
+                if self._container_info.get(container_name, {}).get('restart_count', 0)
+                > self._previous_restart_counts.get(container_name, 0)
+            ]
+    
     def update_restart_count(self, container_name: str, count: int) -> None:
         """
         Update restart count for a container (thread-safe).
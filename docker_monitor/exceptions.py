@@ -11,6 +11,11 @@ class ConnectionError(DockerMonitorError):
     pass
 
 
+class DockerClientError(DockerMonitorError):
+    """Docker client errors."""
+    pass
+
+
 class ConfigurationError(DockerMonitorError):
     """Configuration-related errors."""
     pass
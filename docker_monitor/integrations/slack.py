@@ -1,28 +1,87 @@
 """Slack integration for Docker Monitor."""
 
+from collections import Counter
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..utils.logging_config import get_logger
+from ..utils.rate_limit import TokenBucket
+from ..utils.serialization import json_dumps
 
 logger = get_logger(__name__)
 
+# Slack rejects messages with more attachments than this
+MAX_ATTACHMENTS_PER_MESSAGE = 100
+
+# Webhook responses worth retrying; Retry-After is honoured. Slack may
+# already have posted the message when it answers 5xx, so those are not
+# retried to avoid duplicate alerts
+RETRY_STATUSES = (429,)
+
+# Webhook posts per second and burst; Slack allows about one message per
+# second per webhook and answers faster bursts with 429
+SLACK_POST_RATE = 1.0
+SLACK_POST_BURST = 3
+
 
 class SlackNotifier:
     """Slack notification handler."""
     
-    def __init__(self, webhook_url: str):
+    def __init__(self, webhook_url: str, post_rate: float = SLACK_POST_RATE,
+                 post_burst: int = SLACK_POST_BURST):
         """
         Initialize Slack notifier.
         
         Args:
             webhook_url: Slack webhook URL
+            post_rate: Sustained webhook posts per second (default: 1)
+            post_burst: Posts allowed back to back before pacing starts (default: 3)
         """
         self.webhook_url = webhook_url
         if not webhook_url:
             raise ValueError("Slack webhook URL is required")
+        
+        # Keep-alive session so consecutive posts reuse the TLS connection
+        self._session = requests.Session()
+        self._session.headers['Content-Type'] = 'application/json'
+        retry = Retry(
+            total=3,
+            # A read failure may follow a delivered post; only connect
+            # failures and rate limits are safe to resend
+            read=0,
+            backoff_factor=0.2,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({'POST'}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self._session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry))
+        # Shared by every post so reports, alerts and batches together stay under the limit
+        self._post_limiter = TokenBucket(post_rate, post_burst)
+    
+    def close(self) -> None:
+        """Close pooled webhook connections."""
+        self._session.close()
+    
+    def _post(self, message: Dict[str, Any]) -> None:
+        """
+        Post a message to the webhook.
+        
+        Blocks while the post rate limit is exhausted instead of letting
+        Slack reject the message.
+        
+        Args:
+            message: Slack message payload
+            
+        Raises:
+            requests.RequestException: If the request fails or Slack returns an error
+        """
+        self._post_limiter.acquire()
+        response = self._session.post(self.webhook_url, data=json_dumps(message), timeout=30)
+        response.raise_for_status()
     
     def send_container_report(
         self,
@@ -40,14 +99,8 @@ class SlackNotifier:
             True if successful, False otherwise
         """
         try:
-            message = self._create_status_message(container_info, system_info)
-            response = requests.post(
-                self.webhook_url,
-                json=message,
-                headers={'Content-Type': 'application/json'},
-                timeout=30
-            )
-            response.raise_for_status()
+            message = self.create_status_message(container_info, system_info)
+            self._post(message)
             logger.info("Successfully sent container report to Slack")
             return True
         except Exception as e:
@@ -67,13 +120,7 @@ class SlackNotifier:
         """
         try:
             message = self._create_error_message(error_message, context)
-            response = requests.post(
-                self.webhook_url,
-                json=message,
-                headers={'Content-Type': 'application/json'},
-                timeout=30
-            )
-            response.raise_for_status()
+            self._post(message)
             logger.info("Successfully sent error notification to Slack")
             return True
         except Exception as e:
@@ -110,25 +157,54 @@ class SlackNotifier:
                 ]
             }
             
-            response = requests.post(
-                self.webhook_url,
-                json=slack_message,
-                headers={'Content-Type': 'application/json'},
-                timeout=30
-            )
-            response.raise_for_status()
+            self._post(slack_message)
             logger.info(f"Successfully sent custom message to Slack: {title}")
             return True
         except Exception as e:
             logger.error(f"Failed to send custom message: {e}")
             return False
     
-    def _create_status_message(
+    def send_batch(self, attachments: List[Dict[str, Any]]) -> bool:
+        """
+        Send several attachments as one Slack message.
+        
+        Batches larger than MAX_ATTACHMENTS_PER_MESSAGE are split into
+        consecutive messages.
+        
+        Args:
+            attachments: Slack attachments to send
+            
+        Returns:
+            True if every message was sent, False otherwise
+        """
+        success = True
+        for start in range(0, len(attachments), MAX_ATTACHMENTS_PER_MESSAGE):
+            chunk = attachments[start:start + MAX_ATTACHMENTS_PER_MESSAGE]
+            try:
+                self._post({"attachments": chunk})
+            except Exception as e:
+                logger.error(f"Failed to send batch of {len(chunk)} notifications: {e}")
+                success = False
+        
+        if success and attachments:
+            logger.info(f"Successfully sent {len(attachments)} notifications to Slack")
+        return success
+    
+    def create_status_message(
         self,
         container_info: List[Dict[str, Any]],
         system_info: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Create Slack message for container status report."""
+        """
+        Create Slack message for container status report.
+        
+        Args:
+            container_info: List of container information
+            system_info: Optional system information
+            
+        Returns:
+            Slack message with a single report attachment
+        """
         
         # Count containers by status
         status_counts = self._count_containers_by_status(container_info)
@@ -180,15 +256,9 @@ class SlackNotifier:
                 "short": True
             })
         
-        # Create container details
-        container_blocks = []
-        for container in container_info:
-            container_text = self._format_container_details(container)
-            container_blocks.append(container_text)
-        
-        # Combine all details
-        if container_blocks:
-            main_attachment["text"] = "\n\n".join(container_blocks)
+        # Combine all container details in a single join
+        if container_info:
+            main_attachment["text"] = "\n\n".join(map(self._format_container_details, container_info))
         
         return {"attachments": [main_attachment]}
     
@@ -212,11 +282,7 @@ class SlackNotifier:
     
     def _count_containers_by_status(self, container_info: List[Dict[str, Any]]) -> Dict[str, int]:
         """Count containers by their status."""
-        status_counts = {}
-        for container in container_info:
-            status = container.get('status', 'unknown')
-            status_counts[status] = status_counts.get(status, 0) + 1
-        return status_counts
+        return dict(Counter(container.get('status', 'unknown') for container in container_info))
     
     def _format_container_details(self, container: Dict[str, Any]) -> str:
         """Format container details for Slack."""
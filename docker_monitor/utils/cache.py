@@ -0,0 +1,47 @@
+"""Small caching helpers for Docker Monitor."""
+
+import threading
+import time
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class CachedValue(Generic[T]):
+    """Value produced by a loader and reused until it expires (thread-safe)."""
+    
+    def __init__(self, loader: Callable[[], T], ttl: Optional[float] = None):
+        """
+        Initialize cached value.
+        
+        Args:
+            loader: Callable producing the value; exceptions propagate and
+                nothing is cached
+            ttl: Seconds the value stays valid, or None to keep it until
+                invalidated (default: None)
+        """
+        self.loader = loader
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._value: Optional[T] = None
+        self._expires_at: Optional[float] = None
+    
+    def get(self) -> T:
+        """
+        Get the cached value, loading it if missing or expired.
+        
+        Returns:
+            The cached or freshly loaded value
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._expires_at is None or now >= self._expires_at:
+                self._value = self.loader()
+                self._expires_at = now + self.ttl if self.ttl is not None else float('inf')
+            return self._value
+    
+    def invalidate(self) -> None:
+        """Drop the cached value so the next get() reloads it."""
+        with self._lock:
+            self._value = None
+            self._expires_at = None
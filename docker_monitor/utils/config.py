@@ -1,9 +1,11 @@
 """Configuration management for Docker Monitor."""
 
 import os
+import re
 import logging
+import functools
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Pattern
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
@@ -104,12 +106,49 @@ class Config:
         """Check if stopped containers should be included."""
         return self.get("INCLUDE_STOPPED_CONTAINERS", "true").lower() == "true"
     
+    @property
+    def stream_stats(self) -> bool:
+        """Check if container stats should be streamed by background samplers."""
+        return self.get("STREAM_STATS", "false").lower() == "true"
+    
+    @property
+    def realtime_use_polling(self) -> bool:
+        """Check if real-time monitoring should poll only, without the Docker event stream."""
+        return self.get("REALTIME_USE_POLLING", "false").lower() == "true"
+    
+    @property
+    def docker_max_workers(self) -> int:
+        """Get the maximum number of concurrent Docker inspect and stats requests."""
+        value = self.get("DOCKER_MAX_WORKERS", "32")
+        try:
+            return max(1, int(value))
+        except ValueError:
+            logger.warning(f"Invalid DOCKER_MAX_WORKERS value {value!r}, using 32")
+            return 32
+    
     @property
     def container_name_filter(self) -> Optional[str]:
         """Get container name filter regex pattern."""
         value = self.get("CONTAINER_NAME_FILTER")
         return value if value else None
     
+    @property
+    def cooldown_state_file(self) -> Optional[str]:
+        """Get the file that keeps notification cooldowns across restarts, if any."""
+        value = self.get("COOLDOWN_STATE_FILE")
+        return value if value else None
+    
+    @functools.cached_property
+    def container_name_filter_re(self) -> Optional[Pattern[str]]:
+        """
+        Get the container name filter compiled once per Config instance.
+        
+        Raises:
+            re.error: If the filter is not a valid regular expression
+        """
+        pattern = self.container_name_filter
+        return re.compile(pattern) if pattern else None
+    
     def get(self, key: str, default: Optional[str] = None, required: bool = False) -> str:
         """
         Get configuration value from environment.
@@ -143,4 +182,8 @@ class Config:
             "notification_enabled": self.notification_enabled,
             "include_stopped_containers": self.include_stopped_containers,
             "container_name_filter": self.container_name_filter,
+            "stream_stats": self.stream_stats,
+            "docker_max_workers": self.docker_max_workers,
+            "realtime_use_polling": self.realtime_use_polling,
+            "cooldown_state_file": self.cooldown_state_file,
         }
\ No newline at end of file
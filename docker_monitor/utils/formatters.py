@@ -1,6 +1,6 @@
 """Formatting utilities for Docker Monitor."""
 
-from typing import Dict, Any, Union
+from typing import Dict, Any, List, Optional, Union
 
 
 class ByteFormatter:
@@ -56,6 +56,34 @@ class PortFormatter:
                 port_strings.append(str(internal_port))
         
         return ", ".join(port_strings) if port_strings else "No exposed ports"
+    
+    @staticmethod
+    def format_port_list(ports: Optional[List[Dict[str, Any]]]) -> str:
+        """
+        Format the port list of a ``/containers/json`` entry for display.
+        
+        Produces the same output as ``format_ports`` does for the
+        ``NetworkSettings.Ports`` mapping of an inspected container.
+        
+        Args:
+            ports: List of dictionaries with PrivatePort, PublicPort and Type
+            
+        Returns:
+            Formatted port string
+        """
+        if not ports:
+            return "No exposed ports"
+        
+        port_strings = []
+        for port in ports:
+            internal_port = f"{port.get('PrivatePort')}/{port.get('Type', 'tcp')}"
+            public_port = port.get('PublicPort')
+            if public_port:
+                port_strings.append(f"{public_port}→{internal_port}")
+            else:
+                port_strings.append(internal_port)
+        
+        return ", ".join(port_strings)
 
 
 class ContainerStatsFormatter:
@@ -0,0 +1,73 @@
+"""Rate limiting helpers for Docker Monitor."""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Token bucket rate limiter (thread-safe)."""
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize token bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens, i.e. the allowed burst
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("Token bucket rate and capacity must be positive")
+        
+        self.rate = rate
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+    
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill; caller holds the lock."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+    
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """
+        Take tokens if they are available, without waiting.
+        
+        Args:
+            tokens: Number of tokens to take (default: 1)
+        
+        Returns:
+            True if the tokens were taken, False otherwise
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+    
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Take tokens, sleeping until enough have accrued.
+        
+        Args:
+            tokens: Number of tokens to take (default: 1)
+            timeout: Maximum seconds to wait, or None to wait as long as needed
+        
+        Returns:
+            True if the tokens were taken, False if the timeout expired first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+            
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
@@ -0,0 +1,51 @@
+"""JSON serialization helpers with optional orjson acceleration."""
+
+import json
+from datetime import date
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Whether the faster orjson codec is in use
+HAS_ORJSON = orjson is not None
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode JSON, using orjson when it is installed.
+    
+    Args:
+        data: JSON document as bytes or str
+        
+    Returns:
+        Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+
+def _default(value: Any) -> Any:
+    """Encode dates and datetimes like orjson does (ISO 8601)."""
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_dumps(value: Any) -> bytes:
+    """
+    Encode a value as compact UTF-8 JSON, using orjson when it is installed.
+    
+    Args:
+        value: Object to encode; dates and datetimes become ISO 8601 strings
+        
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=_default).encode('utf-8')
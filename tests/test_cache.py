@@ -0,0 +1,42 @@
+"""Tests for caching helpers."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from docker_monitor.utils.cache import CachedValue
+
+
+class TestCachedValue:
+    """Test cases for CachedValue class."""
+
+    @patch('docker_monitor.utils.cache.time.monotonic')
+    def test_value_reused_until_expiry(self, mock_monotonic):
+        """Test that the loader runs again only after the TTL."""
+        loader = MagicMock(side_effect=[1, 2])
+        cached = CachedValue(loader, ttl=30)
+
+        mock_monotonic.return_value = 100.0
+        assert cached.get() == 1
+        mock_monotonic.return_value = 129.0
+        assert cached.get() == 1
+        mock_monotonic.return_value = 130.0
+        assert cached.get() == 2
+        assert loader.call_count == 2
+
+    def test_invalidate_forces_reload(self):
+        """Test that invalidate() drops a value without TTL."""
+        loader = MagicMock(side_effect=['a', 'b'])
+        cached = CachedValue(loader)
+
+        assert cached.get() == 'a'
+        assert cached.get() == 'a'
+        cached.invalidate()
+        assert cached.get() == 'b'
+
+    def test_loader_errors_not_cached(self):
+        """Test that a failing loader is retried on the next get()."""
+        loader = MagicMock(side_effect=[RuntimeError('down'), 'ok'])
+        cached = CachedValue(loader, ttl=30)
+
+        with pytest.raises(RuntimeError):
+            cached.get()
+        assert cached.get() == 'ok'
@@ -0,0 +1,182 @@
+"""Tests for container change detection."""
+
+import pytest
+from unittest.mock import MagicMock
+from docker_monitor.core.state_tracker import StateTracker
+from docker_monitor.core.change_detector import ChangeDetector
+
+
+def make_container(name, status='running', restart_count=0, started='2024-01-01T00:00:00Z'):
+    """Build a container info dictionary as returned by DockerClient."""
+    return {
+        'name': name,
+        'id': f'{name}-id',
+        'status': status,
+        'restart_count': restart_count,
+        'started': started
+    }
+
+
+@pytest.fixture
+def docker_client():
+    """Docker client mock returning a configurable container list."""
+    client = MagicMock()
+    client.get_containers.return_value = []
+    return client
+
+
+@pytest.fixture
+def tracker(docker_client):
+    """State tracker backed by the mocked Docker client."""
+    return StateTracker(docker_client)
+
+
+@pytest.fixture
+def detector(tracker):
+    """Change detector under test."""
+    return ChangeDetector(tracker)
+
+
+def poll(tracker, docker_client, containers):
+    """Simulate one polling cycle and return (current, previous) states."""
+    docker_client.get_containers.return_value = containers
+    current_states = tracker.get_current_states()
+    return current_states, tracker.get_previous_states()
+
+
+class TestChangeDetector:
+    """Test cases for ChangeDetector class."""
+
+    def test_no_changes_when_states_identical(self, tracker, docker_client, detector):
+        """Test that a quiet host produces no changes."""
+        docker_client.get_containers.return_value = [make_container('web'), make_container('db')]
+        tracker.initialize_states()
+
+        current, previous = poll(tracker, docker_client, [make_container('web'), make_container('db')])
+
+        assert detector.detect_changes(current, previous) == []
+
+    def test_added_and_removed_containers(self, tracker, docker_client, detector):
+        """Test detection of new and removed containers."""
+        docker_client.get_containers.return_value = [make_container('web'), make_container('old')]
+        tracker.initialize_states()
+
+        current, previous = poll(tracker, docker_client, [make_container('web'), make_container('new')])
+        changes = detector.detect_changes(current, previous)
+
+        by_type = {change['type']: change for change in changes}
+        assert set(by_type) == {'container_added', 'container_removed'}
+        assert by_type['container_added']['container_name'] == 'new'
+        assert by_type['container_removed']['container_name'] == 'old'
+        assert by_type['container_removed']['previous_status'] == 'running'
+
+    def test_stop_and_start_events(self, tracker, docker_client, detector):
+        """Test classification of stop and start transitions."""
+        docker_client.get_containers.return_value = [
+            make_container('web'), make_container('worker', status='exited')
+        ]
+        tracker.initialize_states()
+
+        current, previous = poll(tracker, docker_client, [
+            make_container('web', status='exited'),
+            make_container('worker', started='2024-01-01T00:00:00Z')
+        ])
+        changes = detector.detect_changes(current, previous)
+
+        types = {change['container_name']: change['type'] for change in changes}
+        assert types == {'web': 'container_stopped', 'worker': 'container_started'}
+
+    def test_changes_share_one_timestamp(self, tracker, docker_client, detector):
+        """Test that all changes from one pass carry the same timestamp."""
+        docker_client.get_containers.return_value = [make_container('a'), make_container('b')]
+        tracker.initialize_states()
+
+        current, previous = poll(tracker, docker_client, [
+            make_container('a', status='exited'), make_container('c')
+        ])
+        changes = detector.detect_changes(current, previous)
+
+        assert len(changes) == 3
+        assert len({change['timestamp'] for change in changes}) == 1
+
+    def test_new_container_first_in_iteration(self, tracker, docker_client, detector):
+        """Test that new containers never go through the state-change path."""
+        current, previous = poll(tracker, docker_client, [make_container('fresh', restart_count=3)])
+
+        changes = detector.detect_changes(current, previous)
+
+        assert [change['type'] for change in changes] == ['container_added']
+
+    def test_automatic_restart_detected_with_identical_states(self, tracker, docker_client, detector):
+        """Test that the unchanged-states fast path still reports auto-restarts."""
+        docker_client.get_containers.return_value = [make_container('web'), make_container('db')]
+        tracker.initialize_states()
+
+        current, previous = poll(tracker, docker_client, [
+            make_container('web', restart_count=2), make_container('db')
+        ])
+        changes = detector.detect_changes(current, previous)
+
+        assert len(changes) == 1
+        assert changes[0]['type'] == 'container_restarted'
+        assert changes[0]['restart_type'] == 'automatic'
+        assert changes[0]['current_restart_count'] == 2
+        assert tracker.get_previous_restart_count('web') == 2
+
+    def test_automatic_restart_reported_once(self, tracker, docker_client, detector):
+        """Test that an auto-restart is not also reported as a manual restart."""
+        docker_client.get_containers.return_value = [make_container('web', status='exited')]
+        tracker.initialize_states()
+
+        current, previous = poll(tracker, docker_client, [
+            make_container('web', restart_count=1, started='2024-01-02T00:00:00Z')
+        ])
+        changes = detector.detect_changes(current, previous)
+        tracker.update_previous_states(current)
+
+        assert [change['restart_type'] for change in changes] == ['automatic']
+
+        current, previous = poll(tracker, docker_client, [
+            make_container('web', restart_count=1, started='2024-01-02T00:00:00Z')
+        ])
+        assert detector.detect_changes(current, previous) == []
+
+    def test_manual_restart_detected(self, tracker, docker_client, detector):
+        """Test that a changed start time after a stop is a manual restart."""
+        docker_client.get_containers.return_value = [make_container('web', status='exited')]
+        tracker.initialize_states()
+
+        current, previous = poll(tracker, docker_client, [
+            make_container('web', started='2024-01-02T00:00:00Z')
+        ])
+        changes = detector.detect_changes(current, previous)
+
+        assert len(changes) == 1
+        assert changes[0]['restart_type'] == 'manual'
+        assert changes[0]['current_started_time'] == '2024-01-02T00:00:00Z'
+
+    def test_auto_restart_found_among_other_changes(self, tracker, docker_client, detector):
+        """Test that a status-stable auto-restart is reported when other containers change."""
+        docker_client.get_containers.return_value = [make_container('web'), make_container('db')]
+        tracker.initialize_states()
+
+        current, previous = poll(tracker, docker_client, [
+            make_container('web', restart_count=1), make_container('db', status='exited')
+        ])
+        changes = detector.detect_changes(current, previous)
+
+        assert sorted((change['type'], change['container_name']) for change in changes) == [
+            ('container_restarted', 'web'), ('container_stopped', 'db')
+        ]
+
+    def test_states_handed_over_without_copy(self, tracker, docker_client):
+        """Test that each poll builds a fresh dict that becomes the previous states as is."""
+        docker_client.get_containers.return_value = [make_container('web')]
+        first = tracker.get_current_states()
+        second = tracker.get_current_states()
+        assert first is not second
+
+        tracker.update_previous_states(second)
+
+        assert tracker._previous_states is second
+        assert tracker.previous_states == {'web': 'running'}
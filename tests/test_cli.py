@@ -0,0 +1,163 @@
+"""Tests for the command-line interface."""
+
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+from docker_monitor.cli.main import (
+    create_argument_parser, parse_args, _parse_fast, main, handle_status_mode, handle_test_mode
+)
+
+
+class TestArgumentParser:
+    """Test cases for CLI argument parsing."""
+
+    def test_parser_is_cached(self):
+        """Test that the parser is only built once per process."""
+        assert create_argument_parser() is create_argument_parser()
+
+    def test_cached_parser_parses_repeatedly(self):
+        """Test that reusing the parser does not leak state between parses."""
+        parser = create_argument_parser()
+
+        first = parser.parse_args(['--continuous', '5'])
+        second = parser.parse_args(['--once'])
+
+        assert first.continuous == 5
+        assert second.continuous is None
+        assert second.once is True
+
+    def test_mode_is_required(self):
+        """Test that omitting an execution mode is an error."""
+        with pytest.raises(SystemExit):
+            create_argument_parser().parse_args([])
+
+
+class TestParseArgs:
+    """Test cases for the fast argument scanner."""
+
+    @pytest.mark.parametrize('argv', [
+        ['--once'],
+        ['--scheduled', '--log-level', 'DEBUG'],
+        ['--continuous', '5', '--no-notifications'],
+        ['--continuous=15', '-v'],
+        ['--realtime'],
+        ['--realtime', '30', '--filter', '^web-'],
+        ['--realtime=3', '--exclude-stopped'],
+        ['--test', '--config', '/tmp/monitor.env'],
+        ['--status', '--filter=api|worker'],
+        ['--test-notification', '--include-stopped'],
+        ['--test-restart', '--verbose'],
+    ])
+    def test_fast_path_matches_argparse(self, argv):
+        """Test that the fast scanner agrees with argparse."""
+        fast = _parse_fast(argv)
+        expected = create_argument_parser().parse_args(argv)
+
+        assert fast is not None
+        assert vars(fast) == vars(expected)
+
+    @pytest.mark.parametrize('argv', [
+        [],
+        ['--once', '--test'],
+        ['--continuous', 'abc'],
+        ['--continuous', '²'],
+        ['--realtime', '²'],
+        ['--log-level', 'TRACE'],
+        ['--cont', '5'],
+        ['--help'],
+        ['extra'],
+    ])
+    def test_unrecognised_input_falls_back(self, argv):
+        """Test that unusual command lines are left to argparse."""
+        assert _parse_fast(argv) is None
+
+    def test_fallback_reports_usage_errors(self):
+        """Test that conflicting modes still exit with a usage error."""
+        with pytest.raises(SystemExit) as exc_info:
+            parse_args(['--once', '--test'])
+        assert exc_info.value.code == 2
+
+    def test_non_ascii_digits_are_usage_errors(self):
+        """Test that digits int() rejects give a usage error, not a traceback."""
+        with pytest.raises(SystemExit) as exc_info:
+            parse_args(['--realtime', '²'])
+        assert exc_info.value.code == 2
+
+    def test_fallback_accepts_abbreviations(self):
+        """Test that argparse prefix matching still works via the fallback."""
+        args = parse_args(['--cont', '5'])
+        assert args.continuous == 5
+
+
+class TestMain:
+    """Test cases for the CLI entry point."""
+
+    @patch('docker_monitor.core.docker_monitor.DockerMonitor')
+    @patch('docker_monitor.utils.config.Config')
+    def test_config_created_once_with_overrides(self, mock_config, mock_monitor):
+        """Test that all command line overrides are applied before one Config load."""
+        mock_monitor.return_value.run_check.return_value = True
+        argv = [
+            '--once', '--log-level', 'DEBUG', '--no-notifications',
+            '--exclude-stopped', '--filter', '^web-'
+        ]
+
+        with patch.dict(os.environ, {}, clear=True):
+            assert main(argv) == 0
+            assert os.environ['LOG_LEVEL'] == 'DEBUG'
+            assert os.environ['NOTIFICATION_ENABLED'] == 'false'
+            assert os.environ['INCLUDE_STOPPED_CONTAINERS'] == 'false'
+            assert os.environ['CONTAINER_NAME_FILTER'] == '^web-'
+
+        mock_config.assert_called_once_with(env_file=None)
+
+    @patch('docker_monitor.utils.config.Config')
+    def test_invalid_filter_fails_fast(self, mock_config, capsys):
+        """Test that a bad --filter regex is rejected before loading config."""
+        assert main(['--once', '--filter', '(unclosed']) == 2
+
+        assert 'Bad --filter regex' in capsys.readouterr().out
+        mock_config.assert_not_called()
+
+
+class TestReportOutput:
+    """Test cases for the buffered report handlers."""
+
+    def test_status_mode_writes_once(self):
+        """Test that the status report is emitted with a single write."""
+        monitor = MagicMock()
+        monitor.get_status_summary.return_value = {
+            'system_info': {'server_version': '24.0', 'cpus': 4},
+            'total_containers': 2,
+            'status_counts': {'running': 2},
+            'connections': {'docker': True, 'slack': False}
+        }
+
+        with patch('docker_monitor.cli.main.sys.stdout') as mock_stdout:
+            assert handle_status_mode(monitor) == 0
+
+        mock_stdout.write.assert_called_once()
+        output = mock_stdout.write.call_args[0][0]
+        assert 'Docker Version:     24.0' in output
+        assert 'Running         2' in output
+        assert 'Slack           ❌ Disconnected' in output
+
+    def test_test_mode_reports_failure(self):
+        """Test that a failed connection is reported with exit code 1."""
+        writes_before_probe = []
+
+        def test_connections():
+            writes_before_probe.append(mock_stdout.write.call_count)
+            return {'docker': True, 'slack': False}
+
+        monitor = MagicMock()
+        monitor.test_connections.side_effect = test_connections
+
+        with patch('docker_monitor.cli.main.sys.stdout') as mock_stdout:
+            assert handle_test_mode(monitor) == 1
+
+        # The banner is written before the probes, the results in one write after
+        assert writes_before_probe == [1]
+        banner, results = [c.args[0] for c in mock_stdout.write.call_args_list]
+        assert banner.startswith('🧪 Testing Docker Monitor connections')
+        assert 'Some connections failed' in results
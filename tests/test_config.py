@@ -55,4 +55,42 @@ class TestConfig:
             config_dict = config.get_all()
             assert isinstance(config_dict, dict)
             assert 'slack_webhook_url' in config_dict
-            assert 'log_level' in config_dict 
\ No newline at end of file
+            assert 'log_level' in config_dict
+
+    def test_container_name_filter_compiled_once(self):
+        """Test that the name filter is compiled and cached per Config."""
+        env_vars = {
+            'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/test',
+            'CONTAINER_NAME_FILTER': '^web-'
+        }
+        with patch.dict(os.environ, env_vars, clear=True):
+            config = Config()
+            pattern = config.container_name_filter_re
+            assert pattern.search('web-1')
+            assert not pattern.search('db-1')
+            assert config.container_name_filter_re is pattern
+    
+    def test_container_name_filter_re_unset(self):
+        """Test that no compiled filter is returned when unset."""
+        with patch.dict(os.environ, {'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/test'}, clear=True):
+            assert Config().container_name_filter_re is None
+    
+    def test_docker_max_workers(self):
+        """Test that the worker count is parsed and invalid values fall back to 32."""
+        env_vars = {'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/test', 'DOCKER_MAX_WORKERS': '64'}
+        with patch.dict(os.environ, env_vars, clear=True):
+            assert Config().docker_max_workers == 64
+        
+        env_vars['DOCKER_MAX_WORKERS'] = 'many'
+        with patch.dict(os.environ, env_vars, clear=True):
+            assert Config().docker_max_workers == 32
+    
+    def test_realtime_use_polling(self):
+        """Test that the event stream is used unless polling is forced."""
+        env_vars = {'SLACK_WEBHOOK_URL': 'https://hooks.slack.com/test'}
+        with patch.dict(os.environ, env_vars, clear=True):
+            assert Config().realtime_use_polling is False
+        
+        env_vars['REALTIME_USE_POLLING'] = 'TRUE'
+        with patch.dict(os.environ, env_vars, clear=True):
+            assert Config().realtime_use_polling is True
@@ -0,0 +1,113 @@
+"""Tests for notification cooldown management."""
+
+from unittest.mock import patch
+from docker_monitor.core.cooldown_manager import CooldownManager
+
+
+class TestCooldownManager:
+    """Test cases for CooldownManager class."""
+
+    def test_unknown_container_not_in_cooldown(self):
+        """Test that containers without notifications are not in cooldown."""
+        manager = CooldownManager(cooldown_seconds=60)
+
+        assert manager.is_in_cooldown('web') is False
+        assert manager.get_cooldown_remaining('web') == 0
+
+    @patch('docker_monitor.core.cooldown_manager.time.monotonic')
+    def test_cooldown_expires(self, mock_monotonic):
+        """Test that a cooldown lasts exactly cooldown_seconds."""
+        manager = CooldownManager(cooldown_seconds=60)
+
+        mock_monotonic.return_value = 1000.0
+        manager.update_cooldown('web')
+
+        mock_monotonic.return_value = 1030.0
+        assert manager.is_in_cooldown('web') is True
+        assert manager.get_cooldown_remaining('web') == 30.0
+        assert manager.get_all_cooldowns() == {'web': 30.0}
+
+        mock_monotonic.return_value = 1060.0
+        assert manager.is_in_cooldown('web') is False
+        assert manager.get_all_cooldowns() == {}
+
+    def test_clear_cooldown(self):
+        """Test that clearing a cooldown takes effect immediately."""
+        manager = CooldownManager(cooldown_seconds=60)
+        manager.update_cooldown('web')
+
+        manager.clear_cooldown('web')
+
+        assert manager.is_in_cooldown('web') is False
+
+    @patch('docker_monitor.core.cooldown_manager.time.monotonic')
+    def test_prune_removes_expired_entries(self, mock_monotonic):
+        """Test that pruning keeps only active cooldowns."""
+        manager = CooldownManager(cooldown_seconds=60)
+
+        mock_monotonic.return_value = 1000.0
+        manager.update_cooldown('old')
+        mock_monotonic.return_value = 1050.0
+        manager.update_cooldown('recent')
+
+        mock_monotonic.return_value = 1070.0
+        assert manager.prune() == 1
+        assert manager.get_all_cooldowns() == {'recent': 40.0}
+
+    @patch('docker_monitor.core.cooldown_manager.time.monotonic')
+    def test_updates_prune_periodically(self, mock_monotonic):
+        """Test that expired entries are dropped after prune_every updates."""
+        manager = CooldownManager(cooldown_seconds=60, prune_every=2)
+
+        mock_monotonic.return_value = 1000.0
+        manager.update_cooldown('old')
+        mock_monotonic.return_value = 2000.0
+        manager.update_cooldown('new')
+
+        stored = set().union(*manager._shards)
+        assert 'old' not in stored
+        assert 'new' in stored
+
+    def test_entries_spread_across_shards(self):
+        """Test that each container is stored only in its own shard."""
+        manager = CooldownManager(cooldown_seconds=60)
+        names = [f'container-{i}' for i in range(64)]
+
+        for name in names:
+            manager.update_cooldown(name)
+
+        for index, shard in enumerate(manager._shards):
+            assert all(manager._shard(name) == index for name in shard)
+        assert sorted(manager.get_all_cooldowns()) == sorted(names)
+
+    def test_cooldowns_survive_restart(self, tmp_path):
+        """Test that saved cooldowns are restored by a new manager."""
+        state_path = tmp_path / 'cooldowns.json'
+        manager = CooldownManager(cooldown_seconds=60, state_path=state_path)
+        manager.update_cooldown('web')
+        manager.save()
+
+        restored = CooldownManager(cooldown_seconds=60, state_path=state_path)
+
+        assert restored.is_in_cooldown('web') is True
+        assert 59 < restored.get_cooldown_remaining('web') <= 60
+
+    def test_expired_and_unreadable_state_ignored(self, tmp_path):
+        """Test that expired entries and corrupt files do not restore cooldowns."""
+        state_path = tmp_path / 'cooldowns.json'
+        state_path.write_text('{"web": 1.0}')
+        assert CooldownManager(state_path=state_path).get_all_cooldowns() == {}
+
+        state_path.write_text('not json')
+        assert CooldownManager(state_path=state_path).get_all_cooldowns() == {}
+
+    @patch('docker_monitor.core.cooldown_manager.threading.Timer')
+    def test_updates_share_one_delayed_save(self, mock_timer, tmp_path):
+        """Test that updates in quick succession schedule a single save."""
+        manager = CooldownManager(cooldown_seconds=60, state_path=tmp_path / 'cooldowns.json')
+
+        manager.update_cooldown('web')
+        manager.update_cooldown('db')
+
+        mock_timer.assert_called_once_with(2.0, manager.save)
+        mock_timer.return_value.start.assert_called_once()
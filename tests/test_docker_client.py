@@ -0,0 +1,501 @@
+"""Tests for the Docker client wrapper."""
+
+import re
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+from docker.errors import APIError, NotFound
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from docker_monitor.core.docker_client import DockerClient, _container_name
+from docker_monitor.exceptions import ConnectionError
+
+
+def make_summary(name, state='running'):
+    """Build a /containers/json entry as returned by the low-level API."""
+    return {
+        'Id': f'{name}-full-id',
+        'Names': [f'/{name}'],
+        'Image': 'nginx:latest',
+        'State': state,
+        'Ports': [{'PrivatePort': 80, 'PublicPort': 8080, 'Type': 'tcp'}],
+        'Labels': {}
+    }
+
+
+def make_inspect(restart_count=0):
+    """Build the inspect payload for a container."""
+    return {
+        'Created': '2024-01-01T00:00:00Z',
+        'State': {'StartedAt': '2024-01-01T00:00:00Z'},
+        'RestartCount': restart_count,
+        'Config': {'Env': []}
+    }
+
+
+def fake_stats(container_id, stream=True, decode=False):
+    """Answer one-shot stats requests with an empty sample and streams with no samples."""
+    return iter(()) if stream else {}
+
+
+@pytest.fixture
+def sdk_client():
+    """Mocked docker SDK client returned by docker.from_env()."""
+    with patch('docker_monitor.core.docker_client.docker.from_env') as from_env:
+        sdk = from_env.return_value
+        sdk.api.containers.return_value = []
+        sdk.api.inspect_container.side_effect = lambda container_id: make_inspect()
+        sdk.api.stats.side_effect = fake_stats
+        yield sdk
+
+
+@pytest.fixture
+def client(sdk_client):
+    """DockerClient connected to the mocked SDK client."""
+    docker_client = DockerClient()
+    yield docker_client
+    docker_client.close()
+
+
+def stats_ids(sdk_client):
+    """Return the container IDs one-shot stats were requested for."""
+    return [c.args[0] for c in sdk_client.api.stats.call_args_list if c.kwargs.get('stream') is False]
+
+
+class TestGetContainers:
+    """Test cases for DockerClient.get_containers."""
+
+    def test_info_built_from_list_and_inspect(self, client, sdk_client):
+        """Test that one list call plus inspect yields the full info dict."""
+        sdk_client.api.containers.return_value = [make_summary('web')]
+        sdk_client.api.inspect_container.side_effect = lambda container_id: make_inspect(3)
+
+        [info] = client.get_containers()
+
+        assert info['name'] == 'web'
+        assert info['id'] == 'web-full-id'[:12]
+        assert info['status'] == 'running'
+        assert info['image'] == 'nginx:latest'
+        assert info['ports'] == '8080→80/tcp'
+        assert info['restart_count'] == 3
+        sdk_client.api.containers.assert_called_once_with(all=True, filters=None)
+        sdk_client.images.get.assert_not_called()
+
+    @pytest.mark.parametrize('image, expected', [
+        ('redis:7', 'redis:7'),
+        ('sha256:0123456789abcdef0123', 'sha256:0123456789'),
+        ('', 'sha256:fedcba9876'),
+    ])
+    def test_image_name_from_list_entry(self, client, image, expected):
+        """Test that image names never need an image inspect."""
+        summary = {'Image': image, 'ImageID': 'sha256:fedcba9876543210'}
+
+        assert client._get_image_name(summary) == expected
+
+    def test_list_only_fields_skip_inspect(self, client, sdk_client):
+        """Test that fields from the list payload need no inspect request."""
+        sdk_client.api.containers.return_value = [make_summary('web'), make_summary('db')]
+
+        containers = client.get_containers(with_stats=False, fields=('status', 'name'))
+
+        assert [info['status'] for info in containers] == ['running', 'running']
+        assert 'restart_count' not in containers[0]
+        sdk_client.api.inspect_container.assert_not_called()
+
+    @pytest.mark.parametrize('status, expected', [
+        ('Up 5 minutes (healthy)', 'healthy'),
+        ('Up 1 second (health: starting)', 'starting'),
+        ('Up 2 hours (unhealthy)', 'unhealthy'),
+        ('Exited (0) 3 minutes ago', None),
+    ])
+    def test_health_status_from_list_entry(self, client, status, expected):
+        """Test that health is parsed from the list payload's Status text."""
+        assert client._get_health_status({'Status': status}) == expected
+
+    def test_container_removed_after_listing_skipped(self, client, sdk_client):
+        """Test that a container gone before inspect is left out."""
+        sdk_client.api.containers.return_value = [make_summary('web'), make_summary('gone')]
+
+        def inspect(container_id):
+            if container_id == 'gone-full-id':
+                raise NotFound('gone')
+            return make_inspect()
+
+        sdk_client.api.inspect_container.side_effect = inspect
+
+        assert [info['name'] for info in client.get_containers()] == ['web']
+
+    def test_inspects_run_concurrently_in_list_order(self, client, sdk_client):
+        """Test that per-container inspects overlap and keep list order."""
+        names = ['c', 'a', 'b']
+        sdk_client.api.containers.return_value = [make_summary(name) for name in names]
+        barrier = threading.Barrier(len(names), timeout=5)
+
+        def inspect(container_id):
+            # Only passes if all inspects are in flight at the same time
+            barrier.wait()
+            return make_inspect(restart_count=names.index(container_id.split('-')[0]))
+
+        sdk_client.api.inspect_container.side_effect = inspect
+
+        result = client.get_containers(with_stats=False)
+
+        assert [(info['name'], info['restart_count']) for info in result] == [('c', 0), ('a', 1), ('b', 2)]
+
+    def test_stats_fetched_only_for_running(self, client, sdk_client):
+        """Test that stopped containers are returned without stats."""
+        sdk_client.api.containers.return_value = [
+            make_summary('web'), make_summary('db', state='exited')
+        ]
+
+        containers = client.get_containers()
+
+        by_name = {info['name']: info for info in containers}
+        assert by_name['web']['stats'] is not None
+        assert by_name['db']['stats'] is None
+        assert stats_ids(sdk_client) == ['web-full-id']
+
+    def test_stats_fetched_concurrently(self, client, sdk_client):
+        """Test that stats requests for several containers overlap."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def blocking_stats(container_id, stream=True, decode=False):
+            barrier.wait()
+            return {}
+
+        sdk_client.api.stats.side_effect = blocking_stats
+        sdk_client.api.containers.return_value = [make_summary(f'app-{i}') for i in range(3)]
+
+        # Serial fetching would break the barrier and yield no stats
+        result = client.get_containers()
+
+        assert [info['name'] for info in result] == ['app-0', 'app-1', 'app-2']
+        assert all(info['stats'] is not None for info in result)
+
+    def test_name_filter_applied_before_stats(self, client, sdk_client):
+        """Test that filtered-out containers are never sampled."""
+        sdk_client.api.containers.return_value = [make_summary('web-1'), make_summary('db-1')]
+
+        result = client.get_containers(name_filter='^web-')
+
+        assert [info['name'] for info in result] == ['web-1']
+        assert stats_ids(sdk_client) == ['web-1-full-id']
+
+    def test_stats_and_env_can_be_skipped(self, client, sdk_client):
+        """Test that with_stats/with_env avoid stats requests and env parsing."""
+        sdk_client.api.containers.return_value = [make_summary('web')]
+        inspect = make_inspect()
+        inspect['Config']['Env'] = ['PATH=/usr/bin']
+        sdk_client.api.inspect_container.side_effect = lambda container_id: inspect
+
+        [info] = client.get_containers(with_stats=False, with_env=False)
+
+        assert info['stats'] is None
+        assert info['env'] == {}
+        sdk_client.api.stats.assert_not_called()
+
+    def test_status_and_name_filters_combined(self, client, sdk_client):
+        """Test that status and literal name filters share one request."""
+        client.get_containers(name_filter='web', statuses=('running', 'restarting'))
+
+        sdk_client.api.containers.assert_called_once_with(
+            all=True, filters={'status': ['running', 'restarting'], 'name': 'web'}
+        )
+
+    def test_port_strings_reused_between_polls(self, client, sdk_client):
+        """Test that unchanged port lists are not formatted again."""
+        sdk_client.api.containers.side_effect = lambda **kwargs: [make_summary('web')]
+
+        with patch('docker_monitor.core.docker_client.PortFormatter.format_port_list',
+                   return_value='8080→80/tcp') as format_port_list:
+            client.get_containers(with_stats=False)
+            [info] = client.get_containers(with_stats=False)
+
+        assert info['ports'] == '8080→80/tcp'
+        format_port_list.assert_called_once()
+
+    @pytest.mark.parametrize('name_filter, expected', [
+        ('web-app', {'name': 'web-app'}),
+        ('^web-', None),
+        ('api|worker', None),
+        (re.compile('web', re.IGNORECASE), None),
+    ])
+    def test_plain_substring_pushed_to_daemon(self, client, sdk_client, name_filter, expected):
+        """Test that only literal name filters are sent to dockerd."""
+        client.get_containers(name_filter=name_filter)
+
+        sdk_client.api.containers.assert_called_once_with(all=True, filters=expected)
+
+    def test_exact_names_pushed_to_daemon(self, client, sdk_client):
+        """Test that name collections become anchored dockerd name filters."""
+        sdk_client.api.containers.return_value = [make_summary('web'), make_summary('web-2')]
+
+        result = client.get_containers(name_filter=['web', 'db.1'], with_stats=False)
+
+        assert [info['name'] for info in result] == ['web']
+        sdk_client.api.containers.assert_called_once_with(
+            all=True, filters={'name': ['^/db\\.1$', '^/web$']}
+        )
+
+    def test_predicate_filter_applied_locally(self, client, sdk_client):
+        """Test that callable filters are evaluated client-side only."""
+        sdk_client.api.containers.return_value = [make_summary('web'), make_summary('db')]
+
+        result = client.get_containers(name_filter=lambda name: name.startswith('d'), with_stats=False)
+
+        assert [info['name'] for info in result] == ['db']
+        sdk_client.api.containers.assert_called_once_with(all=True, filters=None)
+
+
+class TestStreamedStats:
+    """Test cases for the streaming stats samplers."""
+
+    @pytest.fixture
+    def streaming_client(self, sdk_client):
+        """DockerClient with streaming stats enabled."""
+        docker_client = DockerClient(stream_stats=True)
+        yield docker_client
+        docker_client.close()
+
+    def test_first_poll_falls_back_to_one_shot(self, streaming_client, sdk_client):
+        """Test that containers without a sample yet still get stats."""
+        release = threading.Event()
+
+        def stream_stats(container_id, stream=True, decode=False):
+            if not stream:
+                return {}
+            release.wait(5)
+            return iter(())
+
+        sdk_client.api.stats.side_effect = stream_stats
+        sdk_client.api.containers.return_value = [make_summary('web')]
+
+        try:
+            result = streaming_client.get_containers()
+        finally:
+            release.set()
+
+        assert result[0]['stats'] is not None
+        assert stats_ids(sdk_client) == ['web-full-id']
+
+    def test_cached_sample_served_without_blocking(self, streaming_client, sdk_client):
+        """Test that later polls read the sampler cache."""
+        container = make_summary('web')
+        sampled = threading.Event()
+        release = threading.Event()
+
+        def stream_samples():
+            yield {'networks': {'eth0': {'rx_bytes': 2048, 'tx_bytes': 0}}}
+            sampled.set()
+            release.wait(5)
+
+        sdk_client.api.stats.side_effect = lambda container_id, stream, decode: stream_samples()
+
+        try:
+            streaming_client._fetch_stats([container])
+            assert sampled.wait(5)
+            stats = streaming_client._fetch_stats([container])[container['Id']]
+        finally:
+            release.set()
+
+        assert stats['network']['rx_bytes'] == '2.0 KB'
+        sdk_client.api.stats.assert_called_once()
+
+    def test_samplers_pruned_for_gone_containers(self, streaming_client):
+        """Test that containers no longer running stop being tracked."""
+        streaming_client._stats_threads['gone-id'] = MagicMock()
+        streaming_client._stats_cache['gone-id'] = {}
+
+        streaming_client._fetch_stats([])
+
+        assert 'gone-id' not in streaming_client._stats_threads
+        assert 'gone-id' not in streaming_client._stats_cache
+
+
+class TestEnvironmentVars:
+    """Test cases for environment variable filtering."""
+
+    def test_sensitive_values_hidden(self, client):
+        """Test that sensitive keys are masked case-insensitively."""
+        config = {'Env': [
+            'DB_PASSWORD=hunter2', 'Api_Url=http://x', 'PATH=/usr/bin',
+            'OPTS=a=b', 'MALFORMED'
+        ]}
+
+        env = client._get_environment_vars(config)
+
+        assert env == {
+            'DB_PASSWORD': '***',
+            'Api_Url': '***',
+            'PATH': '/usr/bin',
+            'OPTS': 'a=b'
+        }
+
+
+class TestContainerName:
+    """Test cases for resolving container names from list entries."""
+
+    def test_link_aliases_ignored(self):
+        """Test that legacy link aliases do not shadow the primary name."""
+        summary = {'Id': 'abc', 'Names': ['/app/db', '/db']}
+
+        assert _container_name(summary) == 'db'
+
+
+class TestStatsExtraction:
+    """Test cases for network and block I/O totals."""
+
+    def test_network_bytes_summed_across_interfaces(self, client):
+        """Test that rx/tx bytes are totalled over all networks."""
+        stats = {'networks': {
+            'eth0': {'rx_bytes': 1024, 'tx_bytes': 512},
+            'eth1': {'rx_bytes': 1024}
+        }}
+
+        assert client._get_network_stats(stats) == {'rx_bytes': '2.0 KB', 'tx_bytes': '512.0 B'}
+
+    def test_block_io_totals_by_operation(self, client):
+        """Test that only Read and Write entries are accumulated."""
+        stats = {'blkio_stats': {'io_service_bytes_recursive': [
+            {'op': 'Read', 'value': 2048},
+            {'op': 'Write', 'value': 1024},
+            {'op': 'Total', 'value': 3072},
+            {'op': 'Read', 'value': 2048}
+        ]}}
+
+        assert client._get_block_io_stats(stats) == {'read_bytes': '4.0 KB', 'write_bytes': '1.0 KB'}
+
+
+class TestReconnect:
+    """Test cases for lazy reconnection on transport errors."""
+
+    def test_no_ping_before_queries(self, client, sdk_client):
+        """Test that queries do not ping the daemon first."""
+        sdk_client.ping.reset_mock()
+
+        client.get_containers()
+        client.get_system_info()
+
+        sdk_client.ping.assert_not_called()
+
+    def test_transport_error_triggers_one_reconnect(self, client, sdk_client):
+        """Test that a failed request reconnects once and is retried."""
+        sdk_client.api.containers.side_effect = [RequestsConnectionError('socket closed'), []]
+
+        assert client.get_containers() == []
+        assert sdk_client.api.containers.call_count == 2
+
+    def test_repeated_failure_raises_connection_error(self, client, sdk_client):
+        """Test that a second failure surfaces as ConnectionError."""
+        sdk_client.api.containers.side_effect = RequestsConnectionError('socket closed')
+
+        with pytest.raises(ConnectionError):
+            client.get_containers()
+
+    def test_api_error_does_not_reconnect(self, client, sdk_client):
+        """Test that an HTTP error from the daemon is not treated as a lost connection."""
+        sdk_client.api.inspect_container.side_effect = APIError('409 Conflict')
+
+        with patch('docker_monitor.core.docker_client.docker.from_env') as from_env:
+            with pytest.raises(APIError):
+                client._call_with_reconnect(sdk_client.api.inspect_container, 'web-full-id')
+
+        from_env.assert_not_called()
+        assert client.client is sdk_client
+
+    def test_reconnect_swaps_in_connected_client(self, client, sdk_client):
+        """Test that the old client stays usable until the new one is connected."""
+        seen_during_ping = []
+        new_sdk = MagicMock()
+        new_sdk.ping.side_effect = lambda: seen_during_ping.append(client.client)
+
+        with patch('docker_monitor.core.docker_client.docker.from_env', return_value=new_sdk):
+            assert client.reconnect() is True
+
+        assert seen_during_ping == [sdk_client]
+        assert client.client is new_sdk
+        sdk_client.close.assert_called_once()
+
+
+class TestIsConnected:
+    """Test cases for the connection health check."""
+
+    def test_ping_does_not_hold_lock(self, client, sdk_client):
+        """Test that a slow ping does not block other lock users."""
+        acquired = []
+
+        def ping():
+            acquired.append(client._lock.acquire(timeout=1))
+            client._lock.release()
+            return True
+
+        sdk_client.ping.side_effect = ping
+
+        assert client.is_connected() is True
+        assert acquired == [True]
+
+    def test_failed_ping_marks_disconnected(self, client, sdk_client):
+        """Test that a transport error reports the client as disconnected."""
+        sdk_client.ping.side_effect = RequestsConnectionError('socket closed')
+
+        assert client.is_connected() is False
+        assert client._connected is False
+
+
+class TestConnectionPool:
+    """Test cases for connection pool sizing."""
+
+    def test_pool_sized_for_stats_workers(self, sdk_client):
+        """Test that the SDK pool can hold every concurrent stats request."""
+        with patch('docker_monitor.core.docker_client.docker.from_env') as from_env:
+            DockerClient(max_stats_workers=16)
+
+        from_env.assert_called_once_with(max_pool_size=26)
+
+
+class TestSystemInfo:
+    """Test cases for cached system information."""
+
+    def test_repeated_calls_served_from_cache(self, client, sdk_client):
+        """Test that info and version are fetched once within the TTL."""
+        sdk_client.info.return_value = {'NCPU': 4, 'ContainersRunning': 2}
+        sdk_client.version.return_value = {'Version': '24.0'}
+
+        first = client.get_system_info()
+        second = client.get_system_info()
+
+        assert first == second
+        assert first['cpus'] == 4 and first['server_version'] == '24.0'
+        sdk_client.info.assert_called_once()
+        sdk_client.version.assert_called_once()
+
+    def test_reconnect_refreshes_cache(self, client, sdk_client):
+        """Test that closing the connection drops cached values."""
+        sdk_client.version.return_value = {'Version': '24.0'}
+        client.get_system_info()
+
+        client.reconnect()
+        client.get_system_info()
+
+        assert sdk_client.version.call_count == 2
+
+
+class TestSlots:
+    """Test cases for the slotted client layout."""
+
+    def test_client_has_no_instance_dict(self, client):
+        """Test that every attribute is declared in __slots__."""
+        assert not hasattr(client, '__dict__')
+
+
+class TestReadStats:
+    """Test cases for one-shot stats samples."""
+
+    def test_one_shot_uses_public_stats_api(self, client, sdk_client):
+        """Test that a single decoded sample is requested through APIClient.stats."""
+        sdk_client.api.stats.side_effect = None
+        sdk_client.api.stats.return_value = {'networks': {'eth0': {'rx_bytes': 1024}}}
+
+        stats = client._read_stats('web-full-id')
+
+        assert stats == {'networks': {'eth0': {'rx_bytes': 1024}}}
+        sdk_client.api.stats.assert_called_once_with('web-full-id', stream=False)
@@ -0,0 +1,92 @@
+"""Tests for the Docker monitoring orchestrator."""
+
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from docker_monitor.core.docker_monitor import DockerMonitor, next_daily_run
+
+
+@pytest.fixture
+def config():
+    """Configuration stub with notifications enabled."""
+    config = MagicMock()
+    config.log_level = 'INFO'
+    config.notification_enabled = True
+    config.include_stopped_containers = True
+    config.container_name_filter_re = None
+    return config
+
+
+@pytest.fixture
+def monitor(config):
+    """DockerMonitor with mocked Docker and Slack clients."""
+    with patch('docker_monitor.core.docker_monitor.DockerClient'), \
+            patch('docker_monitor.core.docker_monitor.SlackNotifier'), \
+            patch('docker_monitor.core.docker_monitor.setup_logging'):
+        monitor = DockerMonitor(config)
+    monitor.docker_client.get_containers.return_value = [
+        {'name': 'web', 'status': 'running'},
+        {'name': 'db', 'status': 'exited'}
+    ]
+    monitor.docker_client.get_system_info.return_value = {'server_version': '24.0'}
+    return monitor
+
+
+class TestStatusSummary:
+    """Test cases for DockerMonitor.get_status_summary."""
+
+    def test_docker_queried_once_per_summary(self, monitor):
+        """Test that the connection test reuses the summary's Docker data."""
+        summary = monitor.get_status_summary()
+
+        assert summary['connections']['docker'] is True
+        assert summary['status_counts'] == {'running': 1, 'exited': 1}
+        monitor.docker_client.get_containers.assert_called_once()
+        monitor.docker_client.get_system_info.assert_called_once()
+        monitor.docker_client.is_connected.assert_not_called()
+
+    def test_failed_system_info_reports_docker_down(self, monitor):
+        """Test that a failing Docker request marks the connection as failed."""
+        monitor.docker_client.get_system_info.side_effect = ConnectionError('down')
+
+        assert monitor.test_connections()['docker'] is False
+
+    def test_run_check_refreshes_cached_data(self, monitor):
+        """Test that a check never reports stale system information."""
+        monitor.get_status_summary()
+        monitor.run_check()
+
+        assert monitor.docker_client.get_system_info.call_count == 2
+
+    def test_background_check_queues_report(self, monitor):
+        """Test that run_check(wait=False) hands the report to the dispatcher."""
+        monitor.dispatcher = MagicMock()
+        monitor.slack_notifier.create_status_message.return_value = {'attachments': [{'title': 'report'}]}
+
+        assert monitor.run_check(wait=False) is True
+
+        monitor.dispatcher.enqueue.assert_called_once_with([{'title': 'report'}])
+        monitor.slack_notifier.send_container_report.assert_not_called()
+
+
+class TestScheduling:
+    """Test cases for the daily scheduler."""
+
+    @pytest.mark.parametrize('now, expected', [
+        (datetime(2024, 5, 1, 8, 0), datetime(2024, 5, 1, 9, 0)),
+        (datetime(2024, 5, 1, 9, 0), datetime(2024, 5, 2, 9, 0)),
+        (datetime(2024, 12, 31, 23, 0), datetime(2025, 1, 1, 9, 0)),
+    ])
+    def test_next_daily_run(self, now, expected):
+        """Test that the next run is today if still ahead, else tomorrow."""
+        assert next_daily_run('09:00', now) == expected
+
+    def test_stop_ends_scheduled_loop(self, monitor, config):
+        """Test that a stopped scheduler returns without running a check."""
+        config.daily_check_time = '09:00'
+        monitor.stop()
+
+        with patch.object(DockerMonitor, 'run_check') as run_check:
+            monitor.run_scheduled()
+
+        run_check.assert_not_called()
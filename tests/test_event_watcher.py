@@ -0,0 +1,93 @@
+"""Tests for Docker event stream watching."""
+
+import threading
+from unittest.mock import MagicMock
+from docker_monitor.core.event_watcher import EventWatcher, is_state_event
+
+
+class FakeStream:
+    """Event stream yielding fixed events, then ending like a dropped connection."""
+
+    def __init__(self, events):
+        self._events = iter(events)
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.closed:
+            raise StopIteration
+        return next(self._events)
+
+    def close(self):
+        self.closed = True
+
+
+def make_event(action, time=100):
+    """Build a decoded container event."""
+    return {'Type': 'container', 'Action': action, 'time': time,
+            'Actor': {'Attributes': {'name': 'web'}}}
+
+
+class TestEventWatcher:
+    """Test cases for EventWatcher class."""
+
+    def test_state_event_actions(self):
+        """Test that lifecycle and health events count, exec events do not."""
+        assert is_state_event(make_event('die'))
+        assert is_state_event(make_event('health_status: unhealthy'))
+        assert not is_state_event(make_event('exec_start: sh -c true'))
+
+    def test_reconnects_from_last_event_time(self):
+        """Test that a dropped stream is reopened from the last event seen."""
+        received = []
+        done = threading.Event()
+        docker_client = MagicMock()
+        docker_client.events.side_effect = [
+            FakeStream([make_event('start', 100), make_event('exec_create: ls', 105)]),
+            RuntimeError('daemon restarting'),
+            FakeStream([make_event('die', 110)]),
+            FakeStream([]),
+        ]
+
+        def on_event(event):
+            received.append(event.get('Action'))
+            if event.get('Action') == 'die':
+                done.set()
+
+        watcher = EventWatcher(docker_client, on_event, reconnect_delay=0.01)
+        watcher.start()
+        assert done.wait(timeout=5)
+        watcher.stop()
+
+        assert received == ['start', None, 'die']
+        sinces = [call.kwargs['since'] for call in docker_client.events.call_args_list]
+        assert sinces[1:3] == [105, 105]
+
+    def test_stop_closes_open_stream(self):
+        """Test that stopping cancels a stream blocked waiting for events."""
+        opened = threading.Event()
+        release = threading.Event()
+
+        class BlockingStream(FakeStream):
+            def __next__(self):
+                opened.set()
+                release.wait(5)
+                raise StopIteration
+
+            def close(self):
+                super().close()
+                release.set()
+
+        stream = BlockingStream([])
+        docker_client = MagicMock()
+        docker_client.events.return_value = stream
+        watcher = EventWatcher(docker_client, lambda event: None)
+
+        watcher.start()
+        assert opened.wait(timeout=5)
+        watcher.stop()
+
+        assert stream.closed
+        assert not watcher.running
@@ -0,0 +1,106 @@
+"""Tests for the background monitoring thread."""
+
+import threading
+import time
+from docker_monitor.core.monitoring_thread import MonitoringThread
+
+
+class TestAdaptiveInterval:
+    """Test cases for the activity-based check interval."""
+
+    def test_interval_shrinks_on_change_and_grows_when_idle(self):
+        """Test halving after changes and 1.5x growth after idle cycles."""
+        thread = MonitoringThread(lambda: None, check_interval=8, min_interval=2, max_interval=20)
+
+        thread.current_interval = thread._next_interval(True)
+        assert thread.current_interval == 4
+        thread.current_interval = thread._next_interval(True)
+        thread.current_interval = thread._next_interval(True)
+        assert thread.current_interval == 2
+
+        for _ in range(8):
+            thread.current_interval = thread._next_interval(False)
+        assert thread.current_interval == 20
+
+    def test_unknown_result_keeps_interval(self):
+        """Test that a None result (e.g. an error) leaves the interval alone."""
+        thread = MonitoringThread(lambda: None, check_interval=10)
+
+        assert thread._next_interval(None) == 10
+
+    def test_default_bounds_follow_check_interval(self):
+        """Test that bounds are derived from the interval set before start."""
+        thread = MonitoringThread(lambda: None)
+        thread.check_interval = 20
+
+        assert thread._interval_bounds() == (5, 120)
+
+    def test_loop_waits_for_adapted_interval(self):
+        """Test that the loop sleeps for the adapted interval between cycles."""
+        waits = []
+        thread = MonitoringThread(lambda: True, check_interval=8, min_interval=1, max_interval=8)
+
+        def fake_wait(timeout=None):
+            waits.append(timeout)
+            if len(waits) >= 3:
+                thread._shutdown_event.set()
+            return False
+
+        thread._wake_event.wait = fake_wait
+        thread._running.set()
+        thread._monitoring_loop()
+
+        assert waits == [4, 2, 1]
+        assert thread.monitoring is False
+
+    def test_start_resets_interval(self):
+        """Test that restarting begins again from check_interval."""
+        release = threading.Event()
+        thread = MonitoringThread(lambda: release.wait(5) and False, check_interval=30)
+        thread.current_interval = 1
+
+        thread.start()
+        assert thread.current_interval == 30
+        release.set()
+        thread.stop()
+
+    def test_wait_until_stopped_returns_when_loop_exits(self):
+        """Test that waiters are released as soon as the loop ends."""
+        thread = MonitoringThread(lambda: False, check_interval=30)
+
+        assert thread.wait_until_stopped(timeout=0) is True
+        thread.start()
+        assert thread.wait_until_stopped(timeout=0.05) is False
+        thread.stop()
+        assert thread.wait_until_stopped(timeout=5) is True
+
+    def test_wake_runs_next_cycle_immediately(self):
+        """Test that wake() cuts the wait short."""
+        calls = []
+        second_cycle = threading.Event()
+
+        def check():
+            calls.append(1)
+            if len(calls) == 2:
+                second_cycle.set()
+            return False
+
+        thread = MonitoringThread(check, check_interval=30)
+        thread.start()
+        thread.wake()
+
+        assert second_cycle.wait(timeout=5)
+        thread.stop()
+
+    def test_wake_burst_shares_one_cycle(self):
+        """Test that wake-ups within the settle delay are consumed by one cycle."""
+        thread = MonitoringThread(lambda: None, check_interval=30, wake_delay=0.2)
+        thread.current_interval = 30
+
+        thread.wake()
+        threading.Timer(0.05, thread.wake).start()
+        started = time.monotonic()
+        assert thread._wait() is False
+
+        assert 0.2 <= time.monotonic() - started < 5
+        assert not thread._wake_event.is_set()
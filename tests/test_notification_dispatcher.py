@@ -0,0 +1,79 @@
+"""Tests for background notification delivery."""
+
+import threading
+from unittest.mock import MagicMock
+from docker_monitor.core.notification_dispatcher import NotificationDispatcher
+
+
+def make_notifier():
+    """Slack notifier mock accepting every batch."""
+    notifier = MagicMock()
+    notifier.send_batch.return_value = True
+    return notifier
+
+
+class TestNotificationDispatcher:
+    """Test cases for NotificationDispatcher class."""
+
+    def test_stop_delivers_queued_messages(self):
+        """Test that stopping flushes the queue and runs delivery callbacks."""
+        notifier = make_notifier()
+        dispatcher = NotificationDispatcher(notifier)
+        delivered = []
+
+        dispatcher.enqueue([{'title': 'a'}], lambda: delivered.append('a'))
+        dispatcher.enqueue([{'title': 'b'}], lambda: delivered.append('b'))
+        dispatcher.stop()
+
+        sent = [a['title'] for call in notifier.send_batch.call_args_list for a in call[0][0]]
+        assert sent == ['a', 'b']
+        assert delivered == ['a', 'b']
+
+    def test_queued_messages_merged_into_batches(self):
+        """Test that messages waiting in the queue share one Slack post."""
+        notifier = make_notifier()
+        release = threading.Event()
+        notifier.send_batch.side_effect = lambda attachments: release.wait(5)
+        dispatcher = NotificationDispatcher(notifier, batch_size=3)
+
+        dispatcher.enqueue([{'title': 'first'}])
+        for i in range(4):
+            dispatcher._queue.put_nowait(([{'title': i}], None))
+        release.set()
+        dispatcher.stop()
+
+        sizes = [len(call[0][0]) for call in notifier.send_batch.call_args_list]
+        assert max(sizes) == 3
+        assert sum(sizes) == 5
+
+    def test_full_queue_drops_oldest(self):
+        """Test that overflow discards the oldest queued message."""
+        dispatcher = NotificationDispatcher(make_notifier(), maxsize=2)
+
+        for i in range(3):
+            dispatcher._put(([{'title': i}], None))
+
+        assert dispatcher.dropped == 1
+        assert [dispatcher._queue.get_nowait()[0][0]['title'] for _ in range(2)] == [1, 2]
+
+    def test_failed_delivery_skips_callbacks(self):
+        """Test that callbacks only run after a successful send."""
+        notifier = make_notifier()
+        notifier.send_batch.return_value = False
+        dispatcher = NotificationDispatcher(notifier)
+        delivered = []
+
+        dispatcher.enqueue([{'title': 'a'}], lambda: delivered.append('a'))
+        dispatcher.stop()
+
+        assert delivered == []
+
+    def test_pending_counts_queued_messages(self):
+        """Test that queued messages are reported until the worker takes them."""
+        notifier = make_notifier()
+        dispatcher = NotificationDispatcher(notifier)
+
+        dispatcher._put(([{'title': 'a'}], None))
+        dispatcher._put(([{'title': 'b'}], None))
+
+        assert dispatcher.pending == 2
@@ -0,0 +1,193 @@
+"""Tests for notification content creation."""
+
+import dataclasses
+import pytest
+from datetime import datetime
+from docker_monitor.core.notification_formatter import NotificationFormatter
+
+
+def make_change(change_type, **fields):
+    """Build a change dictionary as produced by ChangeDetector."""
+    change = {
+        'type': change_type,
+        'container_id': 'abcdef1234567890',
+        'timestamp': datetime(2024, 1, 1, 12, 0, 0),
+        'container_info': {'name': 'web', 'image': 'nginx:latest', 'ports': '', 'created': '2024-01-01'}
+    }
+    change.update(fields)
+    return change
+
+
+@pytest.fixture
+def formatter():
+    """Notification formatter under test."""
+    return NotificationFormatter()
+
+
+class TestNotificationFormatter:
+    """Test cases for NotificationFormatter class."""
+
+    @pytest.mark.parametrize('previous, current, level, title', [
+        ('running', 'exited', 'critical', '🚨 Container web STOPPED'),
+        ('exited', 'restarting', 'warning', '⚠️ Container web RESTARTING'),
+        ('running', 'restarting', 'warning', '⚠️ Container web RESTARTING'),
+        ('running', 'unhealthy', 'warning', '⚠️ Container web UNHEALTHY'),
+        ('created', 'exited', 'info', 'ℹ️ Container web Status Change'),
+    ])
+    def test_state_change_styles(self, formatter, previous, current, level, title):
+        """Test that state transitions map to the expected alert styles."""
+        change = make_change('state_change', previous_status=previous, current_status=current)
+
+        notification = formatter.create_notification(change)
+
+        assert notification.alert_level == level
+        assert notification.title == title
+
+    def test_state_change_description(self, formatter):
+        """Test that transition descriptions include both statuses."""
+        change = make_change('state_change', previous_status='running', current_status='dead')
+
+        notification = formatter.create_notification(change)
+
+        assert notification.description == 'Container transitioned from `running` to `dead`'
+        assert notification.color == '#FF0000'
+
+    def test_dispatch_by_change_type(self, formatter):
+        """Test that each change type reaches its own handler."""
+        added = formatter.create_notification(make_change('container_added', current_status='running'))
+        unknown = formatter.create_notification(make_change('container_paused'))
+
+        assert added.title == '✅ Container web ADDED'
+        assert unknown.description == 'Unknown change type: container_paused'
+
+    def test_details_skip_empty_ports(self, formatter):
+        """Test that details keep present fields and drop empty ports."""
+        change = make_change('container_stopped', current_status='exited')
+
+        notification = formatter.create_notification(change)
+
+        assert notification.details == '**Image:** nginx:latest\n**Created:** 2024-01-01'
+
+    def test_change_left_unmodified(self, formatter):
+        """Test that formatting does not write into the caller's change."""
+        change = make_change('container_started', previous_status='exited')
+        before = dict(change)
+
+        notification = formatter.create_notification(change)
+
+        assert notification.timestamp == '2024-01-01 12:00:00'
+        assert change == before
+
+    def test_name_falls_back_to_short_id(self, formatter):
+        """Test that a missing container name uses the short container id."""
+        change = make_change('container_removed', previous_status='running', container_info={})
+
+        notification = formatter.create_notification(change)
+
+        assert notification.container_name == 'abcdef123456'
+
+    def test_removed_container_uses_display_name(self, formatter):
+        """Test that the detector's display name survives a removal without info."""
+        change = make_change('container_removed', previous_status='running', container_id='',
+                             display_name='worker')
+        del change['container_info']
+
+        notification = formatter.create_notification(change)
+
+        assert (notification.container_name, notification.title) == ('worker', '🚨 Container worker REMOVED')
+
+    def test_notification_is_immutable_slots_object(self, formatter):
+        """Test that notifications are frozen and carry no per-instance dict."""
+        notification = formatter.create_notification(make_change('container_added', current_status='running'))
+
+        assert not hasattr(notification, '__dict__')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            notification.title = 'changed'
+
+    @pytest.mark.parametrize('fields, level, title, description', [
+        ({'restart_type': 'automatic', 'previous_restart_count': 1, 'current_restart_count': 2},
+         'warning', '🔄 Container web AUTO-RESTARTED',
+         'Container automatically restarted due to failure (restart count: 1 → 2)'),
+        ({'restart_type': 'automatic', 'previous_restart_count': 1, 'current_restart_count': 4,
+          'current_status': 'exited'},
+         'critical', '🚨 Container web AUTO-RESTARTED',
+         'Container automatically restarted 3 times due to failures (restart count: 1 → 4)'
+         '\n⚠️ Current status: `exited`'),
+        ({'restart_type': 'manual'},
+         'warning', '🔄 Container web RESTARTED', 'Container was manually restarted (started time changed)'),
+        ({'restart_type': 'docker', 'current_status': 'exited'},
+         'warning', '🔄 Container web RESTARTED', 'Container restart detected (type: docker)'),
+    ])
+    def test_restart_specs(self, formatter, fields, level, title, description):
+        """Test restart wording, pluralisation and escalation."""
+        change = make_change('container_restarted', current_status='running')
+        change.update(fields)
+
+        notification = formatter.create_notification(change)
+
+        assert (notification.alert_level, notification.title, notification.description) == (
+            level, title, description
+        )
+
+    def test_removal_has_no_details(self, formatter):
+        """Test that removed containers are reported without details."""
+        notification = formatter.create_notification(
+            make_change('container_removed', previous_status='running')
+        )
+
+        assert notification.details is None
+
+    def test_style_derived_from_alert_level(self, formatter):
+        """Test that emoji and color come from the alert level unless overridden."""
+        started = formatter.create_notification(make_change('container_started', previous_status='exited'))
+        restarted = formatter.create_notification(
+            make_change('container_restarted', restart_type='manual', current_status='running')
+        )
+
+        assert (started.alert_level, started.color) == ('ok', '#00AA00')
+        assert started.title.startswith(NotificationFormatter.TITLE_PREFIX['ok'])
+        assert (restarted.color, restarted.title[:2]) == ('#FFA500', '🔄 ')
+
+    def test_simultaneous_changes_grouped(self, formatter):
+        """Test that changes sharing level and type are summarised in one attachment."""
+        changes = [
+            make_change('container_stopped', current_status='exited', container_id=f'{i:016d}',
+                        container_info={'name': f'web-{i}'})
+            for i in range(3)
+        ]
+        changes.append(make_change('container_started', previous_status='exited'))
+
+        attachments = formatter.create_notifications(changes)['attachments']
+
+        assert [a['title'] for a in attachments] == ['🚨 3 containers: stopped', '✅ Container web STARTED']
+        assert attachments[0]['text'].splitlines()[0].startswith('*web-0*: Container stopped')
+
+    def test_group_lines_truncated(self, formatter, monkeypatch):
+        """Test that long groups list a bounded number of containers."""
+        monkeypatch.setattr('docker_monitor.core.notification_formatter.MAX_GROUP_LINES', 2)
+        changes = [
+            make_change('container_removed', previous_status='running', container_info={'name': f'job-{i}'})
+            for i in range(5)
+        ]
+
+        attachment = formatter.create_notifications(changes)['attachments'][0]
+
+        assert attachment['text'].splitlines()[-1] == '... and 3 more'
+        assert len(attachment['text'].splitlines()) == 3
+
+    def test_changes_of_one_pass_share_timestamp_string(self, formatter):
+        """Test that a timestamp shared by several changes is formatted once."""
+        timestamp = datetime(2024, 1, 1, 12, 0, 0)
+        first = formatter.create_notification(make_change('container_added', current_status='running', timestamp=timestamp))
+        second = formatter.create_notification(make_change('container_stopped', current_status='exited', timestamp=timestamp))
+
+        assert first.timestamp is second.timestamp
+
+    def test_details_cached_by_container_metadata(self, formatter):
+        """Test that containers with identical metadata share the details text."""
+        first = formatter.create_notification(make_change('container_stopped', current_status='exited'))
+        second = formatter.create_notification(
+            make_change('container_stopped', current_status='exited', container_id='1234567890abcdef')
+        )
+
+        assert first.details is second.details
@@ -0,0 +1,144 @@
+"""Tests for notification coordination."""
+
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from docker_monitor.core.notification_manager import BURST_THRESHOLD, NotificationManager
+
+
+def make_change(name, change_type='container_stopped', **fields):
+    """Build a change dictionary as produced by ChangeDetector."""
+    change = {
+        'type': change_type,
+        'container_id': f'{name}-id',
+        'container_name': name,
+        'display_name': name,
+        'timestamp': datetime(2024, 1, 1, 12, 0, 0),
+        'previous_status': 'running',
+        'current_status': 'exited',
+        'container_info': {'name': name}
+    }
+    change.update(fields)
+    return change
+
+
+@pytest.fixture
+def slack_notifier():
+    """Slack notifier mock accepting every batch."""
+    notifier = MagicMock()
+    notifier.send_batch.return_value = True
+    return notifier
+
+
+@pytest.fixture
+def manager(slack_notifier):
+    """Notification manager under test."""
+    return NotificationManager(slack_notifier, cooldown_seconds=60)
+
+
+class TestNotificationManager:
+    """Test cases for NotificationManager class."""
+
+    def test_cycle_sent_as_one_batch(self, manager, slack_notifier):
+        """Test that all notifiable changes of a cycle share one Slack call."""
+        manager.process_changes([make_change('web'), make_change('db'), make_change('cache')])
+
+        slack_notifier.send_batch.assert_called_once()
+        attachments = slack_notifier.send_batch.call_args[0][0]
+        assert [a['title'] for a in attachments] == ['🚨 3 containers: stopped']
+        names = [line.split(':')[0] for line in attachments[0]['text'].splitlines()]
+        assert names == ['*web*', '*db*', '*cache*']
+        slack_notifier.send_custom_message.assert_not_called()
+
+    def test_cooldown_only_after_successful_send(self, manager, slack_notifier):
+        """Test that a failed batch does not start cooldowns."""
+        slack_notifier.send_batch.return_value = False
+
+        manager.process_changes([make_change('web')])
+
+        assert manager.cooldown_manager.is_in_cooldown('web') is False
+
+    def test_removed_container_leaves_no_cooldown(self, manager, slack_notifier):
+        """Test that removals are notified and their cooldown entry dropped."""
+        manager.process_changes([make_change('old', change_type='container_removed')])
+
+        slack_notifier.send_batch.assert_called_once()
+        assert manager.cooldown_manager.get_all_cooldowns() == {}
+
+    def test_dispatcher_defers_send_and_cooldown(self, slack_notifier):
+        """Test that a dispatcher receives the batch and starts cooldowns on delivery."""
+        dispatcher = MagicMock()
+        manager = NotificationManager(slack_notifier, cooldown_seconds=60, dispatcher=dispatcher)
+
+        manager.process_changes([make_change('web')])
+
+        slack_notifier.send_batch.assert_not_called()
+        attachments, on_sent = dispatcher.enqueue.call_args[0]
+        assert len(attachments) == 1
+        assert manager.cooldown_manager.is_in_cooldown('web') is False
+        on_sent()
+        assert manager.cooldown_manager.is_in_cooldown('web') is True
+
+    def test_simultaneous_removals_all_notified(self, manager, slack_notifier):
+        """Test that removals, which carry no container ID, are not merged together."""
+        removals = []
+        for name in ('a', 'b', 'c'):
+            change = make_change(name, change_type='container_removed', container_id='')
+            del change['container_info']
+            removals.append(change)
+
+        manager.process_changes(removals)
+
+        attachment = slack_notifier.send_batch.call_args[0][0][0]
+        assert attachment['title'] == '🚨 3 containers: removed'
+        names = [line.split(':')[0] for line in attachment['text'].splitlines()]
+        assert names == ['*a*', '*b*', '*c*']
+
+    def test_rate_limit_drops_excess_notifications(self, manager, slack_notifier):
+        """Test that non-critical notifications beyond the token bucket are not sent."""
+        manager.rate_limiter.try_acquire(manager.rate_limiter.capacity - 1)
+
+        manager.process_changes([make_change('web', 'state_change'), make_change('db', 'state_change')])
+
+        assert len(slack_notifier.send_batch.call_args[0][0]) == 1
+
+    def test_rate_limit_never_drops_critical_changes(self, manager, slack_notifier):
+        """Test that critical changes past the burst are still delivered."""
+        count = manager.rate_limiter.capacity + 5
+        manager.process_changes([make_change(f'svc-{i}') for i in range(count)])
+
+        attachment = slack_notifier.send_batch.call_args[0][0][0]
+        assert attachment['title'] == f'🚨 {count} containers: stopped'
+
+    def test_cooldown_applies_only_to_non_critical_changes(self, manager):
+        """Test that critical changes bypass cooldown while state changes respect it."""
+        manager.cooldown_manager.update_cooldown('web')
+
+        assert manager._should_notify(make_change('web')) is True
+        assert manager._should_notify(make_change('web', 'state_change')) is False
+        assert manager._should_notify(make_change('db', 'state_change')) is True
+        assert manager._should_notify(
+            make_change('db', 'state_change', previous_status='running', current_status='running')
+        ) is False
+
+    def test_unknown_change_types_skipped(self, manager, slack_notifier):
+        """Test that change types outside the notifiable set never reach Slack."""
+        manager.process_changes([make_change('web', 'health_status_tick')])
+
+        slack_notifier.send_batch.assert_not_called()
+
+    @patch('docker_monitor.core.notification_manager.threading.Timer')
+    def test_crash_loop_folded_into_summary(self, mock_timer, manager, slack_notifier):
+        """Test that a change repeating within the burst window is summarised once."""
+        for _ in range(BURST_THRESHOLD + 2):
+            manager.process_changes([make_change('web')])
+
+        assert slack_notifier.send_batch.call_count == BURST_THRESHOLD - 1
+        mock_timer.assert_called_once()
+
+        manager.flush_bursts()
+
+        summary = slack_notifier.send_batch.call_args[0][0][0]
+        assert summary['title'] == '[x3] 🚨 Container web STOPPED'
+        assert '3 container_stopped events in 60s' in summary['text']
+        mock_timer.return_value.cancel.assert_called_once()
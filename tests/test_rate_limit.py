@@ -0,0 +1,51 @@
+"""Tests for rate limiting helpers."""
+
+import pytest
+from unittest.mock import patch
+from docker_monitor.utils.rate_limit import TokenBucket
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket class."""
+
+    @patch('docker_monitor.utils.rate_limit.time.monotonic')
+    def test_burst_then_refill(self, mock_monotonic):
+        """Test that the burst is available at once and refills at the rate."""
+        mock_monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=2.0, capacity=3)
+
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+        mock_monotonic.return_value = 100.5
+        assert bucket.try_acquire() is True
+        assert bucket.try_acquire() is False
+
+    @patch('docker_monitor.utils.rate_limit.time.sleep')
+    @patch('docker_monitor.utils.rate_limit.time.monotonic')
+    def test_acquire_sleeps_for_missing_tokens(self, mock_monotonic, mock_sleep):
+        """Test that acquire waits exactly until a token has accrued."""
+        mock_monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=1.0, capacity=1)
+        bucket.try_acquire()
+
+        def advance(seconds):
+            mock_monotonic.return_value += seconds
+
+        mock_sleep.side_effect = advance
+
+        assert bucket.acquire() is True
+        mock_sleep.assert_called_once_with(1.0)
+
+    @patch('docker_monitor.utils.rate_limit.time.monotonic')
+    def test_acquire_timeout(self, mock_monotonic):
+        """Test that acquire gives up when the wait exceeds the timeout."""
+        mock_monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=1.0, capacity=1)
+        bucket.try_acquire()
+
+        assert bucket.acquire(timeout=0.5) is False
+
+    def test_invalid_parameters(self):
+        """Test that non-positive rate or capacity is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, capacity=1)
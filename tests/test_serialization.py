@@ -0,0 +1,31 @@
+"""Tests for JSON serialization helpers."""
+
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from docker_monitor.utils import serialization
+from docker_monitor.utils.serialization import json_dumps, json_loads
+
+
+class TestJsonDumps:
+    """Test cases for json_dumps."""
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_backends_produce_same_bytes(self, use_orjson):
+        """Test that orjson and the stdlib fallback encode identically."""
+        if use_orjson and not serialization.HAS_ORJSON:
+            pytest.skip('orjson not installed')
+        payload = {'title': '🚨 Container web STOPPED', 'ts': 1, 'at': datetime(2024, 1, 1, 12, 0)}
+
+        with patch.object(serialization, 'orjson', serialization.orjson if use_orjson else None):
+            encoded = json_dumps(payload)
+
+        assert isinstance(encoded, bytes)
+        assert encoded == '{"title":"🚨 Container web STOPPED","ts":1,"at":"2024-01-01T12:00:00"}'.encode('utf-8')
+        assert json_loads(encoded)['ts'] == 1
+
+    def test_fallback_rejects_unknown_types(self):
+        """Test that unsupported objects raise TypeError like orjson."""
+        with patch.object(serialization, 'orjson', None):
+            with pytest.raises(TypeError):
+                json_dumps({'value': object()})
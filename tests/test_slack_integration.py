@@ -1,9 +1,10 @@
 """Tests for Slack integration module."""
 
+import json
 import pytest
 from unittest.mock import patch, MagicMock
 import requests
-from docker_monitor.integrations.slack import SlackNotifier
+from docker_monitor.integrations.slack import SlackNotifier, MAX_ATTACHMENTS_PER_MESSAGE
 
 
 class TestSlackNotifier:
@@ -20,7 +21,7 @@ class TestSlackNotifier:
         with pytest.raises(ValueError, match="Slack webhook URL is required"):
             SlackNotifier("")
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_send_container_report_success(self, mock_post):
         """Test successful container report sending."""
         mock_response = MagicMock()
@@ -44,7 +45,7 @@ class TestSlackNotifier:
         mock_post.assert_called_once()
         assert mock_post.call_args[0][0] == "https://hooks.slack.com/services/test"
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_send_container_report_failure(self, mock_post):
         """Test container report sending failure."""
         mock_post.side_effect = requests.RequestException("Network error")
@@ -56,7 +57,7 @@ class TestSlackNotifier:
         
         assert result is False
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_send_error_notification_success(self, mock_post):
         """Test successful error notification sending."""
         mock_response = MagicMock()
@@ -70,7 +71,7 @@ class TestSlackNotifier:
         assert result is True
         mock_post.assert_called_once()
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_send_custom_message_success(self, mock_post):
         """Test successful custom message sending."""
         mock_response = MagicMock()
@@ -128,7 +129,7 @@ class TestSlackNotifier:
         assert "nginx:latest" in result
         assert "healthy" in result
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_test_connection(self, mock_post):
         """Test connection testing."""
         mock_response = MagicMock()
@@ -140,4 +141,53 @@ class TestSlackNotifier:
         result = notifier.test_connection()
         
         assert result is True
-        mock_post.assert_called_once() 
\ No newline at end of file
+        mock_post.assert_called_once() 
+    
+    @patch('requests.Session.post')
+    def test_send_batch_chunks_large_batches(self, mock_post):
+        """Test that batches are split at Slack's attachment limit."""
+        notifier = SlackNotifier("https://hooks.slack.com/services/test")
+        attachments = [{"title": f"change {i}"} for i in range(MAX_ATTACHMENTS_PER_MESSAGE + 1)]
+        
+        result = notifier.send_batch(attachments)
+        
+        assert result is True
+        sizes = [len(json.loads(call.kwargs['data'])['attachments']) for call in mock_post.call_args_list]
+        assert sizes == [MAX_ATTACHMENTS_PER_MESSAGE, 1]
+    
+    @patch('requests.Session.post')
+    def test_send_batch_reports_partial_failure(self, mock_post):
+        """Test that a failed chunk makes the whole batch report failure."""
+        mock_post.side_effect = [MagicMock(), requests.RequestException("Network error")]
+        notifier = SlackNotifier("https://hooks.slack.com/services/test")
+        
+        result = notifier.send_batch([{"title": "x"}] * (MAX_ATTACHMENTS_PER_MESSAGE * 2))
+        
+        assert result is False
+        assert mock_post.call_count == 2
+    
+    def test_session_retries_on_rate_limit(self):
+        """Test that webhook posts share one session with retrying adapter."""
+        notifier = SlackNotifier("https://hooks.slack.com/services/test")
+        
+        retry = notifier._session.get_adapter("https://hooks.slack.com").max_retries
+        
+        assert retry.is_retry('POST', 429)
+        assert not retry.is_retry('POST', 503)
+        assert retry.read == 0
+        notifier.close()
+    
+    @patch('docker_monitor.utils.rate_limit.time')
+    @patch('requests.Session.post')
+    def test_posts_paced_after_burst(self, mock_post, mock_time):
+        """Test that posts beyond the burst wait for the rate limiter."""
+        clock = [0.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        mock_time.sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+        notifier = SlackNotifier("https://hooks.slack.com/services/test", post_rate=1.0, post_burst=2)
+        
+        for i in range(3):
+            assert notifier.send_custom_message("Title", f"message {i}") is True
+        
+        assert mock_post.call_count == 3
+        mock_time.sleep.assert_called_once_with(1.0)
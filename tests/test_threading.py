@@ -13,6 +13,10 @@ def test_threading_improvements():
     config.slack_webhook_url = 'https://hooks.slack.com/test'
     config.include_stopped_containers = True
     config.container_name_filter = None
+    config.container_name_filter_re = None
+    config.docker_max_workers = 32
+    config.cooldown_state_file = None
+    config.realtime_use_polling = False
 
     print('🧪 Testing RealTimeMonitor threading improvements...')
     monitor = RealTimeMonitor(config)